@@ -0,0 +1,150 @@
+"""Asyncio versions of the bulk operations, which share the event loop with other tasks.
+
+The input is read in batches, and the coroutine yields to the event loop
+between batches.  A batch holds at most `batch_size` elements.  Its size
+adapts so that processing it takes about `max_time` seconds of CPU time
+at most: it halves after a slower batch and doubles after a faster one.
+Other tasks are therefore never blocked much longer than `max_time`, even
+when single elements are expensive, while cheap elements are processed
+in large batches at nearly the speed of the synchronous functions.
+
+The input may be an async iterable or a plain iterable.
+
+Examples:
+    >>> import asyncio
+    >>> asyncio.run(async_sum(Fraction(1, n) for n in range(1, 5)))
+    25/12
+    >>> asyncio.run(async_unique(iter("abracadabra")))
+    ['a', 'b', 'r', 'c', 'd']
+"""
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from itertools import islice
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, List, Optional, Tuple, Union
+import asyncio
+import time
+
+from fraction import Fraction, _sum_terms, _terms, _terms_of_sum
+from listutil import Deduplicator
+
+
+async def _batches(values: Union[AsyncIterable, Iterable], batch_size: int, max_time: float) -> AsyncIterator[list]:
+    """Yield lists of consecutive values, pausing for the event loop before each
+       one and sizing them so that reading and processing one takes about
+       `max_time` seconds of CPU time.
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    if max_time <= 0:
+        raise ValueError("max_time must be positive")
+    if isinstance(values, AsyncIterable):
+        iterator, sync_iterator = values.__aiter__(), None
+    else:
+        iterator, sync_iterator = None, iter(values)
+    size = 1
+    start = time.thread_time()
+    while True:
+        if sync_iterator is not None:
+            batch = list(islice(sync_iterator, size))
+        else:
+            batch = []
+            try:
+                while len(batch) < size:
+                    batch.append(await iterator.__anext__())
+            except StopAsyncIteration:
+                pass
+        if not batch:
+            return
+        yield batch
+        # the time since the last pause, including the caller processing the batch
+        elapsed = time.thread_time() - start
+        if elapsed > max_time:
+            size = max(1, size // 2)
+        elif elapsed < max_time / 2:
+            size = min(batch_size, size * 2)
+        await asyncio.sleep(0)
+        start = time.thread_time()
+
+
+async def async_sum(values: Union[AsyncIterable, Iterable], batch_size: int = 10000, max_time: float = 0.01,
+                    executor: Optional[Executor] = None, offload_bits: int = 100000) -> Fraction:
+    """Return the exact sum of `values`, the same as `fraction.fsum`, yielding
+       to the event loop between batches.
+
+       Each batch is summed exactly, and the partial sums are added pairwise
+       like the leaves of a balanced tree, so the operands of each addition
+       stay as small as possible.  A single addition of huge operands still
+       blocks the loop while it runs, unless it is sent to `executor`.
+
+    Args:
+        values: Fractions, ints and floats, from an async or plain iterable
+        batch_size (int): most values summed between two pauses
+        max_time (float): CPU seconds to spend between two pauses, approximately
+        executor: if given, sums with terms longer than `offload_bits` bits are
+            computed in it, e.g. a ProcessPoolExecutor
+        offload_bits (int): bit length above which a sum is sent to `executor`
+    """
+    loop = asyncio.get_running_loop()
+
+    async def add(numerators: List[int], denominators: List[int]) -> Fraction:
+        if executor is not None and max(max(abs(n).bit_length() for n in numerators),
+                                        max(d.bit_length() for d in denominators)) > offload_bits:
+            return Fraction._from_proper(*await loop.run_in_executor(executor, _terms_of_sum, (numerators, denominators)))
+        return _sum_terms(zip(numerators, denominators))
+
+    # partial sums and the number of values in each, with decreasing counts
+    partial: List[Tuple[int, Fraction]] = []
+    async for batch in _batches(values, batch_size, max_time):
+        numerators, denominators = [], []
+        for value in batch:
+            numerator, denominator = _terms(value, '+')
+            numerators.append(numerator)
+            denominators.append(denominator)
+        partial.append((len(batch), await add(numerators, denominators)))
+        while len(partial) > 1 and partial[-2][0] <= partial[-1][0]:
+            (count_b, b), (count_a, a) = partial.pop(), partial.pop()
+            partial.append((count_a + count_b, await add([a.numerator, b.numerator], [a.denominator, b.denominator])))
+            await asyncio.sleep(0)
+    total = Fraction(0)
+    while partial:
+        _, frac = partial.pop()
+        total = await add([frac.numerator, total.numerator], [frac.denominator, total.denominator])
+        await asyncio.sleep(0)
+    return total
+
+
+async def aiter_unique(values: Union[AsyncIterable, Iterable], key: Optional[Callable] = None,
+                       batch_size: int = 10000, max_time: float = 0.01) -> AsyncIterator[list]:
+    """Yield, batch by batch, lists of the first occurrences of the distinct
+       elements of `values`, compared as in `listutil.unique` or by ``key(elem)``.
+       Batches without new elements are skipped.
+
+    Examples:
+        >>> async def batches():
+        ...     return [batch async for batch in aiter_unique([1, 2, 1, 3, 2, 4], batch_size=2)]
+        >>> asyncio.run(batches())
+        [[1], [2], [3], [4]]
+    """
+    dedup = Deduplicator(key=key)
+    async for batch in _batches(values, batch_size, max_time):
+        first = dedup.extend(batch)
+        if first:
+            yield first
+
+
+async def async_unique(values: Union[AsyncIterable, Iterable], key: Optional[Callable] = None,
+                       batch_size: int = 10000, max_time: float = 0.01) -> List:
+    """Return a list of the first occurrence of each distinct element of `values`,
+       like `listutil.unique`, yielding to the event loop between batches.
+    """
+    result = []
+    async for first in aiter_unique(values, key, batch_size, max_time):
+        result.extend(first)
+    return result
+
+
+if __name__ == '__main__':
+    """Run the doctests in all methods."""
+    import doctest
+    doctest.testmod(verbose=True)
@@ -0,0 +1,86 @@
+import asyncio
+import math
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from asyncutil import aiter_unique, async_sum, async_unique
+from fraction import Fraction, fsum
+from fraction_test import FractionAssertions
+from listutil import unique
+
+
+async def stream(values):
+    """An async iterable of `values` that also yields to the event loop."""
+    for value in values:
+        await asyncio.sleep(0)
+        yield value
+
+
+class AsyncSumTest(FractionAssertions, unittest.IsolatedAsyncioTestCase):
+    """Test that async_sum gives the same sum as fsum and lets other tasks run."""
+
+    def values(self):
+        rng = random.Random(17)
+        return [Fraction(rng.randint(-50, 50), rng.randint(1, 50)) for _ in range(3000)] + [2, 0.5]
+
+    async def test_sum(self):
+        values = self.values()
+        self.assertSameFraction(fsum(values), await async_sum(values))
+        self.assertSameFraction(fsum(values), await async_sum(stream(values), batch_size=7))
+        self.assertSameFraction(Fraction(0), await async_sum([]))
+
+    async def test_inf_nan(self):
+        self.assertSameFraction(Fraction(1, 0), await async_sum(self.values() + [math.inf], batch_size=10))
+        self.assertTrue((await async_sum([Fraction(1, 0)] + self.values() + [-math.inf], batch_size=10)).isnan())
+        self.assertTrue((await async_sum([math.nan, 1])).isnan())
+
+    async def test_executor(self):
+        values = self.values()
+        with ThreadPoolExecutor(1) as executor:
+            self.assertSameFraction(fsum(values), await async_sum(values, batch_size=100, executor=executor,
+                                                                  offload_bits=0))
+
+    async def test_yields_to_event_loop(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        await async_sum(self.values(), batch_size=100)
+        task.cancel()
+        self.assertGreaterEqual(ticks, 30)
+
+    async def test_invalid(self):
+        with self.assertRaises(ValueError):
+            await async_sum([1], batch_size=0)
+        with self.assertRaises(ValueError):
+            await async_sum([1], max_time=0)
+        with self.assertRaises(TypeError):
+            await async_sum([1, 'a'])
+
+
+class AsyncUniqueTest(unittest.IsolatedAsyncioTestCase):
+    """Test that async_unique gives the same result as unique across batches."""
+
+    async def test_unique(self):
+        values = [i % 37 for i in range(1000)] + [[1, 2], {'a': 1}, [1, 2], {1, 2}, frozenset({1, 2})]
+        self.assertEqual(unique(values), await async_unique(values, batch_size=16))
+        self.assertEqual(unique(values), await async_unique(stream(values), batch_size=3))
+        self.assertEqual([], await async_unique([]))
+
+    async def test_key(self):
+        self.assertEqual(['a', 'B'], await async_unique(stream(["a", "B", "b", "A"]), key=str.lower))
+
+    async def test_batches(self):
+        batches = [batch async for batch in aiter_unique(stream([1, 1, 1, 1, 2, 1, 3, 3]), batch_size=2)]
+        self.assertEqual([1, 2, 3], [elem for batch in batches for elem in batch])
+        self.assertTrue(all(batches))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,606 @@
+"""Micro benchmarks for the hot paths of `listutil` and `fraction`.
+
+Run every report with ``python benchmark.py``, or only some of them by
+name, e.g. ``python benchmark.py unique``.
+
+The regression cases time single calls and can be compared with a saved
+baseline, failing when a case got slower by more than a threshold::
+
+    python benchmark.py --save baseline.json
+    python benchmark.py --baseline baseline.json --threshold 1.25 --filter unique
+"""
+from typing import Callable, Dict, List, Tuple
+import argparse
+import asyncio
+import decimal
+import fractions
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+
+from asyncutil import async_sum, async_unique
+from fixedfraction import FixedContext
+from fraction import Fraction, bounded_denominators, fdot, format_many, fsum, parse_many, to_proper, to_ratio
+from fractionio import FractionFile, dump, read_column
+from lazyfraction import LazyFraction
+from matrix import solve
+from listutil import Deduplicator, duplicate_positions, unique, unique_by, unique_counts
+from parallel import parallel_sum, parallel_unique
+
+try:
+    from fractionarray import FractionArray
+except ImportError:
+    FractionArray = None
+
+
+def best_of(stmt, number: int = 1, repeat: int = 5) -> float:
+    """Return the best time in seconds of `repeat` runs of `number` calls to `stmt`."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number
+
+
+def bench_unique():
+    """`unique` should scale linearly, so time per element stays flat as n grows."""
+    print(f"{'n':>9} {'ints':>12} {'lists':>12} {'dicts':>12}   (ns per element)")
+    for n in (1000, 10000, 100000, 200000):
+        ints = [i % (n // 2) for i in range(n)]
+        lists = [[i % (n // 2), 'x'] for i in range(n)]
+        dicts = [{'id': i % (n // 2)} for i in range(n)]
+        times = [best_of(lambda lst=lst: unique(lst), repeat=3) / n * 1e9
+                 for lst in (ints, lists, dicts)]
+        print(f"{n:>9} " + " ".join(f"{t:>12.1f}" for t in times))
+
+
+def bench_index(n: int = 1000000):
+    """unique_by, unique_counts and duplicate_positions on 10^6 elements, with unique for reference."""
+    rng = random.Random(0)
+    ints = [rng.randrange(n // 10) for _ in range(n)]
+    lists = [[i, 'x'] for i in ints]
+    print(f"{'':>20} {'ints':>9} {'lists':>9}")
+    for name, func in (('unique', unique), ('unique_by', lambda lst: unique_by(lst, str)),
+                       ('unique_counts', unique_counts), ('duplicate_positions', duplicate_positions)):
+        times = [best_of(lambda: func(lst), repeat=3) for lst in (ints, lists)]
+        print(f"{name:>20} " + ' '.join(f"{t * 1e3:>7.0f}ms" for t in times))
+
+
+def bench_dedup(batches: int = 200, size: int = 1000):
+    """A list growing in batches: `unique` of the whole list after every batch against `Deduplicator.extend`."""
+    rng = random.Random(0)
+    data = [[rng.randrange(batches * size // 4) for _ in range(size)] for _ in range(batches)]
+
+    def rerun():
+        lst = []
+        for batch in data:
+            lst += batch
+            unique(lst)
+
+    def incremental():
+        dedup = Deduplicator()
+        for batch in data:
+            dedup.extend(batch)
+
+    print(f"{'unique each batch':>20} {best_of(rerun, repeat=1) * 1e3:>8.0f} ms")
+    print(f"{'Deduplicator':>20} {best_of(incremental, repeat=3) * 1e3:>8.0f} ms")
+
+
+def bench_init():
+    """Construction throughput of `Fraction` from ints with a common factor, by operand size."""
+    rng = random.Random(0)
+    print(f"{'bits':>9} {'per second':>14}")
+    for bits in (64, 256, 1024, 4096, 16384, 100000):
+        common = rng.getrandbits(bits // 2) | 1
+        pairs = [(rng.getrandbits(bits - bits // 2) * common, -rng.getrandbits(bits - bits // 2) * common)
+                 for _ in range(20)]
+        t = best_of(lambda: [Fraction(n, d) for n, d in pairs], repeat=3) / len(pairs)
+        print(f"{bits:>9} {1 / t:>14,.0f}")
+
+
+def bench_float():
+    """Construction throughput of `Fraction` from floats, by magnitude."""
+    print(f"{'value':>12} {'per second':>14}")
+    for x in (0.875, 5.6, 1e-10, 1e-300, 5e-324, 1.7976931348623157e308):
+        t = best_of(lambda: Fraction(x), number=1000)
+        print(f"{x:>12.4g} {1 / t:>14,.0f}")
+
+
+def bench_ops():
+    """Time per arithmetic operation with Fraction, int and float operands, by operand size."""
+    rng = random.Random(0)
+    operators = {'+': lambda x, y: x + y, '-': lambda x, y: x - y,
+                 '*': lambda x, y: x * y, '/': lambda x, y: x / y}
+    print(f"{'operands':>16} " + " ".join(f"{op:>10}" for op in operators) + "   (us per op)")
+    for bits in (32, 1024, 16384):
+        x = Fraction(rng.getrandbits(bits), rng.getrandbits(bits) | 1)
+        y = Fraction(rng.getrandbits(bits), rng.getrandbits(bits) | 1)
+        for label, other in ((f"{bits}-bit Fraction", y), (f"{bits}-bit int", 7), (f"{bits}-bit float", 0.375)):
+            times = [best_of(lambda: func(x, other), number=200) * 1e6 for func in operators.values()]
+            print(f"{label:>16} " + " ".join(f"{t:>10.2f}" for t in times))
+
+
+def bench_mixed(n: int = 20000):
+    """Mixed-type expressions in a loop, with the Fraction on either side, against `fractions.Fraction`."""
+    rng = random.Random(0)
+    values = [rng.randint(1, 1000) for _ in range(n)]
+    ours = [Fraction(v, 7) for v in values]
+    stdlib = [fractions.Fraction(v, 7) for v in values]
+    expressions = {
+        'int + x': lambda xs: [1 + x for x in xs],
+        'x * int': lambda xs: [x * 3 for x in xs],
+        'float * x': lambda xs: [0.5 * x for x in xs],
+        '1 / x': lambda xs: [1 / x for x in xs],
+        'Decimal + x': lambda xs: [decimal.Decimal('0.25') + x for x in xs],
+        'stdlib + x': lambda xs: [fractions.Fraction(1, 3) + x for x in xs],
+        '2*x*x - 1': lambda xs: [2 * x * x - 1 for x in xs],
+    }
+    print(f"{'expression':>14} {'Fraction':>10} {'fractions':>10}   (us per element)")
+    for label, func in expressions.items():
+        ours_time = best_of(lambda: func(ours), repeat=3) / n * 1e6
+        try:
+            stdlib_time = best_of(lambda: func(stdlib), repeat=3) / n * 1e6
+        except TypeError:
+            # fractions.Fraction does not mix with Decimal
+            stdlib_time = math.nan
+        print(f"{label:>14} {ours_time:>10.2f} {stdlib_time:>10.2f}")
+
+
+def bench_pow():
+    """`Fraction.__pow__` against repeated multiplication, and an iteration exact and in `bounded_denominators`."""
+    rng = random.Random(0)
+    x = Fraction(rng.getrandbits(64), rng.getrandbits(64) | 1)
+
+    def repeated(exponent):
+        result = Fraction(1)
+        for _ in range(exponent):
+            result = result * x
+        return result
+
+    print(f"{'exponent':>10} {'repeated *':>12} {'**':>12}")
+    for exponent in (10, 100, 1000):
+        print(f"{exponent:>10} {best_of(lambda: repeated(exponent), repeat=3) * 1e3:>10.3f}ms "
+              f"{best_of(lambda: x ** exponent, repeat=3) * 1e3:>10.3f}ms")
+
+    def compound(steps):
+        # monthly interest and deposit
+        balance, rate = Fraction(1000), Fraction(2003, 2000)
+        for _ in range(steps):
+            balance = balance * rate + Fraction(100, 3)
+        return balance
+
+    def bounded(steps):
+        with bounded_denominators(64):
+            return compound(steps)
+
+    print(f"{'steps':>10} {'exact':>12} {'64-bit':>12} {'bits':>8}")
+    for steps in (100, 1000, 5000):
+        exact = compound(steps)
+        print(f"{steps:>10} {best_of(lambda: compound(steps), repeat=1) * 1e3:>10.1f}ms "
+              f"{best_of(lambda: bounded(steps), repeat=1) * 1e3:>10.1f}ms {exact.denominator.bit_length():>8}")
+
+
+def bench_array():
+    """Element-wise arithmetic on a FractionArray against a loop over Fractions."""
+    if FractionArray is None:
+        print("skipped, FractionArray needs numpy")
+        return
+    rng = random.Random(0)
+    n = 100000
+    xs = [Fraction(rng.randint(-10**6, 10**6), rng.randint(1, 10**6)) for _ in range(n)]
+    ys = [Fraction(rng.randint(-10**6, 10**6), rng.randint(1, 10**6)) for _ in range(n)]
+    arr_x, arr_y = FractionArray(xs), FractionArray(ys)
+    print(f"{'op':>4} {'Fraction loop':>14} {'FractionArray':>14}   (ns per element)")
+    for op, func in (('+', lambda x, y: x + y), ('*', lambda x, y: x * y), ('<', lambda x, y: x < y)):
+        scalar = best_of(lambda: [func(x, y) for x, y in zip(xs, ys)], repeat=3) / n * 1e9
+        vector = best_of(lambda: func(arr_x, arr_y), repeat=3) / n * 1e9
+        print(f"{op:>4} {scalar:>14.1f} {vector:>14.1f}")
+
+
+def bench_sum():
+    """`fsum` against adding one Fraction at a time, for shared and random denominators."""
+    rng = random.Random(0)
+    n = 20000
+    print(f"{'denominators':>14} {'sum with +':>12} {'fsum':>12}   (ms)")
+    for label, denominators in (('100, 10000', [100, 10000]), ('random 30-bit', None)):
+        values = [Fraction(rng.randint(-10**9, 10**9),
+                           rng.choice(denominators) if denominators else rng.getrandbits(30) + 1)
+                  for _ in range(n)]
+
+        def add_all():
+            total = Fraction(0)
+            for value in values:
+                total = total + value
+            return total
+
+        repeat = 3 if denominators else 1
+        print(f"{label:>14} {best_of(add_all, repeat=repeat) * 1e3:>12.1f} "
+              f"{best_of(lambda: fsum(values), repeat=repeat) * 1e3:>12.1f}")
+
+
+def bench_parallel_sum():
+    """`parallel_sum` of fractions with random denominators, from 1 worker up to the number of CPUs."""
+    rng = random.Random(0)
+    values = [Fraction(rng.randint(-10**9, 10**9), rng.getrandbits(24) + 1) for _ in range(40000)]
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+    serial = None
+    for processes in sorted({1, 2, 4, os.cpu_count() or 1}):
+        t = best_of(lambda: parallel_sum(values, processes=processes, chunksize=2500), repeat=1)
+        serial = serial or t
+        print(f"{processes:>8} {t:>10.2f} {serial / t:>8.2f}")
+
+
+def bench_parallel_unique(n: int = 2000000):
+    """`parallel_unique` of `n` strings with 10% distinct, against `unique`, from 1 worker up to the number of CPUs."""
+    rng = random.Random(0)
+    lst = [str(rng.randrange(n // 10)) for _ in range(n)]
+    serial = best_of(lambda: unique(lst), repeat=1)
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+    print(f"{'unique':>8} {serial:>10.2f} {1:>8.2f}")
+    for processes in sorted({2, 4, os.cpu_count() or 1} - {1}):
+        t = best_of(lambda: parallel_unique(lst, processes=processes), repeat=1)
+        print(f"{processes:>8} {t:>10.2f} {serial / t:>8.2f}")
+
+
+def bench_sort(n: int = 1000000):
+    """Sorting `n` random fractions, against the standard library `fractions.Fraction`."""
+    rng = random.Random(0)
+    terms = [(rng.randint(-10**9, 10**9), rng.randint(1, 10**9)) for _ in range(n)]
+    ours = [Fraction(*t) for t in terms]
+    stdlib = [fractions.Fraction(*t) for t in terms]
+    print(f"{'sorted(Fraction)':>34} {best_of(lambda: sorted(ours), repeat=1):>8.2f} s")
+    print(f"{'sorted(Fraction, key=sort_key)':>34} "
+          f"{best_of(lambda: sorted(ours, key=Fraction.sort_key), repeat=1):>8.2f} s")
+    print(f"{'sorted(fractions.Fraction)':>34} {best_of(lambda: sorted(stdlib), repeat=1):>8.2f} s")
+
+
+def bench_lazy():
+    """The expression a*b + c/d - e evaluated with Fraction and with LazyFraction, observed once."""
+    rng = random.Random(0)
+    rows = [[Fraction(rng.getrandbits(64), rng.getrandbits(64) | 1) for _ in range(5)] for _ in range(2000)]
+    lazy_rows = [[LazyFraction(f) for f in row] for row in rows]
+
+    def evaluate(rows):
+        return [repr(a * b + c / d - e) for a, b, c, d, e in rows]
+
+    print(f"{'Fraction':>14} {best_of(lambda: evaluate(rows), repeat=3) * 1e3:>8.1f} ms")
+    print(f"{'LazyFraction':>14} {best_of(lambda: evaluate(lazy_rows), repeat=3) * 1e3:>8.1f} ms")
+
+
+def bench_io(n: int = 200000):
+    """Writing and reading `n` fractions as binary records compared with "n/d" text lines."""
+    import tempfile
+    rng = random.Random(0)
+    values = [Fraction(rng.getrandbits(40) - 2**39, rng.getrandbits(40) | 1) for _ in range(n)]
+    directory = tempfile.mkdtemp()
+    text_path, binary_path = os.path.join(directory, 'fractions.txt'), os.path.join(directory, 'fractions.bin')
+
+    def write_text():
+        with open(text_path, 'w') as f:
+            f.writelines(f"{value!r}\n" for value in values)
+
+    def read_text():
+        with open(text_path) as f:
+            return [Fraction(*map(int, line.split('/'))) for line in f]
+
+    def read_binary():
+        with FractionFile(binary_path) as fractions:
+            return list(fractions)
+
+    def random_access():
+        with FractionFile(binary_path) as fractions:
+            return [fractions[i] for i in range(0, n, n // 1000)]
+
+    print(f"{'':>14} {'write':>9} {'read':>9} {'MB':>6}")
+    for name, write, read, path in (('text', write_text, read_text, text_path),
+                                    ('binary', lambda: dump(values, binary_path), read_binary, binary_path)):
+        write_time = best_of(write, repeat=3)
+        read_time = best_of(read, repeat=3)
+        print(f"{name:>14} {write_time * 1e3:>7.0f}ms {read_time * 1e3:>7.0f}ms {os.path.getsize(path) / 1e6:>6.1f}")
+    print(f"{'1000 lookups':>14} {best_of(random_access) * 1e3:>17.2f}ms")
+    for path in (text_path, binary_path):
+        os.remove(path)
+    os.rmdir(directory)
+
+
+def bench_parse(n: int = 100000):
+    """Rows per second parsing a CSV column of "n/d" fractions and of decimals."""
+    import io
+    rng = random.Random(0)
+    columns = {
+        'n/d': [repr(Fraction(rng.getrandbits(40) - 2**39, rng.getrandbits(40) | 1)) for _ in range(n)],
+        'decimal': [f"{rng.getrandbits(40) - 2**39}.{rng.getrandbits(20):06d}" for _ in range(n)],
+    }
+    print(f"{'':>9} {'parse_many':>12} {'read_column':>12} {'packed':>12} {'fractions':>12}   (rows per second)")
+    for name, strings in columns.items():
+        csv_text = '\n'.join(f"{i},{s}" for i, s in enumerate(strings))
+        timings = [
+            best_of(lambda: parse_many(strings), repeat=3),
+            best_of(lambda: read_column(io.StringIO(csv_text), 1), repeat=3),
+            best_of(lambda: FractionArray.from_strings(strings), repeat=3) if FractionArray else math.nan,
+            best_of(lambda: [fractions.Fraction(s) for s in strings], repeat=3),
+        ]
+        print(f"{name:>9} " + ' '.join(f"{n / t:>12,.0f}" for t in timings))
+
+
+def bench_export(n: int = 100000):
+    """Rows per second writing a CSV of an id and a fraction column, by how the fractions are rendered."""
+    import csv
+    import io
+    rng = random.Random(0)
+    values = [Fraction(rng.getrandbits(40) - 2**39, rng.getrandbits(20) | 1) for _ in range(n)]
+
+    def write_rows(render):
+        out = io.StringIO()
+        csv.writer(out).writerows((i, render(value)) for i, value in enumerate(values))
+        return out
+
+    def bulk():
+        # the same rows, the fractions rendered in one call
+        out = io.StringIO()
+        column = format_many(values, '.6f').splitlines()
+        csv.writer(out).writerows(enumerate(column))
+        return out
+
+    timings = {
+        'str': best_of(lambda: write_rows(str), repeat=3),
+        'float (lossy)': best_of(lambda: write_rows(float), repeat=3),
+        "format '.6f'": best_of(lambda: write_rows(lambda value: format(value, '.6f')), repeat=3),
+        "format_many '.6f'": best_of(bulk, repeat=3),
+        "format_many column": best_of(lambda: format_many(values, '.6f', io.StringIO()), repeat=3),
+    }
+    for label, t in timings.items():
+        print(f"{label:>20} {n / t:>12,.0f} rows per second")
+
+
+async def _with_latency(coroutine) -> Tuple[float, float]:
+    """Run `coroutine` next to a task counting event loop turns, return the
+       elapsed time and the longest time the loop was blocked.
+    """
+    gaps = []
+    done = False
+
+    async def ticker():
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    task = asyncio.ensure_future(ticker())
+    start = time.perf_counter()
+    await coroutine
+    elapsed = time.perf_counter() - start
+    done = True
+    await task
+    return elapsed, max(gaps)
+
+
+def bench_async():
+    """async_sum and async_unique compared with fsum and unique: total time and worst event loop latency."""
+    rng = random.Random(0)
+    small = [Fraction(rng.randint(-100, 100), rng.randint(1, 100)) for _ in range(200000)]
+    big = [Fraction(rng.getrandbits(2000), rng.getrandbits(2000) | 1) for _ in range(100)]
+    ints = [rng.randrange(100000) for _ in range(1000000)]
+    print(f"{'':>12} {'sync':>9} {'async':>9} {'latency':>9}")
+    for name, sync, coroutine in (('small sum', lambda: fsum(small), lambda: async_sum(small)),
+                                  ('big sum', lambda: fsum(big), lambda: async_sum(big)),
+                                  ('unique', lambda: unique(ints), lambda: async_unique(ints))):
+        elapsed, latency = asyncio.run(_with_latency(coroutine()))
+        print(f"{name:>12} {best_of(sync, repeat=1) * 1e3:>7.0f}ms {elapsed * 1e3:>7.0f}ms {latency * 1e3:>7.1f}ms")
+
+
+def bench_ledger(n: int = 100000):
+    """A ledger of `n` amounts in cents: running balance, and a 1.5% fee on each amount,
+       with Fraction and with FixedFraction in a cents context.
+    """
+    rng = random.Random(0)
+    amounts = [Fraction(rng.randint(-10**7, 10**7), 100) for _ in range(n)]
+    cents = FixedContext(100)
+    fixed_amounts = [cents(amount) for amount in amounts]
+    fee = Fraction(15, 1000)
+
+    def balances(amounts, zero):
+        balance = zero
+        for amount in amounts:
+            balance = balance + amount
+        return balance
+
+    def fees(amounts):
+        return [amount * fee for amount in amounts]
+
+    print(f"{'':>14} {'balance':>9} {'fees':>9}")
+    for name, values, zero in (('Fraction', amounts, Fraction(0)), ('FixedFraction', fixed_amounts, cents(0))):
+        print(f"{name:>14} {best_of(lambda: balances(values, zero), repeat=3) * 1e3:>7.0f}ms "
+              f"{best_of(lambda: fees(values), repeat=3) * 1e3:>7.0f}ms")
+
+
+def _naive_solve(matrix, b):
+    """Gauss-Jordan elimination with Fraction operations, normalizing after every step."""
+    rows = [[Fraction(0) + x for x in row] + [Fraction(0) + y] for row, y in zip(matrix, b)]
+    n = len(rows)
+    for k in range(n):
+        pivot = next(i for i in range(k, n) if rows[i][k] != 0)
+        rows[k], rows[pivot] = rows[pivot], rows[k]
+        rows[k] = [x / rows[k][k] for x in rows[k]]
+        for i in range(n):
+            if i != k:
+                factor = rows[i][k]
+                rows[i] = [x - factor * y for x, y in zip(rows[i], rows[k])]
+    return [row[n] for row in rows]
+
+
+def bench_matrix():
+    """Solving n x n systems with random fraction entries: Fraction elimination against `matrix.solve`."""
+    rng = random.Random(0)
+    print(f"{'n':>5} {'naive':>10} {'Bareiss':>10}")
+    for n in (10, 20, 40, 80):
+        matrix = [[Fraction(rng.randint(-99, 99), rng.randint(1, 99)) for _ in range(n)] for _ in range(n)]
+        b = [fdot(row, range(n)) for row in matrix]
+        naive = best_of(lambda: _naive_solve(matrix, b), repeat=1) if n <= 40 else math.nan
+        print(f"{n:>5} {naive:>9.3f}s {best_of(lambda: solve(matrix, b), repeat=1):>9.3f}s")
+
+
+def bytes_per_instance(factory, n: int = 100000) -> float:
+    """Return the memory allocated per object by `n` calls to `factory`, measured with tracemalloc."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # don't count the list holding the objects
+    return (after - before - sys.getsizeof(objects)) / n
+
+
+def bench_memory():
+    """Memory per `Fraction` compared with a class storing the same attributes in a __dict__."""
+    class DictFraction:
+        def __init__(self, numerator, denominator):
+            self.numerator = numerator
+            self.denominator = denominator
+
+    # small ints are cached by the interpreter and cost nothing extra
+    slotted = bytes_per_instance(lambda i: Fraction(i % 200, 7))
+    with_dict = bytes_per_instance(lambda i: DictFraction(i % 200, 7))
+    print(f"{'__dict__':>10} {with_dict:>8.1f} bytes per instance")
+    print(f"{'__slots__':>10} {slotted:>8.1f} bytes per instance")
+
+
+BENCHMARKS = {
+    'unique': bench_unique,
+    'index': bench_index,
+    'dedup': bench_dedup,
+    'init': bench_init,
+    'float': bench_float,
+    'memory': bench_memory,
+    'ops': bench_ops,
+    'pow': bench_pow,
+    'mixed': bench_mixed,
+    'array': bench_array,
+    'sum': bench_sum,
+    'parallel_sum': bench_parallel_sum,
+    'parallel_unique': bench_parallel_unique,
+    'sort': bench_sort,
+    'lazy': bench_lazy,
+    'io': bench_io,
+    'parse': bench_parse,
+    'export': bench_export,
+    'async': bench_async,
+    'ledger': bench_ledger,
+    'matrix': bench_matrix,
+}
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    """Return the regression cases by name, each a call to time."""
+    rng = random.Random(0)
+    found = {}
+    for bits in (64, 1024, 16384):
+        common = rng.getrandbits(bits // 2) | 1
+        n, d = rng.getrandbits(bits // 2) * common, rng.getrandbits(bits // 2) * common + common
+        found[f'to_proper/{bits}bit'] = lambda n=n, d=d: to_proper(n, d)
+        found[f'init/int/{bits}bit'] = lambda n=n, d=d: Fraction(n, d)
+    for label, x in (('small', 0.875), ('tiny', 1e-300)):
+        found[f'to_ratio/{label}'] = lambda x=x: to_ratio(x)
+    found['init/float'] = lambda: Fraction(2.4, -3.6)
+    found['init/mixed'] = lambda: Fraction(3, 0.75)
+    operators = {'add': lambda x, y: x + y, 'sub': lambda x, y: x - y,
+                 'mul': lambda x, y: x * y, 'div': lambda x, y: x / y,
+                 'lt': lambda x, y: x < y, 'le': lambda x, y: x <= y, 'eq': lambda x, y: x == y}
+    for bits in (64, 1024):
+        x = Fraction(rng.getrandbits(bits), rng.getrandbits(bits) | 1)
+        y = Fraction(rng.getrandbits(bits), rng.getrandbits(bits) | 1)
+        for name, func in operators.items():
+            for kind, other in (('fraction', y), ('int', 7), ('float', 0.375)):
+                found[f'{name}/{kind}/{bits}bit'] = lambda func=func, other=other, x=x: func(x, other)
+                if kind != 'fraction':
+                    found[f'r{name}/{kind}/{bits}bit'] = lambda func=func, other=other, x=x: func(other, x)
+    for n in (1000, 100000):
+        for duplicates in (0.1, 0.5, 0.9):
+            distinct = max(1, int(n * (1 - duplicates)))
+            ints = [rng.randrange(distinct) for _ in range(n)]
+            lists = [[i] for i in ints]
+            found[f'unique/ints/{n}/dup{duplicates}'] = lambda lst=ints: unique(lst)
+            found[f'unique/lists/{n}/dup{duplicates}'] = lambda lst=lists: unique(lst)
+    return found
+
+
+def measure(func: Callable[[], object], min_time: float = 0.02, repeat: int = 3) -> float:
+    """Return the best time in seconds of one call to `func`, over `repeat` runs of at least `min_time`."""
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 10
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_cases(pattern: str = '') -> Dict[str, float]:
+    """Return the time per call of every regression case whose name contains `pattern`."""
+    return {name: measure(func) for name, func in cases().items() if pattern in name}
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float) -> List[Tuple[str, float, float]]:
+    """Return (name, baseline time, new time) of the cases more than `threshold` times slower than the baseline.
+       Cases missing from either side are ignored.
+
+    Examples:
+        >>> compare({'a': 3.0, 'b': 1.0, 'c': 5.0}, {'a': 2.0, 'b': 1.0}, 1.25)
+        [('a', 2.0, 3.0)]
+    """
+    return [(name, baseline[name], time) for name, time in results.items()
+            if name in baseline and time > baseline[name] * threshold]
+
+
+def save(results: Dict[str, float], path: str):
+    """Write `results` to `path` as JSON, with the Python version that produced them."""
+    with open(path, 'w') as f:
+        json.dump({'python': platform.python_version(), 'results': results}, f, indent=2, sort_keys=True)
+
+
+def load(path: str) -> Dict[str, float]:
+    """Return the results saved in `path` by `save`."""
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def main(argv: List[str]) -> int:
+    """Run the benchmarks from the command line, return the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('reports', nargs='*', help=f"reports to run, from {', '.join(BENCHMARKS)}")
+    parser.add_argument('--cases', action='store_true', help="run the regression cases instead of the reports")
+    parser.add_argument('--filter', default='', help="only run the cases with this in their name")
+    parser.add_argument('--save', metavar='FILE', help="save the case results as JSON")
+    parser.add_argument('--baseline', metavar='FILE', help="compare the case results with this saved JSON")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="fail if a case is this many times slower than the baseline (default 1.25)")
+    args = parser.parse_args(argv)
+    # not argparse choices, which reject an empty list of reports before Python 3.12
+    for name in args.reports:
+        if name not in BENCHMARKS:
+            parser.error(f"argument reports: invalid choice: {name!r} (choose from {', '.join(BENCHMARKS)})")
+
+    if not (args.cases or args.save or args.baseline):
+        for name in args.reports or BENCHMARKS:
+            print(f"== {name} ==")
+            BENCHMARKS[name]()
+        return 0
+
+    results = run_cases(args.filter)
+    baseline = load(args.baseline) if args.baseline else {}
+    for name, time in results.items():
+        change = f"{time / baseline[name]:>7.2f}x" if name in baseline else ''
+        print(f"{name:<32} {time * 1e6:>12.3f} us {change}")
+    if args.save:
+        save(results, args.save)
+    regressions = compare(results, baseline, args.threshold)
+    for name, old, new in regressions:
+        print(f"REGRESSION {name}: {old * 1e6:.3f} us -> {new * 1e6:.3f} us")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,51 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+import benchmark
+
+
+class BenchmarkTest(unittest.TestCase):
+    """Test the regression harness of the benchmarks."""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_cases_run(self):
+        for name, func in benchmark.cases().items():
+            if '100000' not in name:
+                func()
+
+    def test_save_load(self):
+        benchmark.save({'a': 0.5}, self.path)
+        self.assertEqual({'a': 0.5}, benchmark.load(self.path))
+
+    def test_compare(self):
+        self.assertListEqual([], benchmark.compare({'a': 1.2}, {'a': 1.0}, 1.25))
+        self.assertListEqual([('a', 1.0, 1.3)], benchmark.compare({'a': 1.3}, {'a': 1.0}, 1.25))
+        self.assertListEqual([], benchmark.compare({'new': 1.0}, {'old': 1.0}, 1.25))
+
+    def test_main_fails_on_regression(self):
+        with open(self.path, 'w') as f:
+            json.dump({'results': {'to_ratio/small': 1e-12}}, f)
+        self.assertEqual(1, benchmark.main(['--baseline', self.path, '--filter', 'to_ratio/small']))
+        with open(self.path, 'w') as f:
+            json.dump({'results': {'to_ratio/small': 1.0}}, f)
+        self.assertEqual(0, benchmark.main(['--baseline', self.path, '--filter', 'to_ratio/small']))
+
+    def test_main_rejects_unknown_report(self):
+        with contextlib.redirect_stderr(io.StringIO()) as stderr, self.assertRaises(SystemExit) as raised:
+            benchmark.main(['unique', 'nonsense'])
+        self.assertEqual(2, raised.exception.code)
+        self.assertIn("invalid choice: 'nonsense'", stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
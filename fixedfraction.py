@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+from decimal import (ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP,
+                     ROUND_UP)
+from typing import Tuple, Union
+
+import fraction
+from fraction import Fraction, _comparable, to_proper
+
+ROUNDINGS = (ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP)
+
+
+def round_div(numerator: int, denominator: int, rounding: str = ROUND_HALF_EVEN) -> int:
+    """Return `numerator` / `denominator` rounded to an int by `rounding`, one of
+       the rounding modes of the `decimal` module.  `denominator` must be positive.
+
+    Examples:
+        >>> round_div(5, 2), round_div(7, 2), round_div(-5, 2)
+        (2, 4, -2)
+        >>> round_div(5, 2, ROUND_HALF_UP), round_div(-5, 2, ROUND_HALF_UP)
+        (3, -3)
+        >>> round_div(-1, 3, ROUND_DOWN), round_div(-1, 3, ROUND_FLOOR)
+        (0, -1)
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    if remainder == 0 or rounding == ROUND_FLOOR:
+        return quotient
+    if rounding == ROUND_CEILING:
+        return quotient + 1
+    # the quotient is negative exactly when the numerator is
+    if rounding == ROUND_DOWN:
+        return quotient if quotient >= 0 else quotient + 1
+    if rounding == ROUND_UP:
+        return quotient + 1 if quotient >= 0 else quotient
+    twice = 2 * remainder
+    if twice < denominator:
+        return quotient
+    if twice > denominator:
+        return quotient + 1
+    if rounding == ROUND_HALF_EVEN:
+        return quotient + (quotient & 1)
+    if rounding == ROUND_HALF_UP:
+        return quotient + 1 if quotient >= 0 else quotient
+    if rounding == ROUND_HALF_DOWN:
+        return quotient if quotient >= 0 else quotient + 1
+    raise ValueError(f"unsupported rounding {rounding!r}")
+
+
+class FixedContext:
+    """The shared denominator and rounding policy of a set of `FixedFraction` values.
+
+    Calling a context converts a value into it.
+
+    Examples:
+        >>> cents = FixedContext(100)
+        >>> cents(Fraction(1, 3))
+        33/100
+        >>> cents(19.99) + cents(0.01)
+        20
+    """
+
+    __slots__ = ('denominator', 'rounding')
+
+    def __init__(self, denominator: int = 100, rounding: str = ROUND_HALF_EVEN):
+        if not isinstance(denominator, int) or denominator <= 0:
+            raise ValueError("denominator must be a positive int")
+        if rounding not in ROUNDINGS:
+            raise ValueError(f"unsupported rounding {rounding!r}")
+        self.denominator = denominator
+        self.rounding = rounding
+
+    def __call__(self, value) -> FixedFraction:
+        return FixedFraction(value, self)
+
+    def __repr__(self):
+        return f"FixedContext({self.denominator}, {self.rounding!r})"
+
+
+class FixedFraction:
+    """A fraction stored as an integer multiple of the denominator of its context.
+
+    Adding and subtracting values of the same context is a single integer
+    operation, without the gcd `Fraction` computes after every operation.
+    Multiplying and dividing round the exact result to the context by its
+    rounding policy; multiplying or dividing by an int, or adding a value
+    whose denominator divides the context's, is exact.  Converting to a
+    Fraction is always exact, and so is converting from a Fraction whose
+    denominator divides the context's; other values are rounded.  The
+    infinities (1/0 and -1/0) and NaN (0/0) are kept as in Fraction.
+
+    The result of an operation is in the context of the left operand, or
+    of the FixedFraction operand.
+
+    Examples:
+        >>> cents = FixedContext(100)
+        >>> price = cents(Fraction(1999, 100))
+        >>> price * 3, price / 3, price * Fraction(1, 0)
+        (5997/100, 333/50, 1/0)
+        >>> price.scaled
+        1999
+    """
+
+    __slots__ = ('_scaled', 'context')
+
+    def __init__(self, value: Union[int, float, Fraction, FixedFraction], context: FixedContext):
+        """Initialize a new fixed fraction of the value of an int, float,
+           Fraction or FixedFraction, rounded to `context`.
+        """
+        terms = self._terms(value)
+        if terms is None:
+            raise TypeError(f"value must be a number like 'int', 'float', 'Fraction' or 'FixedFraction', "
+                            f"not '{type(value).__name__}'")
+        self.context = context
+        self._scaled = self._rescale(*terms)
+
+    @classmethod
+    def _from_scaled(cls, scaled: Union[int, Fraction], context: FixedContext) -> FixedFraction:
+        """Return a fixed fraction from its scaled int, or from inf or nan as a Fraction."""
+        fixed = object.__new__(cls)
+        fixed._scaled = scaled
+        fixed.context = context
+        return fixed
+
+    def _rescale(self, numerator: int, denominator: int) -> Union[int, Fraction]:
+        """Return numerator/denominator as a scaled int of this context, or a Fraction if it is inf or nan."""
+        if denominator == 0:
+            return Fraction._from_proper(*to_proper(numerator, denominator))
+        scale = self.context.denominator
+        if scale % denominator == 0:
+            return numerator * (scale // denominator)
+        return round_div(numerator * scale, denominator, self.context.rounding)
+
+    @staticmethod
+    def _terms(other) -> Union[Tuple[int, int], None]:
+        """Return a numerator and a non-negative denominator of an operand, or None if it is not a number.
+           Operands other than FixedFraction are those Fraction takes.
+        """
+        if isinstance(other, FixedFraction):
+            scaled = other._scaled
+            if scaled.__class__ is int:
+                return scaled, other.context.denominator
+            return scaled._numerator, scaled._denominator
+        return fraction._coerce(other)
+
+    @property
+    def scaled(self) -> int:
+        """The value times the context denominator.
+
+        Raises:
+            ValueError: if the value is inf or nan
+        """
+        if self._scaled.__class__ is not int:
+            raise ValueError(f"{self._scaled} has no scaled value")
+        return self._scaled
+
+    def to_fraction(self) -> Fraction:
+        """Return the exact value as a Fraction."""
+        if self._scaled.__class__ is int:
+            return Fraction._from_proper(*to_proper(self._scaled, self.context.denominator))
+        return self._scaled
+
+    def _special(self, result: Fraction) -> FixedFraction:
+        """Return the result of an operation computed with Fractions, in this context."""
+        return FixedFraction._from_scaled(self._rescale(result.numerator, result.denominator), self.context)
+
+    def __add__(self, other: Union[int, float, Fraction, FixedFraction]) -> FixedFraction:
+        if other.__class__ is FixedFraction and other.context is self.context:
+            a, b = self._scaled, other._scaled
+            if a.__class__ is int and b.__class__ is int:
+                return FixedFraction._from_scaled(a + b, self.context)
+        terms = self._terms(other)
+        if terms is None:
+            return NotImplemented
+        return self._add(*terms)
+
+    def _add(self, numerator: int, denominator: int) -> FixedFraction:
+        if self._scaled.__class__ is int and denominator:
+            return FixedFraction._from_scaled(self._scaled + self._rescale(numerator, denominator), self.context)
+        return self._special(self.to_fraction() + Fraction._from_proper(*to_proper(numerator, denominator)))
+
+    def __radd__(self, other: Union[int, float, Fraction]) -> FixedFraction:
+        return self + other
+
+    def __sub__(self, other: Union[int, float, Fraction, FixedFraction]) -> FixedFraction:
+        if other.__class__ is FixedFraction and other.context is self.context:
+            a, b = self._scaled, other._scaled
+            if a.__class__ is int and b.__class__ is int:
+                return FixedFraction._from_scaled(a - b, self.context)
+        terms = self._terms(other)
+        if terms is None:
+            return NotImplemented
+        return self._add(-terms[0], terms[1])
+
+    def __rsub__(self, other: Union[int, float, Fraction]) -> FixedFraction:
+        return -self + other
+
+    def __mul__(self, other: Union[int, float, Fraction, FixedFraction]) -> FixedFraction:
+        terms = self._terms(other)
+        if terms is None:
+            return NotImplemented
+        numerator, denominator = terms
+        a = self._scaled
+        if a.__class__ is int and denominator:
+            if denominator == 1:
+                return FixedFraction._from_scaled(a * numerator, self.context)
+            return FixedFraction._from_scaled(round_div(a * numerator, denominator, self.context.rounding),
+                                              self.context)
+        return self._special(self.to_fraction() * Fraction._from_proper(*to_proper(numerator, denominator)))
+
+    def __rmul__(self, other: Union[int, float, Fraction]) -> FixedFraction:
+        return self * other
+
+    def __truediv__(self, other: Union[int, float, Fraction, FixedFraction]) -> FixedFraction:
+        terms = self._terms(other)
+        if terms is None:
+            return NotImplemented
+        numerator, denominator = terms
+        a = self._scaled
+        if a.__class__ is int and denominator and numerator:
+            if numerator < 0:
+                a, numerator = -a, -numerator
+            return FixedFraction._from_scaled(round_div(a * denominator, numerator, self.context.rounding),
+                                              self.context)
+        return self._special(self.to_fraction() / Fraction._from_proper(*to_proper(numerator, denominator)))
+
+    def __rtruediv__(self, other: Union[int, float, Fraction]) -> FixedFraction:
+        terms = self._terms(other)
+        if terms is None:
+            return NotImplemented
+        numerator, denominator = terms
+        a, scale = self._scaled, self.context.denominator
+        if a.__class__ is int and denominator and a:
+            # other / (a/scale), times scale
+            numerator, denominator = numerator * scale * scale, denominator * a
+            if denominator < 0:
+                numerator, denominator = -numerator, -denominator
+            return FixedFraction._from_scaled(round_div(numerator, denominator, self.context.rounding),
+                                              self.context)
+        return self._special(Fraction._from_proper(*to_proper(numerator, denominator)) / self.to_fraction())
+
+    def __neg__(self):
+        return FixedFraction._from_scaled(-self._scaled, self.context)
+
+    def __eq__(self, other):
+        if other.__class__ is FixedFraction and other.context is self.context and self._scaled.__class__ is int:
+            return self._scaled == other._scaled
+        return self.to_fraction() == _comparable(other)
+
+    def __lt__(self, other):
+        if other.__class__ is FixedFraction and other.context is self.context and self._scaled.__class__ is int \
+                and other._scaled.__class__ is int:
+            return self._scaled < other._scaled
+        return self.to_fraction() < _comparable(other)
+
+    def __le__(self, other):
+        return self < other or self == other
+
+    def __gt__(self, other):
+        if other.__class__ is FixedFraction and other.context is self.context and self._scaled.__class__ is int \
+                and other._scaled.__class__ is int:
+            return self._scaled > other._scaled
+        return self.to_fraction() > _comparable(other)
+
+    def __ge__(self, other):
+        return self > other or self == other
+
+    def __hash__(self):
+        return hash(self.to_fraction())
+
+    def __float__(self):
+        return float(self.to_fraction())
+
+    def __bool__(self):
+        """Zero is false and NaN is true, as with Fraction."""
+        return bool(self._scaled)
+
+    def __repr__(self):
+        return repr(self.to_fraction())
+
+    def __str__(self):
+        return self.__repr__()
+
+    def is_infinite(self):
+        """Returns True if limit of the fraction tends to infinity."""
+        return self.to_fraction().is_infinite()
+
+    def isnan(self):
+        """ Return True if fraction is a NaN (not a number), and False otherwise."""
+        return self.to_fraction().isnan()
+
+
+if __name__ == '__main__':
+    """Run the doctests in all methods."""
+    import doctest
+    doctest.testmod(verbose=True)
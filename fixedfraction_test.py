@@ -0,0 +1,142 @@
+import decimal
+import fractions
+import math
+import random
+import unittest
+
+from fixedfraction import (ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP,
+                           ROUND_UP, ROUNDINGS, FixedContext, FixedFraction, round_div)
+from fraction import Fraction
+from fraction_test import FractionAssertions
+
+
+class FixedFractionTest(FractionAssertions, unittest.TestCase):
+    """Test that FixedFraction arithmetic matches Fraction, rounded to the context."""
+
+    def setUp(self):
+        self.cents = FixedContext(100)
+        rng = random.Random(21)
+        self.values = [Fraction(rng.randint(-10**6, 10**6), 100) for _ in range(50)] + [Fraction(0)]
+
+    def assertSameFraction(self, expected, actual):
+        self.assertIsInstance(actual, FixedFraction)
+        super().assertSameFraction(expected, actual.to_fraction())
+
+    def test_round_div(self):
+        # same as quantizing the exact quotient with decimal
+        for numerator in range(-25, 26):
+            for rounding in ROUNDINGS:
+                expected = (decimal.Decimal(numerator) / 10).quantize(decimal.Decimal(1), rounding=rounding)
+                self.assertEqual(int(expected), round_div(numerator, 10, rounding), (numerator, rounding))
+        self.assertEqual(2, round_div(5, 2))
+        self.assertEqual(-3, round_div(-5, 2, ROUND_HALF_UP))
+        self.assertEqual(-2, round_div(-5, 2, ROUND_HALF_DOWN))
+        self.assertEqual(1, round_div(1, 3, ROUND_CEILING))
+        self.assertEqual(-1, round_div(-1, 3, ROUND_UP))
+        self.assertEqual(0, round_div(-1, 3, ROUND_DOWN))
+        self.assertEqual(-1, round_div(-1, 3, ROUND_FLOOR))
+        self.assertEqual(10**30, round_div(10**32 + 49, 100, ROUND_HALF_EVEN))
+
+    def test_context(self):
+        with self.assertRaises(ValueError):
+            FixedContext(0)
+        with self.assertRaises(ValueError):
+            FixedContext(100, 'ROUND_SOMETIMES')
+        self.assertIsInstance(self.cents(1), FixedFraction)
+        self.assertEqual("FixedContext(100, 'ROUND_HALF_EVEN')", repr(self.cents))
+
+    def test_conversion(self):
+        for value in self.values:
+            fixed = self.cents(value)
+            self.assertSameFraction(value, fixed)
+            self.assertEqual(value.numerator * 100 // value.denominator, fixed.scaled)
+        self.assertSameFraction(Fraction(33, 100), self.cents(Fraction(1, 3)))
+        self.assertSameFraction(Fraction(-67, 100), FixedFraction(Fraction(-2, 3), self.cents))
+        self.assertSameFraction(Fraction(-66, 100), FixedFraction(Fraction(-2, 3), FixedContext(100, ROUND_DOWN)))
+        self.assertSameFraction(Fraction(1999, 100), self.cents(19.99))
+        self.assertSameFraction(Fraction(5), self.cents(5))
+        mills = FixedContext(1000)
+        self.assertSameFraction(Fraction(1, 8), mills(Fraction(1, 8)))
+        self.assertSameFraction(Fraction(12, 100), FixedFraction(mills(Fraction(1, 8)), self.cents))
+        self.assertSameFraction(Fraction(1999, 100), self.cents(decimal.Decimal('19.99')))
+        self.assertSameFraction(Fraction(33, 100), self.cents(fractions.Fraction(1, 3)))
+        self.assertSameFraction(Fraction(1, 4), mills(Fraction(1, 8)) + decimal.Decimal('0.125'))
+        self.assertSameFraction(Fraction(3, 100), fractions.Fraction(1, 100) + self.cents(Fraction(1, 50)))
+        with self.assertRaises(TypeError):
+            self.cents('1.00')
+
+    def test_add_sub_exact(self):
+        fixed = [self.cents(v) for v in self.values]
+        for x, fx in zip(self.values, fixed):
+            for y, fy in zip(self.values[::7], fixed[::7]):
+                self.assertSameFraction(x + y, fx + fy)
+                self.assertSameFraction(x - y, fx - fy)
+                self.assertSameFraction(x + y, fx + y)
+                self.assertSameFraction(y - x, float(y) - fx)
+                self.assertSameFraction(y - x, y - fx)
+            self.assertSameFraction(x + 3, 3 + fx)
+            self.assertSameFraction(-x, -fx)
+
+    def test_mul_div_rounded(self):
+        fixed = [self.cents(v) for v in self.values]
+        for x, fx in zip(self.values, fixed):
+            self.assertSameFraction(x * 7, fx * 7)
+            self.assertSameFraction(x * 7, 7 * fx)
+            self.assertSameFraction(self.cents(x * Fraction(1, 3)).to_fraction(), Fraction(1, 3) * fx)
+            for y, fy in zip(self.values[:10], fixed[:10]):
+                self.assertSameFraction(self.cents(x * y).to_fraction(), fx * fy)
+                if y:
+                    self.assertSameFraction(self.cents(x / y).to_fraction(), fx / fy)
+                    self.assertSameFraction(self.cents(x / y).to_fraction(), fx / y)
+                if x:
+                    self.assertSameFraction(self.cents(y / x).to_fraction(), float(y) / fx)
+        # compound interest, rounded to the cent at every step
+        balance = self.cents(1000)
+        for _ in range(12):
+            balance = balance * Fraction(1005, 1000)
+        self.assertSameFraction(Fraction(106168, 100), balance)
+
+    def test_inf_nan(self):
+        inf, nan = self.cents(math.inf), self.cents(math.nan)
+        self.assertTrue(inf.is_infinite())
+        self.assertTrue(nan.isnan())
+        self.assertSameFraction(Fraction(1, 0), inf + self.cents(3))
+        self.assertSameFraction(Fraction(-1, 0), self.cents(3) - inf)
+        self.assertTrue((inf - inf).isnan())
+        self.assertTrue((nan + 1).isnan())
+        self.assertSameFraction(Fraction(1, 0), self.cents(3) / 0)
+        self.assertSameFraction(Fraction(-1, 0), self.cents(-3) / self.cents(0))
+        self.assertTrue((self.cents(0) / 0).isnan())
+        self.assertSameFraction(Fraction(0), self.cents(3) / inf)
+        self.assertSameFraction(Fraction(1, 0), 1 / self.cents(0))
+        self.assertSameFraction(Fraction(-1, 0), -inf)
+        self.assertTrue(inf and nan and self.cents(0.01))
+        self.assertFalse(self.cents(0.001))
+        with self.assertRaises(ValueError):
+            inf.scaled
+
+    def test_comparisons(self):
+        fixed = [self.cents(v) for v in self.values]
+        for x, fx in zip(self.values, fixed):
+            for y, fy in zip(self.values, fixed):
+                self.assertEqual(x < y, fx < fy)
+                self.assertEqual(x <= y, fx <= fy)
+                self.assertEqual(x > y, fx > fy)
+                self.assertEqual(x >= y, fx >= fy)
+                self.assertEqual(x == y, fx == fy)
+            self.assertTrue(fx == x)
+            self.assertEqual(hash(x), hash(fx))
+        self.assertTrue(self.cents(Fraction(1, 2)) == FixedContext(10)(0.5))
+        self.assertTrue(self.cents(1) < 1.5)
+        self.assertFalse(self.cents(math.nan) == self.cents(math.nan))
+        self.assertEqual(0.25, float(self.cents(0.25)))
+
+    def test_unsupported_operand(self):
+        with self.assertRaises(TypeError):
+            self.cents(1) + 'a'
+        with self.assertRaises(TypeError):
+            'a' * self.cents(1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
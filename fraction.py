@@ -1,17 +1,26 @@
 from __future__ import annotations
 
-from typing import Tuple, Union
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Tuple, Union
+import contextlib
+import contextvars
+import decimal
+import fractions
+import functools
+import io
+import itertools
 import math
+import numbers
+import re
+import sys
 
+# constants of the hash of numeric types, see the `numbers` hashing docs
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
 
-def type_error_msg_1(operand: str, other) -> str:
-    """Return a python built-in like error message"""
-    return f"unsupported operand type(s) for {operand}: 'Fraction' and '{str(other.__class__)[7:-1]}'"
 
-
-def type_error_msg_2(operand: str, other) -> str:
+def type_error_msg_1(operand: str, other) -> str:
     """Return a python built-in like error message"""
-    return f"'{operand}' not supported between instances of 'Fraction' and '{str(other.__class__)[7:-1]}'"
+    return f"unsupported operand type(s) for {operand}: 'Fraction' and '{type(other).__name__}'"
 
 
 def to_proper(numerator: int, denominator: int) -> Tuple[int, int]:
@@ -26,6 +35,8 @@ def to_proper(numerator: int, denominator: int) -> Tuple[int, int]:
         (3, 4)
         >>> to_proper(0, 0)
         (0, 0)
+        >>> to_proper(3 * 10**30 + 3, -3)
+        (-1000000000000000000000000000001, 1)
     """
     if numerator == 0:
         if denominator == 0:
@@ -36,16 +47,19 @@ def to_proper(numerator: int, denominator: int) -> Tuple[int, int]:
             return 1, 0
         return -1, 0
     gcd = math.gcd(numerator, denominator)
-    assert gcd > 0
-    assert (numerator / gcd).is_integer()
-    assert (denominator / gcd).is_integer()
-    sign = numerator * denominator / abs(numerator * denominator)
-    return int(sign * abs(numerator) / gcd), int(abs(denominator) / gcd)
+    if denominator < 0:
+        # move the sign to the numerator
+        gcd = -gcd
+    return numerator // gcd, denominator // gcd
 
 
-def to_ratio(x: float) -> Tuple[int, int]:
+def to_ratio(x: float, exact: bool = False) -> Tuple[int, int]:
     """Converts number to a pair of integer ratio with positive denominator.
 
+    By default `x` is read as the shortest decimal that rounds to it, the
+    same digits as ``repr(x)``, so 5.6 is 28/5.  With `exact`, the ratio is
+    the exact binary value of `x` instead.
+
     Examples:
         >>> to_ratio(5.6)
         (28, 5)
@@ -53,6 +67,12 @@ def to_ratio(x: float) -> Tuple[int, int]:
         (7, 8)
         >>> to_ratio(-0.048)
         (-6, 125)
+        >>> to_ratio(1e22)
+        (10000000000000000000000, 1)
+        >>> to_ratio(5e-324) == (1, 2 * 10**323)
+        True
+        >>> to_ratio(5.6, exact=True)
+        (3152519739159347, 562949953421312)
         >>> to_ratio(math.inf)
         (1, 0)
         >>> to_ratio(math.nan)
@@ -64,14 +84,405 @@ def to_ratio(x: float) -> Tuple[int, int]:
         return 1, 0
     if x == -math.inf:
         return -1, 0
-    i = 0
-    num = float(x)
-    while not num.is_integer():
-        num *= 10
-        i += 1
-    num = int(num)
-    assert x == num / 10**i
-    return to_proper(num, 10**i)
+    if exact:
+        return float(x).as_integer_ratio()
+    mantissa, _, exponent = repr(float(x)).partition('e')
+    whole, _, decimals = mantissa.partition('.')
+    numerator = int(whole + decimals)
+    exponent = int(exponent or 0) - len(decimals)
+    if exponent >= 0:
+        return numerator * 10**exponent, 1
+    return to_proper(numerator, 10**-exponent)
+
+
+def best_ratio(numerator: int, denominator: int, max_denominator: int) -> Tuple[int, int]:
+    """Return the closest ratio to `numerator`/`denominator` with a denominator
+    at most `max_denominator`, found from the continued fraction expansion.
+    The ratio must be in proper form.
+
+    Examples:
+        >>> best_ratio(3141592653589793, 1000000000000000, 1000)
+        (355, 113)
+        >>> best_ratio(1, 3, 10)
+        (1, 3)
+        >>> best_ratio(-1, 0, 10)
+        (-1, 0)
+    """
+    if max_denominator < 1:
+        raise ValueError("max_denominator should be at least 1")
+    if denominator <= max_denominator:
+        return numerator, denominator
+    # convergents p0/q0 and p1/q1 of the continued fraction
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = numerator, denominator
+    while True:
+        a = n // d
+        q2 = q0 + a * q1
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+    # best semiconvergent below max_denominator
+    k = (max_denominator - q0) // q1
+    p2, q2 = p0 + k * p1, q0 + k * q1
+    if abs(p1 * denominator - numerator * q1) * q2 <= abs(p2 * denominator - numerator * q2) * q1:
+        return p1, q1
+    return p2, q2
+
+
+# a decimal or integer numerator with an optional integer denominator, or inf or nan
+_FRACTION_FORMAT = re.compile(r"""
+    \s*(?P<sign>[-+]?)
+    (?:
+        (?=\d|\.\d)(?P<whole>\d*)(?:\.(?P<decimals>\d*))?(?:[eE](?P<exponent>[-+]?\d+))?
+        (?:\s*/\s*(?P<denominator>[-+]?\d+))?
+      | (?P<inf>inf(?:inity)?)
+      | (?P<nan>nan)
+    )\s*""", re.VERBOSE | re.IGNORECASE)
+
+
+def _parse_terms(text: str) -> Tuple[int, int]:
+    """Return the numerator and denominator written in `text`, not reduced.
+       Decimals are read exactly, without going through float.
+
+    Raises:
+        ValueError: if `text` is not a fraction, integer, decimal, inf or nan
+
+    Examples:
+        >>> _parse_terms('-6/8')
+        (-6, 8)
+        >>> _parse_terms(' 0.875 ')
+        (875, 1000)
+        >>> _parse_terms('1.5e3')
+        (1500, 1)
+        >>> _parse_terms('-inf'), _parse_terms('nan')
+        ((-1, 0), (0, 0))
+    """
+    match = _FRACTION_FORMAT.fullmatch(text)
+    if match is None:
+        raise ValueError(f"invalid literal for Fraction: {text!r}")
+    sign, whole, decimals, exponent, denominator, inf, nan = match.groups()
+    if inf:
+        return (-1 if sign == '-' else 1), 0
+    if nan:
+        return 0, 0
+    if decimals:
+        numerator, scale = int(whole + decimals), len(decimals)
+    else:
+        numerator, scale = int(whole or 0), 0
+    if exponent:
+        scale -= int(exponent)
+    if scale < 0:
+        numerator, scale = numerator * 10**-scale, 0
+    if sign == '-':
+        numerator = -numerator
+    if denominator is None:
+        return numerator, 10**scale
+    return numerator, 10**scale * int(denominator)
+
+
+# Cache of float -> ratio conversions, see `configure_cache`
+_float_ratio = functools.lru_cache(maxsize=4096)(to_ratio)
+
+
+def _fraction_terms(value: Fraction) -> Tuple[int, int]:
+    return value._numerator, value._denominator
+
+
+def _rational_terms(value: numbers.Rational) -> Tuple[int, int]:
+    return int(value.numerator), int(value.denominator)
+
+
+def _decimal_terms(value: decimal.Decimal) -> Tuple[int, int]:
+    if value.is_nan():
+        return 0, 0
+    if value.is_infinite():
+        return (-1 if value.is_signed() else 1), 0
+    return value.as_integer_ratio()
+
+
+# Conversions of the operands other than Fraction and int to terms in proper
+# form, by type.  Subclasses of these types and other `numbers.Rational`
+# types are added on first use, see `_converter`.
+_CONVERTERS: Dict[type, Callable[[object], Tuple[int, int]]] = {
+    # looked up on each call, `configure_cache` replaces the cache
+    float: lambda value: _float_ratio(value),
+    bool: lambda value: (int(value), 1),
+    fractions.Fraction: lambda value: (value.numerator, value.denominator),
+    decimal.Decimal: _decimal_terms,
+}
+
+
+def _converter(cls: type) -> Union[Callable[[object], Tuple[int, int]], None]:
+    """Return the conversion of operands of type `cls` to terms, or None if it is not supported."""
+    if issubclass(cls, Fraction):
+        convert = _fraction_terms
+    elif issubclass(cls, float):
+        convert = _CONVERTERS[float]
+    elif issubclass(cls, decimal.Decimal):
+        convert = _decimal_terms
+    elif issubclass(cls, numbers.Rational):
+        # ints, and e.g. NumPy ints
+        convert = _rational_terms
+    else:
+        return None
+    _CONVERTERS[cls] = convert
+    return convert
+
+
+def _coerce(other) -> Union[Tuple[int, int], None]:
+    """Return the numerator and denominator of an operand in proper form,
+       without creating a Fraction for it, or None if it is not a supported
+       number.  Fractions, ints and floats are checked first; the other
+       types are looked up in `_CONVERTERS`.
+    """
+    cls = other.__class__
+    if cls is Fraction:
+        return other._numerator, other._denominator
+    if cls is int:
+        return other, 1
+    if cls is float:
+        return _float_ratio(other)
+    convert = _CONVERTERS.get(cls) or _converter(cls)
+    return None if convert is None else convert(other)
+
+
+def _terms(other, operand: str) -> Tuple[int, int]:
+    """Return the numerator and denominator of an operand of `operand`, without
+       creating a Fraction for it.
+
+    Raises:
+        TypeError: if `other` is not a supported number
+    """
+    terms = _coerce(other)
+    if terms is None:
+        raise TypeError(type_error_msg_1(operand, other))
+    return terms
+
+
+def _comparable(other):
+    """Return `other` in a form that Fraction compares with: the value of
+       the fraction types built on Fraction, such as `LazyFraction` and
+       `FixedFraction`, which have a `to_fraction` method, or `other` itself.
+    """
+    to_fraction = getattr(other, 'to_fraction', None)
+    return other if to_fraction is None else to_fraction()
+
+
+def _cross(na: int, da: int, other) -> Union[Tuple[int, int], bool]:
+    """Return two ints that compare like na/da and `other`, False if either
+       is NaN, or NotImplemented if `other` is not a supported number.
+       A float compares by its exact binary value, as it does with ints.
+    """
+    if other.__class__ is Fraction:
+        nb, db = other._numerator, other._denominator
+    elif isinstance(other, float):
+        nb, db = to_ratio(other, exact=True)
+    else:
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        nb, db = terms
+    if (na == 0 and da == 0) or (nb == 0 and db == 0):
+        # nan cannot be ordered
+        return False
+    if da == 0 and db == 0:
+        # both infinite
+        return na, nb
+    # avoids dividing because apparently multiplication is easier?
+    return na * db, nb * da
+
+
+# The arithmetic below works on the terms of fractions in proper form.  For
+# finite operands it removes common factors before multiplying (Henrici's
+# algorithms, Knuth TAOCP 4.5.1), so the result is already proper and the
+# products stay small.  Infinities and NaN take the plain formulas.
+
+def _add(na: int, da: int, nb: int, db: int) -> Fraction:
+    """Return na/da + nb/db."""
+    if da and db:
+        g = math.gcd(da, db)
+        if g == 1:
+            return Fraction._from_proper(na * db + nb * da, da * db)
+        s = da // g
+        t = na * (db // g) + nb * s
+        g2 = math.gcd(t, g)
+        if g2 == 1:
+            return Fraction._from_proper(t, s * db)
+        return Fraction._from_proper(t // g2, s * (db // g2))
+    if da == db == 0:
+        # inf + inf -> inf, inf + -inf and anything + nan -> indefinite
+        return Fraction._from_proper(na if na == nb else 0, 0)
+    return Fraction._from_proper(*to_proper(na * db + nb * da, da * db))
+
+
+def _mul(na: int, da: int, nb: int, db: int) -> Fraction:
+    """Return na/da * nb/db."""
+    if da and db:
+        g1 = math.gcd(na, db)
+        g2 = math.gcd(nb, da)
+        return Fraction._from_proper((na // g1) * (nb // g2), (da // g2) * (db // g1))
+    return Fraction._from_proper(*to_proper(na * nb, da * db))
+
+
+def _div(na: int, da: int, nb: int, db: int) -> Fraction:
+    """Return na/da / nb/db."""
+    if da and db and nb:
+        g1 = math.gcd(na, nb)
+        g2 = math.gcd(da, db)
+        numerator, denominator = (na // g1) * (db // g2), (da // g2) * (nb // g1)
+        if denominator < 0:
+            return Fraction._from_proper(-numerator, -denominator)
+        return Fraction._from_proper(numerator, denominator)
+    numerator, denominator = na * db, da * nb
+    if denominator == 0 and nb < 0:
+        # because negative zero = zero
+        numerator = -numerator
+    return Fraction._from_proper(*to_proper(numerator, denominator))
+
+
+def _floordiv(na: int, da: int, nb: int, db: int) -> Union[int, Fraction]:
+    """Return the floor of na/da / nb/db, or the quotient if it is inf or nan."""
+    if da and db and nb:
+        return (na * db) // (da * nb)
+    return _div(na, da, nb, db)
+
+
+def _mod(na: int, da: int, nb: int, db: int) -> Fraction:
+    """Return na/da - nb/db * floor(na/da / nb/db), NaN if either is not finite or nb is 0."""
+    if da and db and nb:
+        return Fraction._from_proper(*to_proper((na * db) % (nb * da), da * db))
+    return Fraction._from_proper(0, 0)
+
+
+def _round_half_even(numerator: int, denominator: int) -> int:
+    """Return the int closest to numerator/denominator, the even one for halves."""
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+# Longest repeating part that `format` writes out for a fraction without a precision
+MAX_PERIOD = 10000
+
+# [[fill]align][sign][0][width][grouping][.precision][type] of the format
+# mini-language, with the fixed-point types only
+_FORMAT_SPEC = re.compile(r"""
+    (?:(?P<fill>.)?(?P<align>[<>=^]))?
+    (?P<sign>[-+ ]?)
+    (?P<zero>0?)
+    (?P<width>\d*)
+    (?P<grouping>[,_]?)
+    (?:\.(?P<precision>\d+))?
+    (?P<type>[fF%]?)
+    \Z
+""", re.VERBOSE | re.DOTALL)
+
+
+def _decimal_digits(numerator: int, denominator: int) -> Tuple[int, str, str]:
+    """Return the integer part of the non-negative numerator/denominator, the
+       digits after the point before the repeating part, and the repeating
+       digits, by integer division only.
+
+    Raises:
+        ValueError: if the repeating part is longer than `MAX_PERIOD` digits
+
+    Examples:
+        >>> _decimal_digits(1, 8), _decimal_digits(22, 7), _decimal_digits(1, 6)
+        ((0, '125', ''), (3, '', '142857'), (0, '1', '6'))
+    """
+    whole, remainder = divmod(numerator, denominator)
+    if remainder == 0:
+        return whole, '', ''
+    # denominator = 2**twos * 5**fives * rest, and the digits repeat after
+    # max(twos, fives) of them with the period of 10 modulo rest
+    twos = (denominator & -denominator).bit_length() - 1
+    rest, fives = denominator >> twos, 0
+    while rest % 5 == 0:
+        rest //= 5
+        fives += 1
+    length = max(twos, fives)
+    prefix, remainder = divmod(remainder * 10**length, denominator)
+    prefix = str(prefix).zfill(length) if length else ''
+    if remainder == 0:
+        return whole, prefix, ''
+    period, power = 1, 10 % rest
+    while power != 1:
+        if period >= MAX_PERIOD:
+            raise ValueError(f"the decimal digits repeat with a period over {MAX_PERIOD}, give a precision")
+        power = power * 10 % rest
+        period += 1
+    return whole, prefix, str(remainder * (10**period - 1) // denominator).zfill(period)
+
+
+@functools.lru_cache(maxsize=64)
+def _formatter(spec: str) -> Callable[[int, int], str]:
+    """Return a function formatting the terms of a fraction by the format
+       specification `spec`, parsed once for all the values formatted with it.
+    """
+    match = _FORMAT_SPEC.match(spec)
+    if match is None:
+        raise ValueError(f"Invalid format specifier '{spec}' for object of type 'Fraction'")
+    fill, align, sign, width, grouping = (match['fill'] or ' ', match['align'], match['sign'], match['width'],
+                                          match['grouping'])
+    kind, precision = match['type'], match['precision']
+    if kind == '' and precision is not None:
+        # float would switch to its general format, which Fraction does not have
+        raise ValueError(f"Invalid format specifier '{spec}' for object of type 'Fraction'")
+    if match['zero']:
+        fill = match['fill'] or '0'
+        align = align or '='
+    # like float, zeros padding the digits are grouped with them
+    zero_grouped = bool(grouping) and fill == '0' and align == '='
+    width = int(width or 0)
+    places = int(precision) if precision is not None else None
+    scale = 10 ** places if places is not None else None
+
+    def digits(numerator: int, denominator: int) -> Tuple[int, str]:
+        """Return the whole part of a finite fraction and the text after it."""
+        if kind == '%':
+            numerator *= 100
+        if scale is None:
+            if kind == '%':
+                # back in proper form, for the length of the terminating digits
+                g = math.gcd(numerator, denominator)
+                numerator, denominator = numerator // g, denominator // g
+            whole, prefix, repeating = _decimal_digits(numerator, denominator)
+            decimals = prefix + f"({repeating})" if repeating else prefix
+        else:
+            whole, decimals = divmod(_round_half_even(numerator * scale, denominator), scale)
+            decimals = str(decimals).zfill(places) if places else ''
+        tail = '.' + decimals if decimals else ''
+        return whole, tail + '%' if kind == '%' else tail
+
+    def format_terms(numerator: int, denominator: int) -> str:
+        prefix = '-' if numerator < 0 else sign.strip('-')
+        numerator = abs(numerator)
+        if kind and denominator == 0:
+            text = 'nan' if numerator == 0 else 'inf'
+            text = (text.upper() if kind == 'F' else text) + ('%' if kind == '%' else '')
+        else:
+            if kind:
+                whole, tail = digits(numerator, denominator)
+            else:
+                # as by str, with both terms grouped
+                whole, tail = numerator, f"/{format(denominator, grouping)}" if denominator != 1 else ''
+            if zero_grouped:
+                return prefix + format(whole, f"0{max(width - len(prefix) - len(tail), 1)}{grouping}") + tail
+            text = (format(whole, grouping) if grouping else str(whole)) + tail
+        padding = width - len(prefix) - len(text)
+        if padding <= 0:
+            return prefix + text
+        if align == '<':
+            return prefix + text + fill * padding
+        if align == '^':
+            return fill * (padding // 2) + prefix + text + fill * (padding - padding // 2)
+        if align == '=':
+            return prefix + fill * padding + text
+        return fill * padding + prefix + text
+
+    return format_terms
 
 
 class Fraction:
@@ -83,134 +494,408 @@ class Fraction:
     unique representation, e.g. 4/5, 24/30, and -20/-25 have the same
     internal representation.
 
+    Fractions are immutable and hashable, with the same hash as an equal
+    int or float, so they can be used as dict keys and set members.
+    Small fractions such as 0, 1, 1/2 and the infinities and NaN are shared
+    instances, see `configure_cache`.
+
     Attributes:
         numerator (int): the numerator of the fraction
         denominator (int): the denominator of the fraction
     """
 
-    def __init__(self, numerator, denominator=1):
-        """Initialize a new fraction with the given numerator
+    # _float caches __float__, None until then
+    __slots__ = ('_numerator', '_denominator', '_float')
+
+    def __new__(cls, numerator, denominator=1):
+        """Create a new fraction with the given numerator
            and denominator (default 1).
         """
         if isinstance(numerator, int) and isinstance(denominator, int):
-            self.numerator, self.denominator = to_proper(numerator, denominator)
-        elif isinstance(numerator, float) or isinstance(denominator, float):
-            frac = Fraction(*to_ratio(numerator)) / Fraction(*to_ratio(denominator))
-            self.numerator, self.denominator = frac.numerator, frac.denominator
-        else:
-            raise TypeError("numerator must be 'int' or 'float'")
-        assert isinstance(self.numerator, int)
-        assert isinstance(self.denominator, int)
+            return cls._from_proper(*to_proper(numerator, denominator))
+        terms1, terms2 = _coerce(numerator), _coerce(denominator)
+        if terms1 is None or terms2 is None:
+            raise TypeError("numerator and denominator must be numbers like 'int', 'float' or 'Fraction'")
+        (n1, d1), (n2, d2) = terms1, terms2
+        num, den = n1 * d2, d1 * n2
+        if den == 0 and n2 < 0:
+            # infinity over a negative number
+            num = -num
+        return cls._from_proper(*to_proper(num, den))
+
+    @classmethod
+    def from_string(cls, text: str) -> Fraction:
+        """Return the fraction written in `text`: ``n/d``, an integer, a
+           decimal with an optional exponent, inf or nan.  Decimals are exact.
+
+        Raises:
+            ValueError: if `text` is none of these
+
+        Examples:
+            >>> Fraction.from_string('6/-8')
+            -3/4
+            >>> Fraction.from_string('-1/0'), Fraction.from_string('0.1')
+            (-1/0, 1/10)
+        """
+        return cls._from_proper(*to_proper(*_parse_terms(text)))
+
+    @classmethod
+    def _from_proper(cls, numerator: int, denominator: int) -> Fraction:
+        """Return a fraction from terms already in proper form, skipping
+           validation and normalization.  Small values are shared instances.
+        """
+        if -_intern_limit <= numerator <= _intern_limit and denominator <= _intern_limit and cls is Fraction:
+            return _interned[numerator, denominator]
+        frac = object.__new__(cls)
+        frac._numerator = numerator
+        frac._denominator = denominator
+        frac._float = None
+        return frac
+
+    @property
+    def numerator(self) -> int:
+        return self._numerator
+
+    @property
+    def denominator(self) -> int:
+        return self._denominator
 
     def __str__(self):
         return self.__repr__()
 
     def __repr__(self):
-        return f"{self.numerator}{f'/{self.denominator}' if self.denominator != 1 else ''}"
+        if self._denominator == 1:
+            return str(self._numerator)
+        return f"{self._numerator}/{self._denominator}"
+
+    def __format__(self, format_spec: str) -> str:
+        """Format the exact decimal value, computed with ints, not through float.
+
+           The fixed-point types ``f``, ``F`` and ``%`` of the format
+           mini-language are supported, with fill, alignment, sign, width and
+           grouping.  With a precision the value is rounded half to even;
+           without one all its digits are written, with the repeating part
+           in parentheses.  With no type the fraction is written as by `str`,
+           with the grouping applied to both terms, and no precision.
+
+        Raises:
+            ValueError: for other format specifications, or a repeating part
+                over `MAX_PERIOD` digits long without a precision
+
+        Examples:
+            >>> format(Fraction(1, 3), '.20f'), format(Fraction(-1, 8), 'f'), format(Fraction(1, 6), '.1%')
+            ('0.33333333333333333333', '-0.125', '16.7%')
+            >>> f"{Fraction(22, 7):f} {Fraction(10**6, 3):,.2f} {Fraction(3, 4):>6}"
+            '3.(142857) 333,333.33    3/4'
+        """
+        return _formatter(format_spec)(self._numerator, self._denominator)
 
     def __float__(self):
-        """Return the float representation of the fraction. 1/0 is considered as inf."""
-        if self.is_infinite():
-            sign = 1 if self.numerator > 0 else -1
-            return sign * math.inf
-        if self.isnan():
-            return math.nan
-        return self.numerator / self.denominator
+        """Return the float representation of the fraction. 1/0 is considered as inf.
+           The float is computed once and kept with the fraction.
+        """
+        if self._float is not None:
+            return self._float
+        if self._denominator:
+            result = self._numerator / self._denominator
+        elif self._numerator:
+            result = math.inf if self._numerator > 0 else -math.inf
+        else:
+            result = math.nan
+        self._float = result
+        return result
+
+    # The operators take ints, floats, Fractions, `fractions.Fraction`,
+    # `decimal.Decimal` and other `numbers.Rational` numbers on either side,
+    # see `_coerce`, and return NotImplemented for anything else.  Fractions
+    # are immutable, so ``x += y`` is ``x = x + y``.
 
     def __add__(self, other: Union[int, float, Fraction]) -> Union[Fraction, math.nan]:
         """Return the sum of two fractions as a new fraction.
            Use the standard formula  a/b + c/d = (ad+bc)/(b*d)
         """
-        if not isinstance(other, Fraction):
-            if not isinstance(other, (int, float)):
-                raise TypeError(type_error_msg_1('+', other))
-            other = Fraction(other)
-
-        if self.is_infinite() and other.is_infinite():
-            if self.numerator > 0:
-                if other.numerator > 0:
-                    return Fraction(1, 0)
-                # inf + -inf -> indefinite
-                return Fraction(0, 0)
-            if other.numerator < 0:
-                return Fraction(-1, 0)
-            # -inf + inf -> indefinite
-            return Fraction(0, 0)
-        return Fraction(self.numerator*other.denominator + other.numerator*self.denominator,
-                        self.denominator * other.denominator)
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        result = _add(self._numerator, self._denominator, *terms)
+        limit = _max_denominator.get()
+        return _bound(result, limit) if limit else result
+
+    def __radd__(self, other: Union[int, float]) -> Fraction:
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        result = _add(*terms, self._numerator, self._denominator)
+        limit = _max_denominator.get()
+        return _bound(result, limit) if limit else result
 
     def __sub__(self, other: Union[int, float, Fraction]) -> Union[Fraction, math.nan]:
-        if not isinstance(other, Fraction):
-            if not isinstance(other, (int, float)):
-                raise TypeError(type_error_msg_1('-', other))
-            other = Fraction(other)
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        result = _add(self._numerator, self._denominator, -terms[0], terms[1])
+        limit = _max_denominator.get()
+        return _bound(result, limit) if limit else result
 
-        return self + (-other)
+    def __rsub__(self, other: Union[int, float]) -> Fraction:
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        result = _add(*terms, -self._numerator, self._denominator)
+        limit = _max_denominator.get()
+        return _bound(result, limit) if limit else result
 
     def __mul__(self, other: Union[int, float, Fraction]) -> Union[Fraction, math.nan]:
-        if not isinstance(other, Fraction):
-            if not isinstance(other, (int, float)):
-                raise TypeError(type_error_msg_1('*', other))
-            other = Fraction(other)
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        result = _mul(self._numerator, self._denominator, *terms)
+        limit = _max_denominator.get()
+        return _bound(result, limit) if limit else result
 
-        return Fraction(self.numerator * other.numerator, self.denominator * other.denominator)
+    def __rmul__(self, other: Union[int, float]) -> Fraction:
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        result = _mul(*terms, self._numerator, self._denominator)
+        limit = _max_denominator.get()
+        return _bound(result, limit) if limit else result
 
     def __truediv__(self, other: Union[int, float, Fraction]) -> Union[Fraction, math.nan]:
-        if not isinstance(other, Fraction):
-            if not isinstance(other, (int, float)):
-                raise TypeError(type_error_msg_1('/', other))
-            other = Fraction(other)
-
-        if self.denominator * other.numerator == 0:
-            if self.numerator * other.denominator == 0:
-                # zero over zero -> indefinite
-                return Fraction(0, 0)
-            if other.numerator < 0:
-                # because negative zero = zero
-                return Fraction(-self.numerator * other.denominator, 0)
-        return Fraction(self.numerator * other.denominator, self.denominator * other.numerator)
-
-    def __gt__(self, other: Fraction):
-        if not isinstance(other, Fraction):
-            if not isinstance(other, (int, float)):
-                raise TypeError(type_error_msg_2('>', other))
-            other = Fraction(other)
-
-        if self.isnan() or other.isnan():
-            # nan cannot be ordered
-            return False
-        # avoids dividing because apparently multiplication is easier?
-        return self.numerator * other.denominator > other.numerator * self.denominator
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        result = _div(self._numerator, self._denominator, *terms)
+        limit = _max_denominator.get()
+        return _bound(result, limit) if limit else result
 
-    def __lt__(self, other: Fraction):
-        if not isinstance(other, Fraction):
-            if not isinstance(other, (int, float)):
-                raise TypeError(type_error_msg_2('<', other))
-            other = Fraction(other)
+    def __rtruediv__(self, other: Union[int, float]) -> Fraction:
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        result = _div(*terms, self._numerator, self._denominator)
+        limit = _max_denominator.get()
+        return _bound(result, limit) if limit else result
 
-        if self.isnan() or other.isnan():
-            # nan cannot be ordered
-            return False
-        # avoids dividing because apparently multiplication is easier?
-        return self.numerator * other.denominator < other.numerator * self.denominator
+    def __floordiv__(self, other: Union[int, float, Fraction]) -> Union[int, Fraction]:
+        """Return the floor of the quotient as an int, or the quotient if it is inf or nan."""
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        return _floordiv(self._numerator, self._denominator, *terms)
+
+    def __rfloordiv__(self, other: Union[int, float]) -> Union[int, Fraction]:
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        return _floordiv(*terms, self._numerator, self._denominator)
+
+    def __mod__(self, other: Union[int, float, Fraction]) -> Fraction:
+        """Return the remainder of floor division, with the sign of `other`.
+           It is nan if either operand is inf or nan, or `other` is 0.
+        """
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        return _mod(self._numerator, self._denominator, *terms)
+
+    def __rmod__(self, other: Union[int, float]) -> Fraction:
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        return _mod(*terms, self._numerator, self._denominator)
+
+    def __divmod__(self, other: Union[int, float, Fraction]) -> Tuple[Union[int, Fraction], Fraction]:
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        return _floordiv(self._numerator, self._denominator, *terms), _mod(self._numerator, self._denominator, *terms)
+
+    def __rdivmod__(self, other: Union[int, float]) -> Tuple[Union[int, Fraction], Fraction]:
+        terms = _coerce(other)
+        if terms is None:
+            return NotImplemented
+        return _floordiv(*terms, self._numerator, self._denominator), _mod(*terms, self._numerator, self._denominator)
+
+    def __pow__(self, exponent: int) -> Fraction:
+        """Return the fraction raised to an int power.
+
+           The terms of a proper fraction have no common factors, so neither
+           have their powers and the result needs no gcd.  A negative power
+           is 1 divided by the positive one, so 0 ** -1 is 1/0 and
+           (1/0) ** -1 is 0, as with ``/``.  The exponent may also be a
+           Fraction with denominator 1.
+
+        Examples:
+            >>> Fraction(-2, 3) ** 3, Fraction(2, 3) ** -2, Fraction(0) ** -1
+            (-8/27, 9/4, 1/0)
+        """
+        if exponent.__class__ is Fraction and exponent._denominator == 1:
+            exponent = exponent._numerator
+        elif not isinstance(exponent, int):
+            return NotImplemented
+        if exponent >= 0:
+            result = Fraction._from_proper(self._numerator ** exponent, self._denominator ** exponent)
+        else:
+            result = _div(1, 1, self._numerator ** -exponent, self._denominator ** -exponent)
+        limit = _max_denominator.get()
+        return _bound(result, limit) if limit else result
+
+    def __rpow__(self, base: Union[int, float]) -> Fraction:
+        """Return `base` raised to the fraction, if it has denominator 1."""
+        terms = _coerce(base)
+        if terms is None or self._denominator != 1:
+            return NotImplemented
+        return Fraction._from_proper(*terms) ** self._numerator
+
+    def __gt__(self, other: Union[int, float, Fraction]) -> bool:
+        cross = _cross(self._numerator, self._denominator, other)
+        return cross[0] > cross[1] if cross.__class__ is tuple else cross
+
+    def __ge__(self, other: Union[int, float, Fraction]) -> bool:
+        cross = _cross(self._numerator, self._denominator, other)
+        return cross[0] >= cross[1] if cross.__class__ is tuple else cross
+
+    def __lt__(self, other: Union[int, float, Fraction]) -> bool:
+        cross = _cross(self._numerator, self._denominator, other)
+        return cross[0] < cross[1] if cross.__class__ is tuple else cross
+
+    def __le__(self, other: Union[int, float, Fraction]) -> bool:
+        cross = _cross(self._numerator, self._denominator, other)
+        return cross[0] <= cross[1] if cross.__class__ is tuple else cross
 
     def __eq__(self, other):
         """Two fractions are equal if they have the same value.
            Fractions are stored in proper form so the internal representation
-           is unique (3/6 is same as 1/2).
+           is unique (3/6 is same as 1/2).  A float is equal only to the
+           fraction of its exact binary value, so that equality agrees with
+           the hash: ``Fraction(0.1)`` is 1/10, but ``Fraction(1, 10) != 0.1``.
         """
-        if isinstance(other, (int, float)):
-            other = Fraction(other)
+        if other.__class__ is Fraction:
+            numerator, denominator = other._numerator, other._denominator
+        elif isinstance(other, float):
+            numerator, denominator = to_ratio(other, exact=True)
         else:
-            if not isinstance(other, Fraction):
-                return False
+            terms = _coerce(other)
+            if terms is None:
+                return NotImplemented
+            numerator, denominator = terms
         # nan cannot be ordered
-        if self.isnan() or other.isnan():
+        if denominator == 0 and numerator == 0:
             return False
-        return self.numerator == other.numerator and self.denominator == other.denominator
+        return self._numerator == numerator and self._denominator == denominator
+
+    def sort_key(self) -> Tuple[float, Fraction]:
+        """Return a key that orders fractions like ``<`` but compares faster.
+
+        The key is the nearest float, with the fraction itself to break ties,
+        so most comparisons in e.g. ``sorted(fractions, key=Fraction.sort_key)``
+        are between floats.  Rounding to float never reverses an order.
+
+        Examples:
+            >>> sorted([Fraction(1, 3), Fraction(-2), Fraction(1, 0)], key=Fraction.sort_key)
+            [-2, 1/3, 1/0]
+        """
+        try:
+            return float(self), self
+        except OverflowError:
+            # too big for a float
+            return (math.inf if self._numerator > 0 else -math.inf), self
+
+    def __hash__(self):
+        """Return the same hash as an int or float of the same value.
+           Like float nan, a NaN fraction is only equal to itself.
+        """
+        if self._denominator == 0:
+            if self._numerator == 0:
+                return object.__hash__(self)
+            return _HASH_INF if self._numerator > 0 else -_HASH_INF
+        try:
+            dinv = pow(self._denominator, -1, _HASH_MODULUS)
+        except ValueError:
+            # denominator is a multiple of the modulus
+            hash_ = _HASH_INF
+        else:
+            hash_ = hash(hash(abs(self._numerator)) * dinv)
+        result = hash_ if self._numerator >= 0 else -hash_
+        return -2 if result == -1 else result
+
+    def __reduce__(self):
+        """Pickle only the two terms, restored without normalizing again."""
+        return self._from_proper, (self._numerator, self._denominator)
 
     def __neg__(self):
-        return Fraction(-self.numerator, self.denominator)
+        return Fraction._from_proper(-self._numerator, self._denominator)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Fraction._from_proper(abs(self._numerator), self._denominator)
+
+    def __bool__(self):
+        """Zero is false; like float NaN, NaN is true."""
+        return self._numerator != 0 or self._denominator == 0
+
+    def _check_finite(self):
+        if self._denominator == 0:
+            if self._numerator == 0:
+                raise ValueError("cannot convert NaN to integer")
+            raise OverflowError("cannot convert infinity to integer")
+
+    def __trunc__(self) -> int:
+        self._check_finite()
+        if self._numerator < 0:
+            return -(-self._numerator // self._denominator)
+        return self._numerator // self._denominator
+
+    def __int__(self) -> int:
+        return self.__trunc__()
+
+    def __floor__(self) -> int:
+        self._check_finite()
+        return self._numerator // self._denominator
+
+    def __ceil__(self) -> int:
+        self._check_finite()
+        return -(-self._numerator // self._denominator)
+
+    def __round__(self, ndigits: int = None) -> Union[int, Fraction]:
+        """Round half to even, to an int, or to a Fraction with `ndigits` decimals.
+           Rounding inf or nan to decimals returns them unchanged.
+        """
+        if ndigits is None:
+            self._check_finite()
+            return _round_half_even(self._numerator, self._denominator)
+        if self._denominator == 0:
+            return self
+        if ndigits >= 0:
+            scale = 10 ** ndigits
+            return Fraction(_round_half_even(self._numerator * scale, self._denominator), scale)
+        scale = 10 ** -ndigits
+        return Fraction(_round_half_even(self._numerator, self._denominator * scale) * scale)
+
+    @property
+    def real(self) -> Fraction:
+        return self
+
+    @property
+    def imag(self) -> int:
+        return 0
+
+    def conjugate(self) -> Fraction:
+        return self
+
+    def limit_denominator(self, max_denominator: int = 1000000) -> Fraction:
+        """Return the closest fraction with a denominator at most `max_denominator`.
+
+        Examples:
+            >>> Fraction(math.pi).limit_denominator(1000)
+            355/113
+            >>> Fraction(*to_ratio(0.1, exact=True)).limit_denominator()
+            1/10
+        """
+        return Fraction(*best_ratio(self._numerator, self._denominator, max_denominator))
 
     def is_infinite(self):
         """Returns True if limit of the fraction tends to infinity.
@@ -223,7 +908,7 @@ class Fraction:
             >>> Fraction(-1, 0).is_infinite()
             True
         """
-        return self.denominator == 0 and self.numerator in (1, -1)
+        return self._denominator == 0 and self._numerator in (1, -1)
 
     def isnan(self):
         """ Return True if fraction is a NaN (not a number), and False otherwise.
@@ -231,7 +916,274 @@ class Fraction:
         Notes:
             named ``isnan`` to comply with the naming in the math module
         """
-        return self.numerator == self.denominator == 0
+        return self._numerator == self._denominator == 0
+
+
+numbers.Rational.register(Fraction)
+
+
+# Shared instances of every proper fraction with numerator and denominator
+# at most `_intern_limit` in size, including the infinities and NaN.
+_intern_limit = -1
+_interned: Dict[Tuple[int, int], Fraction] = {}
+
+
+def configure_cache(intern_limit: int = None, float_cache_size: int = None):
+    """Change the sizes of the caches of Fraction.
+
+    Args:
+        intern_limit (int): fractions whose numerator and denominator are at
+            most this in size are shared instances, at least 1 so that
+            0, 1, -1, inf, -inf and nan always are
+        float_cache_size (int): number of float to ratio conversions
+            remembered, 0 for none
+
+    Raises:
+        ValueError: if `intern_limit` is less than 1 or `float_cache_size` is negative
+    """
+    global _intern_limit, _float_ratio
+    if intern_limit is not None:
+        if intern_limit < 1:
+            raise ValueError("intern_limit must be at least 1")
+        # don't look up the table while it is rebuilt
+        _intern_limit = -1
+        _interned.clear()
+        for denominator in range(intern_limit + 1):
+            for numerator in range(-intern_limit, intern_limit + 1):
+                if math.gcd(numerator, denominator) == 1 or numerator == denominator == 0:
+                    _interned[numerator, denominator] = Fraction._from_proper(numerator, denominator)
+        _intern_limit = intern_limit
+    if float_cache_size is not None:
+        if float_cache_size < 0:
+            raise ValueError("float_cache_size must not be negative")
+        _float_ratio = functools.lru_cache(maxsize=float_cache_size)(to_ratio)
+
+
+def cache_info() -> Dict[str, int]:
+    """Return the sizes of the caches of Fraction and the hits and misses of the float cache.
+
+    Examples:
+        >>> sorted(cache_info())
+        ['float_hits', 'float_maxsize', 'float_misses', 'float_size', 'intern_limit', 'interned']
+    """
+    info = _float_ratio.cache_info()
+    return {
+        'intern_limit': _intern_limit,
+        'interned': len(_interned),
+        'float_hits': info.hits,
+        'float_misses': info.misses,
+        'float_size': info.currsize,
+        'float_maxsize': info.maxsize,
+    }
+
+
+configure_cache(intern_limit=16)
+
+
+# Largest denominator of the results of arithmetic, 0 for no limit, see `bounded_denominators`
+_max_denominator = contextvars.ContextVar('max_denominator', default=0)
+
+
+def _bound(frac: Fraction, limit: int) -> Fraction:
+    """Return `frac` rounded to the closest fraction with a denominator at most `limit`."""
+    if frac._denominator > limit:
+        return Fraction._from_proper(*best_ratio(frac._numerator, frac._denominator, limit))
+    return frac
+
+
+@contextlib.contextmanager
+def bounded_denominators(bits: int) -> Iterator[None]:
+    """Within the block, round the result of every arithmetic operator of
+       Fraction (``+ - * / **``) to the closest fraction whose denominator
+       fits in `bits` bits, so iterating an operation costs the same at each
+       step instead of growing with the terms.  The results are no longer
+       exact, but each rounding is off by less than 1/2**bits.  Blocks can
+       be nested; the innermost one applies.  The limit is kept in a context
+       variable, so each thread and asyncio task has its own.
+
+    Raises:
+        ValueError: if `bits` is less than 1
+
+    Examples:
+        >>> x = Fraction(1)
+        >>> with bounded_denominators(16):
+        ...     for _ in range(10):
+        ...         x = (x * x + 2) / (x * 2)
+        >>> x, x.denominator.bit_length() <= 16
+        (816/577, True)
+    """
+    if bits < 1:
+        raise ValueError("bits must be at least 1")
+    token = _max_denominator.set((1 << bits) - 1)
+    try:
+        yield
+    finally:
+        _max_denominator.reset(token)
+
+
+def _product(factors: List[int]) -> int:
+    """Return the product of `factors`, multiplied as a balanced tree so the
+       big multiplications have operands of similar size.
+    """
+    while len(factors) > 1:
+        factors = [factors[i] * factors[i + 1] for i in range(0, len(factors) - 1, 2)] + factors[len(factors) & ~1:]
+    return factors[0] if factors else 1
+
+
+def _sum_terms(terms: Iterable[Tuple[int, int]]) -> Fraction:
+    """Return the sum of fractions given as (numerator, denominator) pairs.
+
+    Finite terms need not be in proper form.  Numerators with the same
+    denominator are added as ints; the partial sums are then added pairwise
+    over the least common multiple of their denominators and the result is
+    normalized once.  Infinite and NaN terms must be in proper form and give
+    the same result as adding with ``+``.
+    """
+    by_denominator = {}
+    infinities = set()
+    nan = False
+    for numerator, denominator in terms:
+        if denominator:
+            by_denominator[denominator] = by_denominator.get(denominator, 0) + numerator
+        elif numerator:
+            infinities.add(numerator)
+        else:
+            nan = True
+    if nan or len(infinities) == 2:
+        # inf + -inf and anything + nan -> indefinite
+        return Fraction._from_proper(0, 0)
+    if infinities:
+        return Fraction._from_proper(infinities.pop(), 0)
+    sums = [(numerator, denominator) for denominator, numerator in by_denominator.items()]
+    while len(sums) > 1:
+        pairs = []
+        for (n1, d1), (n2, d2) in zip(sums[::2], sums[1::2]):
+            g = math.gcd(d1, d2)
+            pairs.append((n1 * (d2 // g) + n2 * (d1 // g), d1 // g * d2))
+        sums = pairs + sums[len(sums) & ~1:]
+    if not sums:
+        return Fraction._from_proper(0, 1)
+    return Fraction._from_proper(*to_proper(*sums[0]))
+
+
+def _terms_of_sum(terms: Tuple[List[int], List[int]]) -> Tuple[int, int]:
+    """Return the numerator and denominator of the sum of the fractions given as
+       parallel lists of numerators and denominators, which pickle more compactly
+       than the Fractions themselves.  Used by the workers of `parallel` and `asyncutil`.
+    """
+    total = _sum_terms(zip(*terms))
+    return total._numerator, total._denominator
+
+
+def fsum(values: Iterable[Union[int, float, Fraction]]) -> Fraction:
+    """Return the exact sum of `values`, the same as adding them with ``+``
+       but normalized only once.
+
+    Examples:
+        >>> fsum([Fraction(1, 3), Fraction(1, 6), 0.5, 2])
+        3
+        >>> fsum([Fraction(1, 0), 5, Fraction(-1, 0)])
+        0/0
+        >>> fsum([])
+        0
+    """
+    return _sum_terms(_terms(value, '+') for value in values)
+
+
+def fprod(values: Iterable[Union[int, float, Fraction]]) -> Fraction:
+    """Return the exact product of `values`, the same as multiplying them
+       with ``*`` but normalized only once.
+
+    Examples:
+        >>> fprod([Fraction(2, 3), Fraction(9, 4), -2])
+        -3
+        >>> fprod([Fraction(1, 0), Fraction(-1, 2)])
+        -1/0
+        >>> fprod([Fraction(1, 0), 0])
+        0/0
+    """
+    numerators, denominators = [], []
+    for value in values:
+        numerator, denominator = _terms(value, '*')
+        numerators.append(numerator)
+        denominators.append(denominator)
+    return Fraction._from_proper(*to_proper(_product(numerators), _product(denominators)))
+
+
+def fdot(xs: Iterable[Union[int, float, Fraction]], ys: Iterable[Union[int, float, Fraction]]) -> Fraction:
+    """Return the exact sum of products of `xs` and `ys`, the same as
+       ``x1*y1 + x2*y2 + ...`` but normalized only once.
+
+    Raises:
+        ValueError: if `xs` and `ys` have different lengths
+
+    Examples:
+        >>> fdot([Fraction(1, 2), Fraction(1, 3)], [4, Fraction(3, 5)])
+        11/5
+    """
+    def products():
+        xs_iter, ys_iter = iter(xs), iter(ys)
+        for x in xs_iter:
+            try:
+                y = next(ys_iter)
+            except StopIteration:
+                raise ValueError("fdot() arguments must have the same length") from None
+            nx, dx = _terms(x, '*')
+            ny, dy = _terms(y, '*')
+            if dx and dy:
+                yield nx * ny, dx * dy
+            else:
+                product = _mul(nx, dx, ny, dy)
+                yield product._numerator, product._denominator
+        for _ in ys_iter:
+            raise ValueError("fdot() arguments must have the same length")
+
+    return _sum_terms(products())
+
+
+def parse_many(strings: Iterable[str]) -> List[Fraction]:
+    """Return ``[Fraction.from_string(s) for s in strings]``, parsed in one pass.
+
+    Examples:
+        >>> parse_many(['3/4', '-2', '0.875', '1/0'])
+        [3/4, -2, 7/8, 1/0]
+    """
+    from_proper = Fraction._from_proper
+    return [from_proper(*to_proper(*_parse_terms(text))) for text in strings]
+
+
+def format_many(values: Iterable[Union[int, float, Fraction]], format_spec: str = '', out: IO = None,
+                sep: str = '\n') -> Union[str, None]:
+    """Write each of `values` formatted by `format_spec`, as by `format`, and
+       followed by `sep`, to the text or binary stream `out`, e.g. an
+       `io.StringIO` or `io.BytesIO`.  The format specification is parsed once,
+       and the text is written in large chunks.
+
+    Returns:
+        the text if `out` is None, otherwise None
+
+    Examples:
+        >>> format_many([Fraction(1, 3), 2, 0.5], '.3f', sep=',')
+        '0.333,2.000,0.500,'
+    """
+    format_terms = _formatter(format_spec)
+    binary = out is not None and not isinstance(out, io.TextIOBase)
+    stream = io.StringIO() if out is None else out
+    iterator = iter(values)
+    while True:
+        chunk = []
+        for value in itertools.islice(iterator, 4096):
+            terms = _coerce(value)
+            if terms is None:
+                raise TypeError(f"values must be numbers like 'int', 'float' or 'Fraction', "
+                                f"not '{type(value).__name__}'")
+            chunk.append(format_terms(*terms))
+        if not chunk:
+            break
+        chunk.append('')
+        text = sep.join(chunk)
+        stream.write(text.encode('ascii') if binary else text)
+    return stream.getvalue() if out is None else None
 
 
 if __name__ == '__main__':
@@ -1,9 +1,44 @@
+import decimal
+import fractions
+import functools
+import io
 import math
+import numbers
+import operator
+import pickle
+import random
+import threading
 import unittest
-from fraction import Fraction
 
+import fraction
+from fraction import Fraction, fdot, format_many, fprod, fsum, parse_many
 
-class FractionTest(unittest.TestCase):
+
+class FractionAssertions:
+    """Assertions on the terms of fractions, shared by the tests of all the
+       fraction modules.  Unlike assertEqual they pass for NaN and NaN, and
+       check that the results are in proper form.
+    """
+
+    def assertProper(self, actual):
+        # reduced with a non-negative denominator, infinities as 1/0 and -1/0
+        numerator, denominator = actual.numerator, actual.denominator
+        self.assertGreaterEqual(denominator, 0, actual)
+        self.assertIn(math.gcd(numerator, denominator), (0, 1), actual)
+
+    def assertSameFraction(self, expected, actual):
+        self.assertEqual((expected.numerator, expected.denominator), (actual.numerator, actual.denominator))
+        self.assertProper(actual)
+
+    def assertSameFractions(self, expected, actual):
+        actual = list(actual)
+        self.assertEqual([(f.numerator, f.denominator) for f in expected],
+                         [(f.numerator, f.denominator) for f in actual])
+        for frac in actual:
+            self.assertProper(frac)
+
+
+class FractionTest(FractionAssertions, unittest.TestCase):
     """Test the methods and constructor of the Fraction class. """
 
     def test_str(self):
@@ -103,6 +138,30 @@ class FractionTest(unittest.TestCase):
         frac = Fraction(99)
         self.assertEqual(99, frac.numerator)
         self.assertEqual(1, frac.denominator)
+        # tiny and huge floats
+        frac = Fraction(5e-324)
+        self.assertEqual(1, frac.numerator)
+        self.assertEqual(2 * 10**323, frac.denominator)
+        frac = Fraction(1e300, -0.5)
+        self.assertEqual(-2 * 10**300, frac.numerator)
+        self.assertEqual(1, frac.denominator)
+        frac = Fraction(math.inf, -2.5)
+        self.assertEqual(-1, frac.numerator)
+        self.assertEqual(0, frac.denominator)
+        frac = Fraction(3, 0.0)
+        self.assertEqual(1, frac.numerator)
+        self.assertEqual(0, frac.denominator)
+        self.assertTrue(Fraction(math.inf, math.inf).isnan())
+        self.assertTrue(Fraction(0.0, 0).isnan())
+        with self.assertRaises(TypeError):
+            Fraction('1', 2.0)
+        # integers too big for a float
+        frac = Fraction(6 * (2**61 - 1), -4 * 3**40)
+        self.assertEqual(-(2**61 - 1), frac.numerator)
+        self.assertEqual(2 * 3**39, frac.denominator)
+        frac = Fraction(7**500 * 11, 7**499 * 13)
+        self.assertEqual(77, frac.numerator)
+        self.assertEqual(13, frac.denominator)
 
     def test_add(self):
         # 3/4 = 2/3 + 1/12
@@ -192,6 +251,161 @@ class FractionTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             Fraction(3, 4) / 'string'
 
+    def test_pow(self):
+        self.assertEqual(Fraction(9, 16), Fraction(3, 4) ** 2)
+        self.assertEqual(Fraction(-8, 27), Fraction(-2, 3) ** 3)
+        self.assertEqual(Fraction(9, 4), Fraction(-2, 3) ** -2)
+        self.assertEqual(Fraction(-3, 2), Fraction(-2, 3) ** -1)
+        self.assertEqual(Fraction(1), Fraction(5, 7) ** 0)
+        rng = random.Random(7)
+        for _ in range(50):
+            a, b = rng.getrandbits(100) - 2**99, rng.getrandbits(100) + 1
+            exponent = rng.randint(-20, 20)
+            if a == 0 and exponent < 0:
+                continue
+            expected = fractions.Fraction(a, b) ** exponent
+            result = Fraction(a, b) ** exponent
+            self.assertSameFraction(expected, result)
+        # same as the division conventions
+        self.assertEqual(Fraction(1, 0), Fraction(0) ** -1)
+        self.assertEqual(Fraction(0), Fraction(1, 0) ** -2)
+        self.assertEqual(Fraction(-1, 0), Fraction(-1, 0) ** 3)
+        self.assertEqual(Fraction(1, 0), Fraction(-1, 0) ** 2)
+        self.assertTrue((Fraction(0, 0) ** 2).isnan())
+        self.assertTrue((Fraction(0, 0) ** -1).isnan())
+        self.assertEqual(Fraction(1), Fraction(0, 0) ** 0)
+        with self.assertRaises(TypeError):
+            Fraction(1, 2) ** 0.5
+        with self.assertRaises(TypeError):
+            Fraction(1, 2) ** Fraction(1, 2)
+
+    def test_bounded_denominators(self):
+        x = Fraction(1)
+        with fraction.bounded_denominators(32):
+            for _ in range(20):
+                x = (x * x + 2) / (x * 2)
+                self.assertLess(x.denominator, 2**32)
+            self.assertLess(abs(float(x) - math.sqrt(2)), 2**-30)
+            self.assertEqual(Fraction(1, 3), Fraction(1, 3) + 0)
+            with fraction.bounded_denominators(3):
+                self.assertEqual(Fraction(1, 7), Fraction(1, 3) ** 2)
+            self.assertEqual(Fraction(1, 9), Fraction(1, 3) ** 2)
+            self.assertEqual(Fraction(1, 0), Fraction(1, 3) / 0)
+            # other threads start with no limit
+            results = []
+            thread = threading.Thread(target=lambda: results.append(Fraction(1, 2**20) * Fraction(1, 2**20)))
+            thread.start()
+            thread.join()
+            self.assertEqual([Fraction(1, 2**40)], results)
+        # exact again outside the block
+        self.assertEqual(Fraction(1, 2**40), Fraction(1, 2**20) * Fraction(1, 2**20))
+        with self.assertRaises(ValueError):
+            with fraction.bounded_denominators(0):
+                pass
+
+    def test_reflected(self):
+        self.assertEqual(Fraction(3, 2), 1 + Fraction(1, 2))
+        self.assertEqual(Fraction(1, 2), 1 - Fraction(1, 2))
+        self.assertEqual(Fraction(1, 4), 0.5 * Fraction(1, 2))
+        self.assertEqual(Fraction(-6), 3 / Fraction(-1, 2))
+        self.assertEqual(Fraction(8), 2 ** Fraction(3))
+        # same conventions as the forward operators
+        self.assertEqual(Fraction(1, 0), 1 / Fraction(0))
+        self.assertEqual(Fraction(-1, 0), -1 / Fraction(0))
+        self.assertEqual(Fraction(0), 5 / Fraction(-1, 0))
+        self.assertTrue((math.inf - Fraction(1, 0)).isnan())
+        self.assertTrue((0 * Fraction(1, 0)).isnan())
+        rng = random.Random(24)
+        for _ in range(100):
+            x = Fraction(rng.getrandbits(80) - 2**79, rng.getrandbits(80) + 1)
+            for other in (rng.randint(-50, 50), rng.random() * 100 - 50):
+                self.assertEqual(Fraction(other) + x, other + x)
+                self.assertEqual(Fraction(other) - x, other - x)
+                self.assertEqual(Fraction(other) * x, other * x)
+                self.assertEqual(Fraction(other) / x, other / x)
+        x = Fraction(1)
+        x += 2
+        x *= 0.5
+        x -= Fraction(1, 4)
+        x /= 5
+        self.assertEqual(Fraction(1, 4), x)
+        for op in (operator.add, operator.sub, operator.mul, operator.truediv, operator.lt, operator.floordiv):
+            with self.assertRaises(TypeError):
+                op('string', Fraction(1, 2))
+        with self.assertRaises(TypeError):
+            2 ** Fraction(1, 2)
+
+    def test_mixed_types(self):
+        half = Fraction(1, 2)
+        for other, terms in ((fractions.Fraction(-3, 4), (-3, 4)), (decimal.Decimal('0.125'), (1, 8)),
+                             (decimal.Decimal('-1E+3'), (-1000, 1)), (decimal.Decimal('inf'), (1, 0)),
+                             (decimal.Decimal('-inf'), (-1, 0)), (decimal.Decimal('nan'), (0, 0)),
+                             (True, (1, 1))):
+            value = Fraction(*terms)
+            for result, expected in ((half + other, half + value), (other + half, value + half),
+                                     (half - other, half - value), (other - half, value - half),
+                                     (half * other, half * value), (other * half, value * half),
+                                     (half / other, half / value), (other / half, value / half)):
+                self.assertIsInstance(result, Fraction)
+                self.assertSameFraction(expected, result)
+            self.assertEqual(terms, (Fraction(other).numerator, Fraction(other).denominator))
+            if not value.isnan():
+                self.assertEqual(value, other)
+                self.assertTrue(half < other if value > half else half >= other)
+            if value.denominator:
+                # Decimal compares with its own rules, which leave out our infinities
+                self.assertEqual(other, value)
+        self.assertEqual(hash(decimal.Decimal('0.5')), hash(half))
+        self.assertEqual(hash(fractions.Fraction(1, 2)), hash(half))
+        self.assertFalse(half == 'a')
+        self.assertTrue(half != 'a')
+        self.assertTrue(isinstance(half, numbers.Rational))
+
+    def test_rational_protocol(self):
+        rng = random.Random(25)
+        for _ in range(200):
+            a, b = rng.randint(-1000, 1000), rng.randint(1, 100)
+            c, d = rng.randint(-1000, 1000) or 1, rng.randint(1, 100)
+            x, y, expected = Fraction(a, b), Fraction(c, d), fractions.Fraction(a, b)
+            for func in (math.floor, math.ceil, math.trunc, int, round, abs, bool):
+                self.assertEqual(func(expected), func(x))
+            self.assertEqual(round(expected, 1), round(x, 1))
+            self.assertEqual(round(expected, -1), round(x, -1))
+            self.assertEqual(expected // fractions.Fraction(c, d), x // y)
+            self.assertEqual(expected % fractions.Fraction(c, d), x % y)
+            self.assertEqual(divmod(a, fractions.Fraction(c, d)), divmod(a, y))
+        self.assertEqual(2, round(Fraction(5, 2)))
+        self.assertEqual(-2, round(Fraction(-5, 2)))
+        self.assertIs(+Fraction(3, 7), Fraction(3, 7).real)
+        self.assertEqual((0, Fraction(3, 7)), (Fraction(3, 7).imag, Fraction(3, 7).conjugate()))
+        # infinities and NaN
+        self.assertTrue(bool(Fraction(0, 0)))
+        self.assertEqual(Fraction(1, 0), abs(Fraction(-1, 0)))
+        self.assertEqual(Fraction(1, 0), Fraction(3) // 0)
+        self.assertTrue((Fraction(3) % 0).isnan())
+        self.assertTrue((Fraction(1, 0) % 2).isnan())
+        self.assertEqual(Fraction(-1, 0), round(Fraction(-1, 0), 2))
+        with self.assertRaises(OverflowError):
+            math.floor(Fraction(1, 0))
+        with self.assertRaises(ValueError):
+            int(Fraction(0, 0))
+
+    def test_operations_proper_form(self):
+        """Results of reduced arithmetic are proper, also for huge terms."""
+        rng = random.Random(6)
+        for _ in range(200):
+            a, b = rng.getrandbits(200) - 2**199, rng.getrandbits(200) + 1
+            c, d = rng.getrandbits(200) - 2**199, rng.getrandbits(200) + 1
+            k = rng.getrandbits(100) + 1
+            for x, y in ((Fraction(a * k, b * k), Fraction(c, d)), (Fraction(a, b), Fraction(c * k, d * k))):
+                for op in ('__add__', '__sub__', '__mul__', '__truediv__'):
+                    expected = getattr(fractions.Fraction(a, b), op)(fractions.Fraction(c, d))
+                    result = getattr(x, op)(y)
+                    self.assertSameFraction(expected, result)
+            result = Fraction(a, b) * k - k
+            expected = fractions.Fraction(a, b) * k - k
+            self.assertSameFraction(expected, result)
+
     def test_gt(self):
         self.assertTrue(Fraction(1, 2) > Fraction(1, 3))
         self.assertFalse(Fraction(5, 6) > Fraction(6, 7))
@@ -216,6 +430,49 @@ class FractionTest(unittest.TestCase):
         self.assertFalse(Fraction(-1, 0) < Fraction(math.nan))
         self.assertFalse(Fraction(-1, 0) < Fraction(-1, 0))
 
+    def test_le(self):
+        self.assertTrue(Fraction(1, 3) <= Fraction(1, 2))
+        self.assertTrue(Fraction(3, 7) <= Fraction(6, 14))
+        self.assertFalse(Fraction(-1, 3) <= Fraction(-1, 2))
+        self.assertTrue(Fraction(3, 4) <= 0.75)
+        self.assertTrue(Fraction(3, 4) <= 1)
+        self.assertTrue(Fraction(-1, 0) <= Fraction(1, 0))
+        self.assertTrue(Fraction(1, 0) <= math.inf)
+        self.assertFalse(Fraction(0, 0) <= Fraction(0, 0))
+        self.assertFalse(Fraction(1) <= math.nan)
+        with self.assertRaises(TypeError):
+            Fraction(3, 4) <= 'a'
+
+    def test_ge(self):
+        self.assertTrue(Fraction(1, 2) >= Fraction(1, 3))
+        self.assertTrue(Fraction(3, 7) >= Fraction(6, 14))
+        self.assertFalse(Fraction(-1, 2) >= Fraction(-1, 3))
+        self.assertTrue(Fraction(3, 4) >= 0.75)
+        self.assertTrue(Fraction(1, 0) >= Fraction(-1, 0))
+        self.assertTrue(Fraction(1, 0) >= 10**100)
+        self.assertFalse(Fraction(0, 0) >= Fraction(-1, 0))
+        with self.assertRaises(TypeError):
+            Fraction(3, 4) >= 'a'
+
+    def test_infinite_order(self):
+        self.assertTrue(Fraction(-1, 0) < Fraction(1, 0))
+        self.assertTrue(Fraction(1, 0) > Fraction(-1, 0))
+        self.assertTrue(Fraction(-1, 0) < -10**100)
+        self.assertTrue(-math.inf < Fraction(-10**100))
+        self.assertTrue(2 > Fraction(3, 2))
+
+    def test_sort_key(self):
+        rng = random.Random(11)
+        fracs = [Fraction(rng.randint(-10**20, 10**20), rng.randint(1, 10**20)) for _ in range(500)]
+        # ties after rounding to float
+        fracs += [Fraction(10**30 + i, 10**30) for i in range(5)]
+        fracs += [Fraction(1, 0), Fraction(-1, 0), Fraction(10**400), Fraction(-10**400, 3), Fraction(0)]
+        rng.shuffle(fracs)
+        expected = sorted(fracs)
+        self.assertListEqual(expected, sorted(fracs, key=Fraction.sort_key))
+        self.assertListEqual([fractions.Fraction(f.numerator, f.denominator) for f in expected if f.denominator],
+                             sorted(fractions.Fraction(f.numerator, f.denominator) for f in fracs if f.denominator))
+
     def test_eq(self):
         """Test Fraction.__eq__()"""
         f = Fraction(1, 2)
@@ -237,6 +494,173 @@ class FractionTest(unittest.TestCase):
         self.assertNotEqual(Fraction(1), [])
         self.assertEqual(Fraction(1), 1)
         self.assertEqual(Fraction(3, 4), 0.75)
+        # floats compare by their exact binary value, 0.1 is not 1/10
+        self.assertNotEqual(Fraction(1, 10), 0.1)
+        self.assertEqual(Fraction(*(0.1).as_integer_ratio()), 0.1)
+        self.assertEqual(Fraction(0.1), Fraction(1, 10))
+        self.assertTrue(Fraction(1, 10) < 0.1 < Fraction(1, 10) + Fraction(1, 10**17))
+        self.assertFalse(Fraction(1, 10) >= 0.1)
+
+    def test_hash(self):
+        self.assertEqual(hash(3), hash(Fraction(3)))
+        self.assertEqual(hash(-3), hash(Fraction(-6, 2)))
+        self.assertEqual(hash(0.75), hash(Fraction(3, 4)))
+        self.assertEqual(hash(-2.5), hash(Fraction(-5, 2)))
+        self.assertEqual(hash(2**100), hash(Fraction(2**100)))
+        self.assertEqual(hash(math.inf), hash(Fraction(1, 0)))
+        self.assertEqual(hash(-math.inf), hash(Fraction(-1, 0)))
+        self.assertEqual(hash(Fraction(1, 3)), hash(Fraction(2, 6)))
+        self.assertEqual({Fraction(1, 2): 'half'}[Fraction(2, 4)], 'half')
+        self.assertEqual(1, len({Fraction(1, 2), Fraction(-3, -6), 0.5}))
+        # equal values hash alike, also for floats that are not a short binary fraction
+        for x in (0.1, -2.3, 1e-300, 1 / 3):
+            frac = Fraction(*x.as_integer_ratio())
+            self.assertEqual(frac, x)
+            self.assertEqual(hash(x), hash(frac))
+            self.assertIn(x, {frac})
+        self.assertEqual(2, len({Fraction(1, 10), 0.1}))
+        # like math.nan, the shared NaN is found in a set by identity only
+        nan = Fraction(0, 0)
+        self.assertEqual(1, len({nan, Fraction(0, 0)}))
+        self.assertEqual(2, len({nan, Fraction(0, 0), math.nan}))
+
+    def test_immutable(self):
+        frac = Fraction(1, 2)
+        with self.assertRaises(AttributeError):
+            frac.numerator = 3
+        with self.assertRaises(AttributeError):
+            frac.denominator = 3
+        with self.assertRaises(AttributeError):
+            frac.other = 3
+        self.assertEqual(Fraction(1, 2), frac)
+
+    def test_interned(self):
+        self.assertIs(Fraction(0), Fraction(0, 5))
+        self.assertIs(Fraction(1, 0), Fraction(7, 0))
+        self.assertIs(Fraction(-1, 0), Fraction(-math.inf))
+        self.assertIs(Fraction(0, 0), Fraction(math.nan))
+        self.assertIs(Fraction(1, 2), Fraction(0.5))
+        self.assertIs(Fraction(1), Fraction(1, 2) + Fraction(1, 2))
+        self.assertIs(Fraction(0, 0), Fraction(1, 0) - Fraction(1, 0))
+        self.assertIsNot(Fraction(10**6, 7), Fraction(10**6, 7))
+        self.assertIs(pickle.loads(pickle.dumps(Fraction(-3, 7))), Fraction(-3, 7))
+
+    def test_configure_cache(self):
+        info = fraction.cache_info()
+        try:
+            fraction.configure_cache(intern_limit=1, float_cache_size=2)
+            self.assertIs(Fraction(0), Fraction(0, 3))
+            self.assertIsNot(Fraction(1, 2), Fraction(1, 2))
+            Fraction(0.1), Fraction(0.1), Fraction(0.2), Fraction(0.3), Fraction(0.1)
+            info_small = fraction.cache_info()
+            self.assertEqual(1, info_small['intern_limit'])
+            self.assertEqual(6, info_small['interned'])
+            self.assertEqual(1, info_small['float_hits'])
+            self.assertEqual(4, info_small['float_misses'])
+            self.assertEqual(2, info_small['float_size'])
+            with self.assertRaises(ValueError):
+                fraction.configure_cache(intern_limit=0)
+            with self.assertRaises(ValueError):
+                fraction.configure_cache(float_cache_size=-1)
+        finally:
+            fraction.configure_cache(intern_limit=info['intern_limit'], float_cache_size=info['float_maxsize'])
+        self.assertIs(Fraction(1, 2), Fraction(1, 2))
+
+    def test_pickle(self):
+        for frac in (Fraction(-3, 7), Fraction(2**100, 3), Fraction(1, 0), Fraction(0, 0)):
+            restored = pickle.loads(pickle.dumps(frac))
+            self.assertIsInstance(restored, Fraction)
+            self.assertSameFraction(frac, restored)
+        # two small ints per fraction after the first
+        self.assertLess(len(pickle.dumps([Fraction(i, 7) for i in range(1000)])), 20000)
+
+    def test_from_string(self):
+        cases = {'3/4': (3, 4), ' -6/8 ': (-3, 4), '6/-8': (-3, 4), '+7': (7, 1), '-1/0': (-1, 0),
+                 '0/0': (0, 0), '0.875': (7, 8), '-.5': (-1, 2), '5.': (5, 1), '1.5/3': (1, 2),
+                 '2.5e-3': (1, 400), '1E3': (1000, 1), 'inf': (1, 0), '-Infinity': (-1, 0), 'NaN': (0, 0)}
+        for text, terms in cases.items():
+            frac = Fraction.from_string(text)
+            self.assertEqual(terms, (frac.numerator, frac.denominator), text)
+        # exact, unlike going through float
+        self.assertEqual(Fraction(1, 10**30), Fraction.from_string('0.' + '0' * 29 + '1'))
+        self.assertEqual(Fraction(2**64 + 1, 3), Fraction.from_string(f"{2**64 + 1}/3"))
+        for text in ('', '.', '/2', '1/', '1/2/3', '1/2.5', 'e3', '1 2', '0x10', 'infinit'):
+            with self.assertRaises(ValueError):
+                Fraction.from_string(text)
+
+    def test_parse_many(self):
+        strings = ['3/4', '-2', '0.1', '1/0', '0/0', '12.5e1']
+        self.assertEqual([Fraction.from_string(s) for s in strings[:4]], parse_many(strings)[:4])
+        self.assertTrue(parse_many(strings)[4].isnan())
+        self.assertEqual(Fraction(125), parse_many(iter(strings))[5])
+        self.assertEqual([], parse_many([]))
+        with self.assertRaises(ValueError):
+            parse_many(['1/2', 'x'])
+
+    def test_format(self):
+        # dyadic fractions are exact floats, and float formatting rounds exactly too
+        rng = random.Random(25)
+        specs = ['.0f', '.3f', '.10f', '+.2f', ' .1f', '>12.3f', '<12.3f', '^13.3f', '*^13.3f', '012.3f',
+                 '=+12.2f', ',.2f', '_.4f', '.2%', '.3F', '016,.2f', '0=17_.3f', '<015,.2f', '+020,.1%']
+        for _ in range(200):
+            a, b = rng.randint(-10**9, 10**9), 2 ** rng.randint(0, 20)
+            for spec in specs:
+                self.assertEqual(format(a / b, spec), format(Fraction(a, b), spec), spec)
+            # all the digits without a precision
+            self.assertEqual(format(a / b, '.20f').rstrip('0').rstrip('.'), format(Fraction(a, b), 'f'))
+        # repeating digits
+        self.assertEqual('0.(3)', format(Fraction(1, 3), 'f'))
+        self.assertEqual('-3.(142857)', format(Fraction(-22, 7), 'f'))
+        self.assertEqual('0.08(3)', format(Fraction(1, 12), 'f'))
+        # all the digits with '%' too, where float writes six
+        self.assertEqual('33.(3)%', format(Fraction(1, 3), '%'))
+        self.assertEqual('12.5%', format(Fraction(1, 8), '%'))
+        # zero padding is grouped with the digits, as for float
+        self.assertEqual('0,333,333.33', format(Fraction(10**6, 3), '012,.2f'))
+        self.assertEqual('0.333333333333333333333333333333', format(Fraction(1, 3), '.30f'))
+        self.assertEqual('2.50', format(Fraction(5, 2), '.2f'))
+        self.assertEqual('3', format(Fraction(3), 'f'))
+        self.assertEqual(format(Fraction(3, 10**40), '.50f'), '0.' + '0' * 39 + '3' + '0' * 10)
+        # without a type, like str
+        self.assertEqual('-3/4', format(Fraction(-3, 4), ''))
+        self.assertEqual('  -3/4', format(Fraction(-3, 4), '>6'))
+        self.assertEqual('1/0', f"{Fraction(1, 0)}")
+        # grouping applies to both terms, as to an int
+        self.assertEqual(format(10**6, ','), format(Fraction(10**6), ','))
+        self.assertEqual(format(10**6, '012_'), format(Fraction(10**6), '012_'))
+        self.assertEqual('-1,000,000/3', format(Fraction(-10**6, 3), ','))
+        for value, spec, expected in ((Fraction(1, 0), '.2f', 'inf'), (Fraction(-1, 0), 'f', '-inf'),
+                                      (Fraction(0, 0), 'F', 'NAN'), (Fraction(-1, 0), '>6.1%', ' -inf%')):
+            self.assertEqual(expected, format(value, spec))
+        self.assertEqual(format(1 / 7, '.15f'), format(Fraction(1, 7), '.15f'))
+        with self.assertRaises(ValueError):
+            # the digits of 1/10007 repeat every 10006 digits
+            format(Fraction(1, 10007), 'f')
+        self.assertEqual(1002, len(format(Fraction(1, 10007), '.1000f')))
+        # a precision without a type is float's general format, not supported
+        for spec in ('e', 'x', '.2g', '10.2.f', 'ff', '.2', ',.2'):
+            with self.assertRaises(ValueError):
+                format(Fraction(1, 3), spec)
+
+    def test_format_many(self):
+        values = [Fraction(1, 3), Fraction(-5, 2), 7, 0.5, Fraction(1, 0)]
+        self.assertEqual(''.join(format(Fraction(v), '.2f') + '\n' for v in values), format_many(values, '.2f'))
+        self.assertEqual('1/3,-5/2,7,1/2,1/0,', format_many(values, sep=','))
+        text = io.StringIO()
+        self.assertIsNone(format_many(iter(values * 3000), 'f', text))
+        self.assertEqual(15000, text.getvalue().count('\n'))
+        binary = io.BytesIO()
+        format_many(values, '.1f', binary, sep=';')
+        self.assertEqual(b'0.3;-2.5;7.0;0.5;inf;', binary.getvalue())
+        self.assertEqual('', format_many([]))
+        with self.assertRaises(TypeError):
+            format_many([Fraction(1), 'a'])
+
+    def test_float_cached(self):
+        frac = Fraction(10**30 + 1, 3)
+        self.assertIs(float(frac), float(frac))
+        self.assertEqual((10**30 + 1) / 3, float(frac))
+        self.assertEqual(float(frac), float(pickle.loads(pickle.dumps(frac))))
 
     def test_neg(self):
         self.assertEqual(Fraction(0), -Fraction(0))
@@ -247,6 +671,16 @@ class FractionTest(unittest.TestCase):
         self.assertEqual(Fraction(2, 5), -Fraction(-2, 5))
         self.assertTrue(Fraction(0, 0).__neg__().isnan())
 
+    def test_limit_denominator(self):
+        self.assertEqual(Fraction(355, 113), Fraction(math.pi).limit_denominator(1000))
+        self.assertEqual(Fraction(22, 7), Fraction(math.pi).limit_denominator(10))
+        self.assertEqual(Fraction(-1, 3), Fraction(-3333, 10000).limit_denominator(10))
+        self.assertEqual(Fraction(3, 7), Fraction(3, 7).limit_denominator(7))
+        self.assertEqual(Fraction(1, 0), Fraction(1, 0).limit_denominator(5))
+        self.assertTrue(Fraction(0, 0).limit_denominator(5).isnan())
+        with self.assertRaises(ValueError):
+            Fraction(1, 3).limit_denominator(0)
+
     def test_is_infinite(self):
         self.assertTrue(Fraction(1, 0).is_infinite())
         self.assertFalse(Fraction(0, 1).is_infinite())
@@ -262,5 +696,48 @@ class FractionTest(unittest.TestCase):
         self.assertTrue(Fraction(0, 0).isnan())
 
 
+class ReductionTest(FractionAssertions, unittest.TestCase):
+    """Test that fsum, fprod and fdot match repeated +, * and a dot product."""
+
+    def values(self, seed, special=()):
+        rng = random.Random(seed)
+        values = [Fraction(rng.randint(-10**9, 10**9), rng.choice([1, 100, 10000, rng.randint(1, 10**9)]))
+                  for _ in range(200)]
+        values += [rng.randint(-5, 5), rng.uniform(-5, 5)] + list(special)
+        rng.shuffle(values)
+        return values
+
+    def test_fsum(self):
+        for special in ([], [math.inf], [Fraction(-1, 0)], [math.inf, -math.inf], [Fraction(0, 0)],
+                        [Fraction(1, 0), Fraction(1, 0)]):
+            values = self.values(len(special), special)
+            self.assertSameFraction(functools.reduce(operator.add, values, Fraction(0)), fsum(values))
+        self.assertSameFraction(Fraction(0), fsum([]))
+        self.assertSameFraction(Fraction(0), fsum([Fraction(1, 3), Fraction(-1, 3)]))
+        self.assertSameFraction(Fraction(7, 2), fsum(iter([3, 0.5])))
+        with self.assertRaises(TypeError):
+            fsum([1, 'a'])
+
+    def test_fprod(self):
+        for special in ([], [math.inf], [Fraction(-1, 0), 0], [Fraction(0, 0)], [-math.inf, Fraction(-1, 0)]):
+            values = self.values(len(special), special)[:40]
+            self.assertSameFraction(functools.reduce(operator.mul, values, Fraction(1)), fprod(values))
+        self.assertSameFraction(Fraction(1), fprod([]))
+        self.assertSameFraction(Fraction(0), fprod([Fraction(1, 3), 0]))
+        with self.assertRaises(TypeError):
+            fprod([1, 'a'])
+
+    def test_fdot(self):
+        for special in ([], [math.inf], [math.nan], [Fraction(-1, 0), Fraction(0)]):
+            xs, ys = self.values(1, special), self.values(2, special)
+            expected = functools.reduce(operator.add, [(Fraction(0) + x) * y for x, y in zip(xs, ys)], Fraction(0))
+            self.assertSameFraction(expected, fdot(xs, ys))
+        self.assertSameFraction(Fraction(0), fdot([], []))
+        with self.assertRaises(ValueError):
+            fdot([1, 2], [3])
+        with self.assertRaises(ValueError):
+            fdot([1], [2, 3])
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+from fraction import Fraction, _coerce, _parse_terms, to_ratio
+
+# Terms are kept as int64 while every product and sum of an operation fits in
+# 63 bits; otherwise the arrays hold Python ints (object dtype).
+_MAX_BITS = 62
+
+
+def _bits(arr: np.ndarray) -> int:
+    """Return the bit length of the largest magnitude in `arr`."""
+    if arr.size == 0:
+        return 0
+    return int(np.max(np.abs(arr))).bit_length()
+
+
+def _array(values: list) -> np.ndarray:
+    """Return `values` (Python ints) as an int64 array if they fit, else as an object array."""
+    if values and max(map(abs, values)).bit_length() > _MAX_BITS:
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = values
+        return arr
+    return np.array(values, dtype=np.int64)
+
+
+def _cast(bits: int, *arrays: np.ndarray) -> list:
+    """Return `arrays` with a dtype that holds `bits`-bit results without overflow."""
+    dtype = np.dtype(np.int64) if bits <= _MAX_BITS else np.dtype(object)
+    return [arr if arr.dtype == dtype else arr.astype(dtype) for arr in arrays]
+
+
+def _normalized(numerators: np.ndarray, denominators: np.ndarray) -> FractionArray:
+    """Return a FractionArray of the given terms in proper form.
+       This is `fraction.to_proper` on every element at once.
+    """
+    gcd = np.gcd(numerators, denominators)
+    # gcd is 0 only for 0/0, which stays as it is
+    gcd = np.where(gcd == 0, 1, gcd)
+    gcd = np.where(denominators < 0, -gcd, gcd)
+    # for n/0 the gcd is |n|, so infinities become 1/0 and -1/0
+    numerators = numerators // gcd
+    denominators = denominators // gcd
+    if numerators.dtype == object and max(_bits(numerators), _bits(denominators)) <= _MAX_BITS:
+        numerators, denominators = numerators.astype(np.int64), denominators.astype(np.int64)
+    return FractionArray._from_proper(numerators, denominators)
+
+
+def _divide(n1: np.ndarray, d1: np.ndarray, n2: np.ndarray, d2: np.ndarray) -> FractionArray:
+    """Return n1/d1 / n2/d2 element-wise, the arrays broadcast against each other."""
+    bits = max(_bits(n1) + _bits(d2), _bits(d1) + _bits(n2))
+    n1, d1, n2, d2 = _cast(bits, n1, d1, n2, d2)
+    numerators = n1 * d2
+    denominators = d1 * n2
+    # because negative zero = zero
+    numerators = np.where((denominators == 0) & (n2 < 0), -numerators, numerators)
+    return _normalized(numerators, denominators)
+
+
+class FractionArray:
+    """A one-dimensional array of fractions with element-wise arithmetic.
+
+    Numerators and denominators are stored in two parallel NumPy arrays, as
+    int64 while they are small and as Python ints once they could overflow.
+    Operations work on whole arrays at once and give exactly the same results
+    as the same operations on each `Fraction`, including the conventions for
+    infinity (1/0 and -1/0) and NaN (0/0).
+
+    Attributes:
+        numerators (numpy.ndarray): the numerators, read-only
+        denominators (numpy.ndarray): the denominators, read-only
+    """
+
+    __slots__ = ('numerators', 'denominators')
+    # __eq__ compares element-wise, like for NumPy arrays
+    __hash__ = None
+    # NumPy scalars and arrays defer to the reflected operators instead of
+    # treating the array as an object
+    __array_ufunc__ = None
+
+    def __init__(self, values: Iterable = ()):
+        """Initialize a new array from an iterable of numbers of the types
+           Fraction operations take, e.g. ints, floats, Fractions and NumPy ints.
+        """
+        numerators, denominators = [], []
+        for value in values:
+            terms = _coerce(value)
+            if terms is None:
+                raise TypeError(f"values must be numbers like 'int', 'float' or 'Fraction', "
+                                f"not '{type(value).__name__}'")
+            numerators.append(terms[0])
+            denominators.append(terms[1])
+        numerators, denominators = _array(numerators), _array(denominators)
+        numerators, denominators = _cast(max(_bits(numerators), _bits(denominators)), numerators, denominators)
+        numerators.flags.writeable = denominators.flags.writeable = False
+        self.numerators, self.denominators = numerators, denominators
+
+    @classmethod
+    def from_terms(cls, numerators: Iterable[int], denominators: Iterable[int]) -> FractionArray:
+        """Return the array of fractions with the given numerators and denominators, reduced to proper form.
+
+        Examples:
+            >>> FractionArray.from_terms([2, 3, -4, 0], [4, 0, -6, 0])
+            FractionArray([1/2, 1/0, 2/3, 0/0])
+        """
+        numerators, denominators = _array(list(map(int, numerators))), _array(list(map(int, denominators)))
+        if numerators.shape != denominators.shape:
+            raise ValueError("numerators and denominators must have the same length")
+        return _normalized(*_cast(max(_bits(numerators), _bits(denominators)), numerators, denominators))
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> FractionArray:
+        """Return the array of the fractions written in `strings`, in the formats
+           of `Fraction.from_string`.  The terms are reduced for the whole array at once.
+
+        Examples:
+            >>> FractionArray.from_strings(['6/8', '-0.125', 'inf'])
+            FractionArray([3/4, -1/8, 1/0])
+        """
+        numerators, denominators = [], []
+        for text in strings:
+            numerator, denominator = _parse_terms(text)
+            numerators.append(numerator)
+            denominators.append(denominator)
+        return cls.from_terms(numerators, denominators)
+
+    @classmethod
+    def _from_proper(cls, numerators: np.ndarray, denominators: np.ndarray) -> FractionArray:
+        """Return a new array from terms already in proper form, skipping normalization."""
+        arr = object.__new__(cls)
+        numerators.flags.writeable = denominators.flags.writeable = False
+        arr.numerators, arr.denominators = numerators, denominators
+        return arr
+
+    def _operand(self, other, negate: bool = False) -> Union[Tuple[np.ndarray, np.ndarray], None]:
+        """Return the terms of `other`, or of -`other` if `negate`, as arrays
+           that broadcast against this array.
+        """
+        if isinstance(other, FractionArray):
+            return (-other.numerators if negate else other.numerators), other.denominators
+        terms = _coerce(other)
+        if terms is None:
+            return None
+        numerators, denominators = _array([-terms[0] if negate else terms[0]]), _array([terms[1]])
+        return numerators.reshape(()), denominators.reshape(())
+
+    def __len__(self):
+        return len(self.numerators)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FractionArray._from_proper(self.numerators[index], self.denominators[index])
+        return Fraction._from_proper(int(self.numerators[index]), int(self.denominators[index]))
+
+    def __iter__(self):
+        for numerator, denominator in zip(self.numerators, self.denominators):
+            yield Fraction._from_proper(int(numerator), int(denominator))
+
+    def __repr__(self):
+        return f"FractionArray([{', '.join(f'{n}/{d}' for n, d in zip(self.numerators, self.denominators))}])"
+
+    def tolist(self) -> list:
+        """Return the elements as a list of Fractions."""
+        return list(self)
+
+    def __add__(self, other: Union[int, float, Fraction, FractionArray]) -> FractionArray:
+        terms = self._operand(other)
+        if terms is None:
+            return NotImplemented
+        return self._add(*terms)
+
+    def __sub__(self, other: Union[int, float, Fraction, FractionArray]) -> FractionArray:
+        terms = self._operand(other, negate=True)
+        if terms is None:
+            return NotImplemented
+        return self._add(*terms)
+
+    def _add(self, n2: np.ndarray, d2: np.ndarray) -> FractionArray:
+        n1, d1 = self.numerators, self.denominators
+        bn1, bd1, bn2, bd2 = _bits(n1), _bits(d1), _bits(n2), _bits(d2)
+        n1, d1, n2, d2 = _cast(max(bn1 + bd2, bn2 + bd1, bd1 + bd2) + 1, n1, d1, n2, d2)
+        numerators = n1 * d2 + n2 * d1
+        denominators = d1 * d2
+        both_infinite = (d1 == 0) & (d2 == 0)
+        if both_infinite.any():
+            # inf + inf -> inf, inf + -inf and anything + nan -> indefinite
+            numerators = np.where(both_infinite, np.where(n1 == n2, n1, 0), numerators)
+        return _normalized(numerators, denominators)
+
+    def __mul__(self, other: Union[int, float, Fraction, FractionArray]) -> FractionArray:
+        terms = self._operand(other)
+        if terms is None:
+            return NotImplemented
+        n1, d1 = self.numerators, self.denominators
+        n2, d2 = terms
+        bits = max(_bits(n1) + _bits(n2), _bits(d1) + _bits(d2))
+        n1, d1, n2, d2 = _cast(bits, n1, d1, n2, d2)
+        return _normalized(n1 * n2, d1 * d2)
+
+    def __truediv__(self, other: Union[int, float, Fraction, FractionArray]) -> FractionArray:
+        terms = self._operand(other)
+        if terms is None:
+            return NotImplemented
+        return _divide(self.numerators, self.denominators, *terms)
+
+    def __radd__(self, other: Union[int, float, Fraction]) -> FractionArray:
+        return self + other
+
+    def __rsub__(self, other: Union[int, float, Fraction]) -> FractionArray:
+        return -self + other
+
+    def __rmul__(self, other: Union[int, float, Fraction]) -> FractionArray:
+        return self * other
+
+    def __rtruediv__(self, other: Union[int, float, Fraction]) -> FractionArray:
+        terms = self._operand(other)
+        if terms is None:
+            return NotImplemented
+        return _divide(*terms, self.numerators, self.denominators)
+
+    def __neg__(self):
+        return FractionArray._from_proper(-self.numerators, self.denominators)
+
+    def _cross(self, other) -> Union[Tuple[np.ndarray, np.ndarray, np.ndarray], None]:
+        """Return the cross products n1*d2 and n2*d1 of this array and `other`,
+           and the mask of elements where either side is NaN.
+        """
+        if isinstance(other, float):
+            # by its exact binary value, like Fraction comparisons
+            numerator, denominator = to_ratio(other, exact=True)
+            terms = _array([numerator]).reshape(()), _array([denominator]).reshape(())
+        else:
+            terms = self._operand(other)
+        if terms is None:
+            return None
+        n1, d1 = self.numerators, self.denominators
+        n2, d2 = terms
+        bits = max(_bits(n1) + _bits(d2), _bits(n2) + _bits(d1))
+        n1, d1, n2, d2 = _cast(bits, n1, d1, n2, d2)
+        nan = ((n1 == 0) & (d1 == 0)) | ((n2 == 0) & (d2 == 0))
+        # both infinite: the cross products are 0, so compare the signs
+        infinite = (d1 == 0) & (d2 == 0)
+        return np.where(infinite, n1, n1 * d2), np.where(infinite, n2, n2 * d1), nan
+
+    def __eq__(self, other) -> np.ndarray:
+        cross = self._cross(other)
+        if cross is None:
+            return np.zeros(len(self), dtype=bool)
+        left, right, nan = cross
+        return (left == right) & ~nan
+
+    def __ne__(self, other) -> np.ndarray:
+        return ~self.__eq__(other)
+
+    def __lt__(self, other) -> np.ndarray:
+        cross = self._cross(other)
+        if cross is None:
+            return NotImplemented
+        left, right, nan = cross
+        return (left < right) & ~nan
+
+    def __le__(self, other) -> np.ndarray:
+        cross = self._cross(other)
+        if cross is None:
+            return NotImplemented
+        left, right, nan = cross
+        return (left <= right) & ~nan
+
+    def __gt__(self, other) -> np.ndarray:
+        cross = self._cross(other)
+        if cross is None:
+            return NotImplemented
+        left, right, nan = cross
+        return (left > right) & ~nan
+
+    def __ge__(self, other) -> np.ndarray:
+        cross = self._cross(other)
+        if cross is None:
+            return NotImplemented
+        left, right, nan = cross
+        return (left >= right) & ~nan
+
+    def is_infinite(self) -> np.ndarray:
+        """Return a boolean array, True where the element is infinite."""
+        return (self.denominators == 0) & (self.numerators != 0)
+
+    def isnan(self) -> np.ndarray:
+        """Return a boolean array, True where the element is a NaN."""
+        return (self.denominators == 0) & (self.numerators == 0)
+
+
+if __name__ == '__main__':
+    """Run the doctests in all methods."""
+    import doctest
+    doctest.testmod(verbose=True)
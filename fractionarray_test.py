@@ -0,0 +1,133 @@
+import decimal
+import fractions
+import math
+import random
+import unittest
+
+from fraction import Fraction
+from fraction_test import FractionAssertions
+
+try:
+    import numpy
+    from fractionarray import FractionArray
+except ImportError:
+    numpy = None
+
+SPECIAL = [Fraction(1, 0), Fraction(-1, 0), Fraction(0, 0), Fraction(0), Fraction(-7, 3), Fraction(5)]
+
+
+@unittest.skipIf(numpy is None, "FractionArray needs numpy")
+class FractionArrayTest(FractionAssertions, unittest.TestCase):
+    """Test that FractionArray operations match the same Fraction operations."""
+
+    def assertSameFractions(self, expected, arr):
+        self.assertIsInstance(arr, FractionArray)
+        super().assertSameFractions(expected, arr)
+
+    def operands(self, bits):
+        rng = random.Random(bits)
+        values = [Fraction(rng.getrandbits(bits) - 2**(bits - 1), rng.getrandbits(bits) + 1) for _ in range(30)]
+        values += [Fraction(rng.randint(-3, 3), rng.randint(-3, 3)) for _ in range(30)]
+        return values + SPECIAL
+
+    def test_init(self):
+        arr = FractionArray([Fraction(6, -4), 3, 0.75, math.inf, math.nan])
+        self.assertSameFractions([Fraction(-3, 2), Fraction(3), Fraction(3, 4), Fraction(1, 0), Fraction(0, 0)], arr)
+        self.assertEqual(5, len(arr))
+        self.assertEqual(Fraction(3, 4), arr[2])
+        self.assertSameFractions([Fraction(3), Fraction(3, 4)], arr[1:3])
+        self.assertEqual(numpy.int64, arr.numerators.dtype)
+        self.assertEqual(0, len(FractionArray()))
+        self.assertSameFractions([Fraction(0), Fraction(1), Fraction(2)], FractionArray(numpy.arange(3)))
+        self.assertSameFractions([Fraction(3, 2), Fraction(2, 3)],
+                                 FractionArray([decimal.Decimal('1.5'), fractions.Fraction(4, 6)]))
+        with self.assertRaisesRegex(TypeError, r"not 'str'$"):
+            FractionArray(['1/2'])
+        with self.assertRaises(ValueError):
+            arr.numerators[0] = 1
+
+    def test_from_terms(self):
+        arr = FractionArray.from_terms([42, -36, 5, -2, 0, 0], [28, 54, 0, 0, 0, -9])
+        self.assertSameFractions([Fraction(3, 2), Fraction(-2, 3), Fraction(1, 0),
+                                  Fraction(-1, 0), Fraction(0, 0), Fraction(0)], arr)
+        arr = FractionArray.from_terms([3 * 2**100], [-6 * 2**90])
+        self.assertSameFractions([Fraction(-2**9)], arr)
+        self.assertEqual(numpy.int64, arr.numerators.dtype)
+        with self.assertRaises(ValueError):
+            FractionArray.from_terms([1, 2], [3])
+
+    def test_from_strings(self):
+        strings = ['6/8', '-0.125', 'inf', '-1/0', 'nan', '7', f"{3 * 2**70}/6"]
+        self.assertSameFractions([Fraction.from_string(s) for s in strings], FractionArray.from_strings(strings))
+        self.assertEqual(object, FractionArray.from_strings(strings).numerators.dtype)
+        self.assertEqual(numpy.int64, FractionArray.from_strings(strings[:-1]).numerators.dtype)
+        with self.assertRaises(ValueError):
+            FractionArray.from_strings(['1/2', ''])
+
+    def test_arithmetic(self):
+        for bits in (8, 40, 200):
+            xs = self.operands(bits)
+            ys = list(reversed(self.operands(bits + 1)))
+            arr_x, arr_y = FractionArray(xs), FractionArray(ys)
+            self.assertSameFractions([x + y for x, y in zip(xs, ys)], arr_x + arr_y)
+            self.assertSameFractions([x - y for x, y in zip(xs, ys)], arr_x - arr_y)
+            self.assertSameFractions([x * y for x, y in zip(xs, ys)], arr_x * arr_y)
+            self.assertSameFractions([x / y for x, y in zip(xs, ys)], arr_x / arr_y)
+            self.assertSameFractions([-x for x in xs], -arr_x)
+
+    def test_scalar_operands(self):
+        xs = self.operands(30)
+        arr = FractionArray(xs)
+        for other in [Fraction(2, 3), 0, -4, 2.5, math.inf, math.nan, 3**50, numpy.int64(-3), numpy.float64(0.25),
+                      decimal.Decimal('-1.5'), fractions.Fraction(3, 7)] + SPECIAL:
+            self.assertSameFractions([x + other for x in xs], arr + other)
+            self.assertSameFractions([x - other for x in xs], arr - other)
+            self.assertSameFractions([x * other for x in xs], arr * other)
+            self.assertSameFractions([x / other for x in xs], arr / other)
+            self.assertSameFractions([other + x for x in xs], other + arr)
+            self.assertSameFractions([other - x for x in xs], other - arr)
+            self.assertSameFractions([other * x for x in xs], other * arr)
+            self.assertSameFractions([other / x for x in xs], other / arr)
+        with self.assertRaises(TypeError):
+            arr + 'string'
+        with self.assertRaises(TypeError):
+            'string' / arr
+
+    def test_promotion(self):
+        big = FractionArray([Fraction(2**61 + 1, 3), Fraction(1, 2**61 - 1)])
+        self.assertEqual(numpy.int64, big.numerators.dtype)
+        product = big * big
+        self.assertEqual(object, product.numerators.dtype)
+        self.assertSameFractions([x * x for x in big], product)
+        # demoted back once the terms are small again
+        self.assertEqual(numpy.int64, (product / big).numerators.dtype)
+        self.assertSameFractions(list(big), product / big)
+
+    def test_comparisons(self):
+        infinities = [Fraction(1, 0), Fraction(-1, 0)]
+        xs = self.operands(70) + infinities * 2
+        ys = list(reversed(xs)) + infinities
+        xs += infinities[::-1]
+        arr_x, arr_y = FractionArray(xs), FractionArray(ys)
+        self.assertListEqual([x == y for x, y in zip(xs, ys)], list(arr_x == arr_y))
+        self.assertListEqual([x != y for x, y in zip(xs, ys)], list(arr_x != arr_y))
+        self.assertListEqual([x < y for x, y in zip(xs, ys)], list(arr_x < arr_y))
+        self.assertListEqual([x > y for x, y in zip(xs, ys)], list(arr_x > arr_y))
+        self.assertListEqual([x < y or x == y for x, y in zip(xs, ys)], list(arr_x <= arr_y))
+        self.assertListEqual([x > y or x == y for x, y in zip(xs, ys)], list(arr_x >= arr_y))
+        self.assertListEqual([x < 0.5 for x in xs], list(arr_x < 0.5))
+        tenth = xs + [Fraction(1, 10), Fraction(*(0.1).as_integer_ratio())]
+        self.assertListEqual([x == 0.1 for x in tenth], list(FractionArray(tenth) == 0.1))
+        self.assertListEqual([x < 0.1 for x in xs], list(arr_x < 0.1))
+        self.assertListEqual([False] * len(xs), list(arr_x == 'a'))
+        with self.assertRaises(TypeError):
+            arr_x < 'a'
+
+    def test_is_infinite_isnan(self):
+        arr = FractionArray(SPECIAL)
+        self.assertListEqual([f.is_infinite() for f in SPECIAL], list(arr.is_infinite()))
+        self.assertListEqual([f.isnan() for f in SPECIAL], list(arr.isnan()))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,277 @@
+"""Compact binary storage of Fractions, with random access through a memory map,
+and parsing of Fractions from CSV columns.
+
+A file holds a header, the records and an index of record offsets::
+
+    header   b'FRAC', version (1 byte), count (8 bytes), index offset (8 bytes)
+    records  one per fraction: a flags byte, then for finite fractions the
+             numerator and denominator magnitudes, each as a varint byte
+             length followed by that many little-endian bytes
+    index    the offset of every record, 8 bytes each
+
+All integers in the header and index are unsigned little-endian.  The
+flags byte marks negative numbers, infinities and NaN, which have no terms.
+
+Examples:
+    >>> decode(encode(Fraction(-3, 700)))
+    (-3/700, 6)
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from typing import IO, Iterable, Iterator, List, Tuple, Union
+import csv
+import math
+import mmap
+import struct
+import sys
+
+from fraction import Fraction, parse_many
+
+MAGIC = b'FRAC'
+VERSION = 1
+_HEADER = struct.Struct('<4sBQQ')
+_OFFSET = struct.Struct('<Q')
+# records are written in blocks of about this many bytes
+_BUFFER_SIZE = 1 << 20
+
+NEGATIVE = 0x01
+INFINITE = 0x02
+NAN = 0x04
+
+
+def _varint(n: int) -> bytes:
+    """Return `n` >= 0 as a LEB128 varint."""
+    out = bytearray()
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def _read_varint(buffer, offset: int) -> Tuple[int, int]:
+    """Return the varint at `offset` in `buffer` and the offset after it."""
+    n = shift = 0
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, offset
+        shift += 7
+
+
+def _magnitude(n: int) -> bytes:
+    size = (n.bit_length() + 7) // 8
+    return _varint(size) + n.to_bytes(size, 'little')
+
+
+def encode(frac: Fraction) -> bytes:
+    """Return the record of `frac`.
+
+    Examples:
+        >>> encode(Fraction(1, 0))
+        b'\\x02'
+        >>> encode(Fraction(-1, 2))
+        b'\\x01\\x01\\x01\\x01\\x02'
+    """
+    numerator, denominator = frac._numerator, frac._denominator
+    if denominator == 0:
+        if numerator == 0:
+            return bytes((NAN,))
+        return bytes((INFINITE | NEGATIVE if numerator < 0 else INFINITE,))
+    flags = 0
+    if numerator < 0:
+        flags, numerator = NEGATIVE, -numerator
+    numerator_size = (numerator.bit_length() + 7) // 8
+    denominator_size = (denominator.bit_length() + 7) // 8
+    if numerator_size < 0x80 and denominator_size < 0x80:
+        # both byte lengths are one byte varints, the common case: the
+        # whole record is then one little-endian integer, converted at once
+        record = ((denominator << 8 | denominator_size) << 8 * numerator_size | numerator) << 16
+        return (record | numerator_size << 8 | flags).to_bytes(3 + numerator_size + denominator_size, 'little')
+    return bytes((flags,)) + _magnitude(numerator) + _magnitude(denominator)
+
+
+def decode(buffer, offset: int = 0) -> Tuple[Fraction, int]:
+    """Return the fraction recorded at `offset` in `buffer` and the offset after the record.
+
+    Raises:
+        ValueError: if the record is truncated or its terms are not in proper form
+    """
+    start = offset
+    try:
+        flags = buffer[offset]
+        offset += 1
+        if flags & NAN:
+            return Fraction._from_proper(0, 0), offset
+        if flags & INFINITE:
+            return Fraction._from_proper(-1 if flags & NEGATIVE else 1, 0), offset
+        size = buffer[offset]
+        if size < 0x80:
+            offset += 1
+        else:
+            size, offset = _read_varint(buffer, offset)
+        numerator = int.from_bytes(buffer[offset:offset + size], 'little')
+        offset += size
+        size = buffer[offset]
+        if size < 0x80:
+            offset += 1
+        else:
+            size, offset = _read_varint(buffer, offset)
+    except IndexError:
+        raise ValueError(f"truncated fraction record at offset {start}") from None
+    denominator = int.from_bytes(buffer[offset:offset + size], 'little')
+    offset += size
+    if offset > len(buffer):
+        raise ValueError(f"truncated fraction record at offset {start}")
+    # finite fractions have a positive denominator and no common factor
+    if denominator == 0 or math.gcd(numerator, denominator) != 1:
+        raise ValueError(f"fraction record at offset {start} is not in proper form")
+    return Fraction._from_proper(-numerator if flags & NEGATIVE else numerator, denominator), offset
+
+
+def dump(values: Iterable[Union[int, float, Fraction]], path: str) -> int:
+    """Write `values` to a new file at `path`, return the number written.
+
+    The records are streamed to the file; only the index, 8 bytes per
+    value, is kept in memory until it is written at the end.
+    """
+    offsets = array('Q')
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, 0))
+        position = _HEADER.size
+        records = bytearray()
+        for value in values:
+            offsets.append(position + len(records))
+            records += encode(value if isinstance(value, Fraction) else Fraction(value))
+            if len(records) >= _BUFFER_SIZE:
+                f.write(records)
+                position += len(records)
+                records.clear()
+        f.write(records)
+        position += len(records)
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        f.write(offsets.tobytes())
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, len(offsets), position))
+    return len(offsets)
+
+
+class FractionFile(Sequence):
+    """A read-only sequence of the fractions in a file written by `dump`.
+
+    The file is memory-mapped and a fraction is only decoded when it is
+    accessed, so opening even a very large file is immediate and random
+    access reads only the index entry and the record.
+
+    Examples:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'fractions.bin')
+        >>> dump([Fraction(1, 3), 2, -0.5], path)
+        3
+        >>> with FractionFile(path) as fractions:
+        ...     fractions[2], len(fractions), list(fractions)
+        (-1/2, 3, [1/3, 2, -1/2])
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a fraction file")
+        magic, version, self._count, self._index = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a fraction file")
+        if version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"unsupported fraction file version {version}")
+        if not _HEADER.size <= self._index <= len(self._mmap) - self._count * _OFFSET.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("fraction file index out of range")
+        offset, = _OFFSET.unpack_from(self._mmap, self._index + index * _OFFSET.size)
+        return decode(self._mmap, offset)[0]
+
+    def __iter__(self) -> Iterator[Fraction]:
+        # records are stored in order, so the index is not needed
+        offset = _HEADER.size
+        for _ in range(self._count):
+            frac, offset = decode(self._mmap, offset)
+            yield frac
+
+    def close(self):
+        """Unmap the file."""
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_column(file: IO[str], column: Union[int, str] = 0, delimiter: str = ',', header: bool = False,
+                packed: bool = False) -> Union[List[Fraction], 'FractionArray']:
+    """Return the fractions in one column of the CSV `file`, parsed exactly
+       in the formats of `Fraction.from_string`.  Blank lines are skipped.
+
+    Args:
+        file: an open text file, or any iterable of lines
+        column (int or str): index of the column, or its name in the header row
+        delimiter (str): the CSV field separator
+        header (bool): skip the first row, always done when `column` is a name
+        packed (bool): return a `FractionArray` instead of a list, needs numpy
+
+    Raises:
+        ValueError: if a cell is not a fraction, a row has no such column,
+            or `column` is not in the header
+
+    Examples:
+        >>> read_column(['price,qty', '0.25,3/4', '', '-1.5,1/0'], 'qty')
+        [3/4, 1/0]
+        >>> read_column(['price,qty', '0.25,3/4'], 1, header=True)
+        [3/4]
+    """
+    rows = csv.reader(file, delimiter=delimiter)
+    if header or isinstance(column, str):
+        names = next(rows, [])
+        if isinstance(column, str):
+            if column not in names:
+                raise ValueError(f"no column {column!r} in the header")
+            column = names.index(column)
+
+    def cells() -> Iterator[str]:
+        for row in rows:
+            if not row:
+                continue
+            try:
+                yield row[column]
+            except IndexError:
+                raise ValueError(f"no column {column} in line {rows.line_num}") from None
+
+    if packed:
+        from fractionarray import FractionArray
+        return FractionArray.from_strings(cells())
+    return parse_many(cells())
+
+
+if __name__ == '__main__':
+    """Run the doctests in all methods."""
+    import doctest
+    doctest.testmod(verbose=True)
@@ -0,0 +1,124 @@
+import collections.abc
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from fraction import Fraction
+from fraction_test import FractionAssertions
+from fractionio import FractionFile, decode, dump, encode, read_column
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class FractionIOTest(FractionAssertions, unittest.TestCase):
+    """Test the binary records and the memory-mapped file of Fractions."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'fractions.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def values(self):
+        rng = random.Random(15)
+        values = [Fraction(1, 0), Fraction(-1, 0), Fraction(0, 0), Fraction(0), Fraction(-1), Fraction(255, 256)]
+        values += [Fraction(rng.getrandbits(bits) - 2**(bits - 1), rng.getrandbits(bits) + 1)
+                   for bits in (8, 64, 200, 1100) for _ in range(20)]
+        return values
+
+    def test_encode_decode(self):
+        buffer = b''.join(encode(value) for value in self.values())
+        offset, decoded = 0, []
+        while offset < len(buffer):
+            frac, offset = decode(buffer, offset)
+            decoded.append(frac)
+        self.assertSameFractions(self.values(), decoded)
+        self.assertEqual(b'\x04', encode(Fraction(0, 0)))
+        self.assertEqual(b'\x03', encode(Fraction(-1, 0)))
+        self.assertEqual(b'\x00\x00\x01\x01', encode(Fraction(0)))
+        # 2/4, 3/0 and cut-off records are corrupt
+        for record in (b'\x00\x01\x02\x01\x04', b'\x00\x01\x03\x00', encode(Fraction(1, 3))[:-1], b'\x00\x01'):
+            with self.assertRaises(ValueError):
+                decode(record)
+
+    def test_long_terms(self):
+        # byte lengths of 128 and more need a multi-byte varint
+        frac = Fraction(-2**1100 - 1, 3**700)
+        record = encode(frac)
+        self.assertEqual(len(record), decode(record)[1])
+        self.assertSameFractions([frac], [decode(record)[0]])
+
+    def test_dump_and_read(self):
+        values = self.values()
+        self.assertEqual(len(values) + 2, dump(values + [3, 0.1], self.path))
+        with FractionFile(self.path) as fractions:
+            self.assertEqual(len(values) + 2, len(fractions))
+            self.assertSameFractions(values + [Fraction(3), Fraction(1, 10)], list(fractions))
+            self.assertSameFractions([values[-1]], [fractions[len(values) - 1]])
+            self.assertSameFractions([Fraction(1, 10)], [fractions[-1]])
+            self.assertSameFractions(values[5:30:3], fractions[5:30:3])
+            with self.assertRaises(IndexError):
+                fractions[len(values) + 2]
+            self.assertIsInstance(fractions, collections.abc.Sequence)
+            self.assertIn(Fraction(3), fractions)
+            self.assertEqual(len(values), fractions.index(Fraction(3)))
+            self.assertSameFraction(Fraction(1, 10), next(reversed(fractions)))
+
+    def test_random_access(self):
+        values = self.values()
+        dump(iter(values * 100), self.path)
+        rng = random.Random(0)
+        with FractionFile(self.path) as fractions:
+            for index in rng.sample(range(len(fractions)), 200):
+                self.assertSameFractions([values[index % len(values)]], [fractions[index]])
+
+    def test_empty(self):
+        self.assertEqual(0, dump([], self.path))
+        with FractionFile(self.path) as fractions:
+            self.assertEqual([], list(fractions))
+
+    def test_not_a_fraction_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'n/d\n' * 10)
+        with self.assertRaises(ValueError):
+            FractionFile(self.path)
+        # shorter than the header, and cut off in the index
+        with open(self.path, 'wb') as f:
+            f.write(b'FRAC')
+        with self.assertRaises(ValueError):
+            FractionFile(self.path)
+        dump([Fraction(1, 3), Fraction(2, 3)], self.path)
+        with open(self.path, 'r+b') as f:
+            f.truncate(os.path.getsize(self.path) - 1)
+        with self.assertRaises(ValueError):
+            FractionFile(self.path)
+
+    def test_read_column(self):
+        file = io.StringIO('id;price\n1;0.25\n2;-3/4\n3;1/0\n')
+        self.assertEqual([Fraction(1, 4), Fraction(-3, 4), Fraction(1, 0)], read_column(file, 'price', delimiter=';'))
+        self.assertEqual([Fraction(1), Fraction(2)], read_column(['1,a', '2,b'], 0))
+        with self.assertRaises(ValueError):
+            read_column(['id,price', '1,0.5'], 'qty')
+        with self.assertRaises(ValueError):
+            read_column(['id,price', '1,'], 'price')
+        # blank lines are skipped, and a header row too if asked for
+        file = io.StringIO('id,price\n\n1,0.25\n\n2,-3/4\n')
+        self.assertEqual([Fraction(1, 4), Fraction(-3, 4)], read_column(file, 1, header=True))
+        self.assertEqual([Fraction(1), Fraction(2)], read_column(['1,a', '', '2,b'], 0))
+        with self.assertRaises(ValueError):
+            read_column(['1,0.5', '2'], 1)
+
+    @unittest.skipIf(numpy is None, "packed columns need numpy")
+    def test_read_column_packed(self):
+        arr = read_column(['price', '0.25', '', '-3/4', 'nan'], 'price', packed=True)
+        self.assertEqual([(1, 4), (-3, 4), (0, 0)], [(f.numerator, f.denominator) for f in arr])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,179 @@
+"""Opt-in instrumentation of the hot paths of `fraction`.
+
+`enable` replaces the operators of Fraction, `to_proper`, `to_ratio` and
+the operand coercion with wrappers that count calls, cumulative time and
+the bit lengths of operands; `disable` puts the originals back, so nothing
+is measured or slowed down while instrumentation is off.  The wrappers keep
+the names of the functions they wrap, so they also show up as usual in
+`cProfile` output.
+
+Only calls made through the `fraction` module and the Fraction class are
+counted: modules that imported a function by name, such as `to_proper` in
+`lazyfraction`, `fixedfraction` and `matrix` or `_coerce` in
+`fractionarray`, keep calling the original.  A `fraction.configure_cache`
+while enabled replaces the instrumented float cache with a new one, which
+is no longer timed, and which `disable` leaves in place.
+
+Examples:
+    >>> with instrumented():
+    ...     _ = Fraction(1, 3) + 2
+    >>> snapshot()['calls']['__add__']
+    1
+"""
+from contextlib import contextmanager
+from typing import Callable, Dict
+import functools
+import json
+import time
+
+import fraction
+from fraction import Fraction
+
+# timed functions of the fraction module, by the name they are reported as
+_FUNCTIONS = {'to_proper': 'to_proper', 'to_ratio': 'to_ratio', '_float_ratio': 'to_ratio'}
+# the operand coercion helper, and the position of the operand in its arguments
+_COERCIONS = {'_coerce': 0}
+_OPERATORS = ('__new__', '__add__', '__sub__', '__mul__', '__truediv__', '__neg__',
+              '__radd__', '__rsub__', '__rmul__', '__rtruediv__', '__pow__', '__rpow__',
+              '__floordiv__', '__rfloordiv__', '__mod__', '__rmod__', '__divmod__', '__rdivmod__',
+              '__abs__', '__float__', '__hash__',
+              '__lt__', '__le__', '__gt__', '__ge__', '__eq__')
+
+_calls: Dict[str, int] = {}
+_nanoseconds: Dict[str, int] = {}
+_operand_bits: Dict[int, int] = {}
+# (original, wrapper) of the attributes replaced while enabled, by (owner, name)
+_originals = {}
+
+
+def _record(name: str, start: int):
+    _calls[name] = _calls.get(name, 0) + 1
+    _nanoseconds[name] = _nanoseconds.get(name, 0) + time.perf_counter_ns() - start
+
+
+def _record_bits(value):
+    """Count the size of an operand in the histogram, in power of two buckets."""
+    if isinstance(value, Fraction):
+        bits = max(abs(value.numerator).bit_length(), value.denominator.bit_length())
+    elif isinstance(value, int):
+        bits = abs(value).bit_length()
+    else:
+        return
+    bucket = 1 << (bits - 1).bit_length() if bits > 1 else bits
+    _operand_bits[bucket] = _operand_bits.get(bucket, 0) + 1
+
+
+def _timed(name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(name, start)
+    return wrapper
+
+
+def _timed_coercion(func: Callable, position: int) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            _record(f"coerce/{type(args[position]).__name__}", start)
+    return wrapper
+
+
+def _timed_operator(name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args):
+        for arg in args[:2]:
+            _record_bits(arg)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            _record(name, start)
+    return wrapper
+
+
+def _replace(owner, name: str, wrapper: Callable):
+    original = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+    _originals[owner, name] = original, wrapper
+    setattr(owner, name, wrapper)
+
+
+def is_enabled() -> bool:
+    """Return True if the instrumentation is enabled."""
+    return bool(_originals)
+
+
+def enable():
+    """Start counting calls, time and operand sizes.  Does nothing if already enabled."""
+    if is_enabled():
+        return
+    for name, label in _FUNCTIONS.items():
+        _replace(fraction, name, _timed(label, getattr(fraction, name)))
+    for name, position in _COERCIONS.items():
+        _replace(fraction, name, _timed_coercion(getattr(fraction, name), position))
+    for name in _OPERATORS:
+        if name == '__new__':
+            # the operand sizes of a constructor call are those after normalization
+            _replace(Fraction, name, staticmethod(_timed(name, Fraction.__dict__[name].__func__)))
+        else:
+            _replace(Fraction, name, _timed_operator(name, Fraction.__dict__[name]))
+
+
+def disable():
+    """Stop counting and restore the original functions.  The counts are kept until `reset`."""
+    for (owner, name), (original, wrapper) in _originals.items():
+        current = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+        # rebound meanwhile, e.g. the float cache by configure_cache: keep the newer one
+        if current is wrapper:
+            setattr(owner, name, original)
+    _originals.clear()
+
+
+def reset():
+    """Clear all counts."""
+    _calls.clear()
+    _nanoseconds.clear()
+    _operand_bits.clear()
+
+
+@contextmanager
+def instrumented():
+    """Context manager enabling the instrumentation inside its block, from fresh counts."""
+    reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot() -> dict:
+    """Return the counts so far.
+
+    Returns:
+        dict: ``calls`` and ``seconds`` (cumulative, including nested calls)
+        by operation, and ``operand_bits``, the number of operator operands
+        by bit length rounded up to a power of two
+    """
+    return {
+        'calls': dict(_calls),
+        'seconds': {name: ns / 1e9 for name, ns in _nanoseconds.items()},
+        'operand_bits': dict(sorted(_operand_bits.items())),
+    }
+
+
+def to_json() -> str:
+    """Return `snapshot` as a JSON string."""
+    return json.dumps(snapshot(), sort_keys=True)
+
+
+if __name__ == '__main__':
+    """Run the doctests in all methods."""
+    import doctest
+    doctest.testmod(verbose=True)
@@ -0,0 +1,102 @@
+import json
+import unittest
+
+import fraction
+import instrument
+from fraction import Fraction
+
+
+class InstrumentTest(unittest.TestCase):
+    """Test the opt-in instrumentation of Fraction."""
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+
+    def test_counts(self):
+        with instrument.instrumented():
+            x = Fraction(1, 3) + 2
+            x = x * Fraction(2**40, 3) - 0.5
+            self.assertTrue(x > 1)
+        info = instrument.snapshot()
+        self.assertEqual(2, info['calls']['__new__'])
+        self.assertEqual(1, info['calls']['__add__'])
+        self.assertEqual(1, info['calls']['__mul__'])
+        self.assertEqual(1, info['calls']['__sub__'])
+        self.assertEqual(1, info['calls']['__gt__'])
+        self.assertEqual(2, info['calls']['coerce/int'])
+        self.assertEqual(1, info['calls']['coerce/Fraction'])
+        self.assertEqual(1, info['calls']['coerce/float'])
+        # and once more if 0.5 was not in the float cache yet
+        self.assertIn(info['calls']['to_proper'], (2, 3))
+        self.assertEqual(1, info['calls']['to_ratio'])
+        self.assertEqual(set(info['calls']), set(info['seconds']))
+        self.assertEqual(7, sum(info['operand_bits'].values()))
+        self.assertEqual(3, info['operand_bits'][64])
+        self.assertEqual(info, json.loads(instrument.to_json(), object_hook=lambda d: {
+            int(k) if k.isdigit() else k: v for k, v in d.items()}))
+
+    def test_counts_other_operators(self):
+        with instrument.instrumented():
+            x = 1 - Fraction(1, 3) ** 2
+            x = 2 / (x // Fraction(1, 7) + x % Fraction(1, 7)) * 3
+            x = 2 ** Fraction(3) + 1.5 * x
+            x = 1 // x + 1 % x
+        info = instrument.snapshot()
+        for name in ('__rpow__', '__floordiv__', '__rfloordiv__', '__mod__', '__rmod__',
+                     '__rsub__', '__rtruediv__', '__rmul__', '__add__'):
+            self.assertEqual(1, info['calls'][name], name)
+        # an int floor quotient plus a Fraction, twice
+        self.assertEqual(2, info['calls']['__radd__'])
+        # __rpow__ raises with __pow__
+        self.assertEqual(2, info['calls']['__pow__'])
+
+    def test_counts_conversions(self):
+        with instrument.instrumented():
+            divmod(Fraction(7, 2), 2)
+            divmod(7, Fraction(2))
+            abs(Fraction(-1, 3))
+            float(Fraction(1, 3))
+            hash(Fraction(1, 3))
+        info = instrument.snapshot()
+        for name in ('__divmod__', '__rdivmod__', '__abs__', '__float__', '__hash__'):
+            self.assertEqual(1, info['calls'][name], name)
+
+    def test_configure_cache_while_enabled(self):
+        size = fraction.cache_info()['float_maxsize']
+        try:
+            with instrument.instrumented():
+                fraction.configure_cache(float_cache_size=size + 1)
+                cache = fraction._float_ratio
+            # the new cache, not the one saved by enable
+            self.assertIs(cache, fraction._float_ratio)
+            self.assertEqual(size + 1, fraction.cache_info()['float_maxsize'])
+        finally:
+            fraction.configure_cache(float_cache_size=size)
+
+    def test_disabled(self):
+        add, new, to_proper = Fraction.__dict__['__add__'], Fraction.__dict__['__new__'], fraction.to_proper
+        instrument.enable()
+        self.assertTrue(instrument.is_enabled())
+        self.assertIsNot(add, Fraction.__dict__['__add__'])
+        instrument.enable()
+        instrument.disable()
+        self.assertFalse(instrument.is_enabled())
+        self.assertIs(add, Fraction.__dict__['__add__'])
+        self.assertIs(new, Fraction.__dict__['__new__'])
+        self.assertIs(to_proper, fraction.to_proper)
+        Fraction(1, 2) + 1
+        self.assertEqual({}, instrument.snapshot()['calls'])
+
+    def test_results_unchanged(self):
+        with instrument.instrumented():
+            self.assertEqual(Fraction(3, 4), Fraction(1, 12) + Fraction(2, 3))
+            self.assertTrue((Fraction(1, 0) - Fraction(1, 0)).isnan())
+            with self.assertRaises(TypeError):
+                Fraction(3, 4) + 'string'
+            with self.assertRaises(TypeError):
+                Fraction('1')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import Tuple, Union
+
+import fraction
+from fraction import Fraction, _add, _comparable, _div, _mul, to_proper
+
+
+class LazyFraction:
+    """A fraction that is only reduced to proper form when its value is observed.
+
+    Arithmetic on finite LazyFractions just multiplies out numerators and
+    denominators, without the gcd that `Fraction` computes after every
+    operation.  The value is reduced on `repr`, comparisons, `float`,
+    hashing, reading `numerator` or `denominator`, converting with
+    `to_fraction`, and whenever a term grows past `reduce_bits` bits.
+    Results are always equal to the same computation with Fraction,
+    including the conventions for infinity (1/0) and NaN (0/0).
+
+    Examples:
+        >>> x = LazyFraction(1, 6) * 4 + LazyFraction(1, 3) - 0.5
+        >>> x
+        1/2
+        >>> LazyFraction(1, 0) - LazyFraction(1, 0)
+        0/0
+    """
+
+    __slots__ = ('_numerator', '_denominator')
+    # terms are reduced as soon as either is longer than this
+    reduce_bits = 1024
+
+    def __init__(self, numerator, denominator=1):
+        """Initialize a new lazy fraction with the given numerator and
+           denominator (default 1), like `Fraction`, or from a Fraction.
+        """
+        if isinstance(numerator, LazyFraction) and denominator == 1:
+            self._numerator, self._denominator = numerator._numerator, numerator._denominator
+        elif isinstance(numerator, Fraction) and denominator == 1:
+            self._numerator, self._denominator = numerator.numerator, numerator.denominator
+        elif isinstance(numerator, int) and isinstance(denominator, int) and denominator > 0:
+            self._numerator, self._denominator = numerator, denominator
+        else:
+            frac = Fraction(numerator, denominator)
+            self._numerator, self._denominator = frac.numerator, frac.denominator
+
+    @classmethod
+    def _from_terms(cls, numerator: int, denominator: int) -> LazyFraction:
+        """Return a lazy fraction of the given terms, with a positive
+           denominator unless they are in proper form.
+        """
+        frac = object.__new__(cls)
+        frac._numerator, frac._denominator = numerator, denominator
+        if numerator.bit_length() > cls.reduce_bits or denominator.bit_length() > cls.reduce_bits:
+            frac._reduce()
+        return frac
+
+    @classmethod
+    def _from_fraction(cls, frac: Fraction) -> LazyFraction:
+        lazy = object.__new__(cls)
+        lazy._numerator, lazy._denominator = frac.numerator, frac.denominator
+        return lazy
+
+    def _reduce(self):
+        # same value, so reducing in place does not change the fraction
+        self._numerator, self._denominator = to_proper(self._numerator, self._denominator)
+
+    def to_fraction(self) -> Fraction:
+        """Return the value as a Fraction."""
+        self._reduce()
+        return Fraction._from_proper(self._numerator, self._denominator)
+
+    @property
+    def numerator(self) -> int:
+        self._reduce()
+        return self._numerator
+
+    @property
+    def denominator(self) -> int:
+        self._reduce()
+        return self._denominator
+
+    @staticmethod
+    def _terms(other) -> Union[Tuple[int, int], None]:
+        """Return the terms of an operand, or None if it is not a number.
+           Operands other than LazyFraction are those Fraction takes.
+        """
+        if isinstance(other, LazyFraction):
+            return other._numerator, other._denominator
+        return fraction._coerce(other)
+
+    def __add__(self, other: Union[int, float, Fraction, LazyFraction]) -> LazyFraction:
+        terms = self._terms(other)
+        if terms is None:
+            return NotImplemented
+        na, da = self._numerator, self._denominator
+        nb, db = terms
+        if da and db:
+            return LazyFraction._from_terms(na * db + nb * da, da * db)
+        return LazyFraction._from_fraction(_add(*to_proper(na, da), *to_proper(nb, db)))
+
+    def __radd__(self, other: Union[int, float, Fraction]) -> LazyFraction:
+        return self + other
+
+    def __sub__(self, other: Union[int, float, Fraction, LazyFraction]) -> LazyFraction:
+        terms = self._terms(other)
+        if terms is None:
+            return NotImplemented
+        return self + LazyFraction._from_terms(-terms[0], terms[1])
+
+    def __rsub__(self, other: Union[int, float, Fraction]) -> LazyFraction:
+        return -self + other
+
+    def __mul__(self, other: Union[int, float, Fraction, LazyFraction]) -> LazyFraction:
+        terms = self._terms(other)
+        if terms is None:
+            return NotImplemented
+        na, da = self._numerator, self._denominator
+        nb, db = terms
+        if da and db:
+            return LazyFraction._from_terms(na * nb, da * db)
+        return LazyFraction._from_fraction(_mul(*to_proper(na, da), *to_proper(nb, db)))
+
+    def __rmul__(self, other: Union[int, float, Fraction]) -> LazyFraction:
+        return self * other
+
+    def __truediv__(self, other: Union[int, float, Fraction, LazyFraction]) -> LazyFraction:
+        terms = self._terms(other)
+        if terms is None:
+            return NotImplemented
+        na, da = self._numerator, self._denominator
+        nb, db = terms
+        if da and db and nb:
+            if nb < 0:
+                return LazyFraction._from_terms(-na * db, -da * nb)
+            return LazyFraction._from_terms(na * db, da * nb)
+        return LazyFraction._from_fraction(_div(*to_proper(na, da), *to_proper(nb, db)))
+
+    def __rtruediv__(self, other: Union[int, float, Fraction]) -> LazyFraction:
+        terms = self._terms(other)
+        if terms is None:
+            return NotImplemented
+        return LazyFraction._from_terms(*terms) / self
+
+    def __neg__(self):
+        return LazyFraction._from_terms(-self._numerator, self._denominator)
+
+    def __eq__(self, other):
+        return self.to_fraction() == _comparable(other)
+
+    def __lt__(self, other):
+        return self.to_fraction() < _comparable(other)
+
+    def __le__(self, other):
+        return self.to_fraction() <= _comparable(other)
+
+    def __gt__(self, other):
+        return self.to_fraction() > _comparable(other)
+
+    def __ge__(self, other):
+        return self.to_fraction() >= _comparable(other)
+
+    def __hash__(self):
+        return hash(self.to_fraction())
+
+    def __float__(self):
+        return float(self.to_fraction())
+
+    def __bool__(self):
+        """Zero is false and NaN is true, as with Fraction, without reducing the terms."""
+        return self._numerator != 0 or self._denominator == 0
+
+    def __repr__(self):
+        return repr(self.to_fraction())
+
+    def __str__(self):
+        return self.__repr__()
+
+    def is_infinite(self):
+        """Returns True if limit of the fraction tends to infinity."""
+        return self.to_fraction().is_infinite()
+
+    def isnan(self):
+        """ Return True if fraction is a NaN (not a number), and False otherwise."""
+        return self.to_fraction().isnan()
+
+
+if __name__ == '__main__':
+    """Run the doctests in all methods."""
+    import doctest
+    doctest.testmod(verbose=True)
@@ -0,0 +1,93 @@
+import decimal
+import fractions
+import math
+import random
+import unittest
+
+from fraction import Fraction
+from fraction_test import FractionAssertions
+from lazyfraction import LazyFraction
+
+SPECIAL = [Fraction(1, 0), Fraction(-1, 0), Fraction(0, 0), Fraction(0)]
+
+
+class LazyFractionTest(FractionAssertions, unittest.TestCase):
+    """Test that LazyFraction gives the same results as Fraction."""
+
+    def assertSameValue(self, expected, lazy):
+        self.assertIsInstance(lazy, LazyFraction)
+        self.assertSameFraction(expected, lazy)
+
+    def test_init(self):
+        self.assertSameValue(Fraction(-2, 3), LazyFraction(4, -6))
+        self.assertSameValue(Fraction(2, 3), LazyFraction(Fraction(2, 3)))
+        self.assertSameValue(Fraction(3, 4), LazyFraction(0.75))
+        self.assertSameValue(Fraction(-1, 0), LazyFraction(-5, 0))
+        self.assertSameValue(Fraction(1, 2), LazyFraction(LazyFraction(2, 4)))
+        with self.assertRaises(TypeError):
+            LazyFraction('1/2')
+
+    def test_chains(self):
+        rng = random.Random(14)
+        values = [Fraction(rng.randint(-50, 50), rng.randint(1, 50)) for _ in range(40)] + SPECIAL
+        operators = [lambda x, y: x + y, lambda x, y: x - y, lambda x, y: x * y, lambda x, y: x / y]
+        for _ in range(300):
+            eager = rng.choice(values)
+            lazy = LazyFraction(eager)
+            for _ in range(8):
+                op = rng.choice(operators)
+                other = rng.choice(values + [rng.randint(-3, 3), 0.25])
+                eager = op(eager, other)
+                lazy = op(lazy, other if rng.random() < 0.5 else (
+                    LazyFraction(other) if not isinstance(other, float) else other))
+            self.assertSameValue(eager, lazy)
+
+    def test_reflected(self):
+        self.assertSameValue(Fraction(5, 2), 2 + LazyFraction(1, 2))
+        self.assertSameValue(Fraction(3, 2), 2 - LazyFraction(1, 2))
+        self.assertSameValue(Fraction(1), 2 * LazyFraction(1, 2))
+        self.assertSameValue(Fraction(4), 2 / LazyFraction(1, 2))
+        self.assertSameValue(Fraction(1, 0), 1.0 / LazyFraction(0))
+        # Fraction defers to LazyFraction for the other order
+        self.assertIsInstance(Fraction(1, 2) + LazyFraction(1, 3), LazyFraction)
+        self.assertSameValue(Fraction(1, 6), Fraction(1, 2) - LazyFraction(1, 3))
+        self.assertSameValue(Fraction(3, 2), Fraction(1, 2) / LazyFraction(1, 3))
+        # the other operands Fraction takes
+        self.assertSameValue(Fraction(2), LazyFraction(1, 2) + decimal.Decimal('1.5'))
+        self.assertSameValue(Fraction(-1, 6), fractions.Fraction(1, 3) - LazyFraction(1, 2))
+        self.assertSameValue(Fraction(1, 0), LazyFraction(1, 2) * decimal.Decimal('inf'))
+        self.assertTrue(LazyFraction(3, 2) == decimal.Decimal('1.5') and LazyFraction(1, 3) < fractions.Fraction(1, 2))
+        with self.assertRaises(TypeError):
+            LazyFraction(1, 2) + 'a'
+
+    def test_deferred(self):
+        x = LazyFraction(1, 6) * 3
+        self.assertEqual((3, 6), (x._numerator, x._denominator))
+        self.assertEqual("1/2", repr(x))
+        self.assertEqual((1, 2), (x._numerator, x._denominator))
+
+    def test_reduce_bits(self):
+        x = LazyFraction(1)
+        for i in range(200):
+            x = x * LazyFraction(2**20 + i, 2**20 + i)
+            self.assertLessEqual(x._denominator.bit_length(), LazyFraction.reduce_bits + 21)
+        self.assertTrue(x == 1)
+
+    def test_observers(self):
+        x = LazyFraction(6, 8)
+        self.assertEqual(0.75, float(x))
+        self.assertEqual(hash(Fraction(3, 4)), hash(x))
+        self.assertTrue(x == Fraction(3, 4))
+        self.assertTrue(x == LazyFraction(9, 12))
+        self.assertTrue(x < 1 and x <= 0.75 and x > LazyFraction(1, 2) and x >= Fraction(3, 4))
+        self.assertFalse(LazyFraction(0, 0) == LazyFraction(0, 0))
+        self.assertTrue(LazyFraction(0, 0).isnan())
+        self.assertTrue(LazyFraction(math.inf).is_infinite())
+        self.assertEqual(Fraction(3, 4), x.to_fraction())
+        for value in SPECIAL + [Fraction(-2, 3)]:
+            self.assertEqual(bool(value), bool(LazyFraction(value)))
+        self.assertFalse(x - LazyFraction(3, 4))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,7 +1,248 @@
+from collections import OrderedDict, deque
+from typing import Any, Callable, Hashable, Iterable, Iterator, List, Optional, Tuple
+import math
+
+# Tags used to keep the canonical key of a list or dict from ever being equal
+# to a plain tuple or frozenset taken from the input itself.
+_LIST = object()
+_DICT = object()
+
+
+def _canonical(elem) -> Hashable:
+    """Return a hashable key that is equal for exactly the values equal to `elem`.
+
+    Raises:
+        TypeError: if `elem` is not made of hashable values, lists, tuples,
+            dicts, sets and bytearrays
+
+    Examples:
+    >>> _canonical([1, 2]) == _canonical([1.0, 2])
+    True
+    >>> _canonical([1, 2]) == _canonical((1, 2))
+    False
+    >>> _canonical({1, 2}) == frozenset({1, 2})
+    True
+    """
+    try:
+        hash(elem)
+        return elem
+    except TypeError:
+        pass
+    cls = type(elem)
+    if cls is list:
+        return _LIST, tuple(_canonical(item) for item in elem)
+    if cls is tuple:
+        return tuple(_canonical(item) for item in elem)
+    if cls is dict:
+        return _DICT, frozenset((k, _canonical(v)) for k, v in elem.items())
+    if cls is set:
+        # a set is equal to the frozenset with the same items
+        return frozenset(elem)
+    if cls is bytearray:
+        # a bytearray is equal to the bytes with the same content
+        return bytes(elem)
+    raise TypeError(f"unhashable type: {str(cls)[7:-1]}")
+
+
+def _key_of(value) -> Hashable:
+    """Return the hashable key of `value` used by the lookup tiers."""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return _canonical(value)
+
+
+class _BloomFilter:
+    """A Bloom filter sized for `capacity` keys at the false positive rate `error_rate`."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def add(self, key: Hashable) -> bool:
+        """Add `key` to the filter, return True if it (probably) was already there."""
+        # double hashing: the i-th probe is h1 + i*h2
+        h1 = hash(key)
+        h2 = hash((h1, 0x9E3779B9)) | 1
+        present = True
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % self.size
+            mask = 1 << (pos & 7)
+            if not self.bits[pos >> 3] & mask:
+                present = False
+                self.bits[pos >> 3] |= mask
+        return present
+
+
+class _Index:
+    """The distinct values seen so far, numbered in order of first occurrence.
+
+       Values are looked up in the three tiers of `unique`: hashable values
+       in a dict, values with a canonical key by that key in the same dict,
+       and anything else by a linear scan.  `unique`, `unique_counts`,
+       `duplicate_positions` and `Deduplicator` are all built on this index.
+    """
+
+    __slots__ = ('groups', 'values', 'leftover')
+
+    def __init__(self):
+        # hashable or canonical key -> number of its group
+        self.groups = {}
+        # the first value of each group
+        self.values = []
+        # groups whose value has no hashable key; anything else must also be
+        # checked against these because they may define their own __eq__
+        self.leftover = []
+
+    def scan(self, iterable: Iterable, key: Optional[Callable], every: bool = False) -> Iterator:
+        """Yield the first occurrence in `iterable` of each new ``key(elem)``,
+           or with `every`, each element with the number of its group.
+           New groups are numbered on from ``len(values)``.
+        """
+        groups, values, leftover = self.groups, self.values, self.leftover
+        for elem in iterable:
+            value = elem if key is None else key(elem)
+            try:
+                hash(value)
+                k = value
+            except TypeError:
+                try:
+                    k = _canonical(value)
+                except TypeError:
+                    if value in values:
+                        if every:
+                            yield elem, values.index(value)
+                        continue
+                    leftover.append(len(values))
+                    values.append(value)
+                    yield (elem, leftover[-1]) if every else elem
+                    continue
+            if k in groups:
+                if every:
+                    yield elem, groups[k]
+                continue
+            if leftover:
+                group = next((g for g in leftover if values[g] == value), None)
+                if group is not None:
+                    if every:
+                        yield elem, group
+                    continue
+            group = groups[k] = len(values)
+            values.append(value)
+            yield (elem, group) if every else elem
+
+    def __contains__(self, value) -> bool:
+        try:
+            k = _key_of(value)
+        except TypeError:
+            return value in self.values
+        return k in self.groups or any(self.values[g] == value for g in self.leftover)
+
+
+def _iter_unique(iterable: Iterable, key: Optional[Callable], index: Optional[_Index] = None) -> Iterator:
+    """Yield the first occurrence of each distinct ``key(elem)``, remembering all of them.
+       Passing the same `index` to successive calls continues one
+       deduplication across several iterables.
+    """
+    return (_Index() if index is None else index).scan(iterable, key)
+
+
+def _iter_unique_window(iterable: Iterable, key: Optional[Callable], window: int) -> Iterator:
+    """Yield each ``key(elem)`` not among the last `window` distinct ones."""
+    seen = OrderedDict()
+    leftover = deque(maxlen=window)
+    for elem in iterable:
+        value = elem if key is None else key(elem)
+        try:
+            k = _key_of(value)
+        except TypeError:
+            if value not in leftover and value not in seen.values():
+                leftover.append(value)
+                yield elem
+            continue
+        if k in seen:
+            seen.move_to_end(k)
+            continue
+        if leftover and value in leftover:
+            continue
+        seen[k] = value
+        if len(seen) > window:
+            seen.popitem(last=False)
+        yield elem
+
+
+def _iter_unique_bloom(iterable: Iterable, key: Optional[Callable], bloom: _BloomFilter) -> Iterator:
+    """Yield each ``key(elem)`` not (probably) seen before by `bloom`, in constant memory."""
+    for elem in iterable:
+        if not bloom.add(_key_of(elem if key is None else key(elem))):
+            yield elem
+
+
+def iter_unique(iterable: Iterable, key: Optional[Callable] = None, window: Optional[int] = None,
+                error_rate: Optional[float] = None, capacity: int = 1_000_000) -> Iterator:
+    """Lazily yield the first occurrence of each distinct element of `iterable`.
+
+       Elements are considered equal as in `unique`, or by ``key(elem)`` if
+       `key` is given.  By default every distinct element is remembered.
+       For streams too large for that, memory can be bounded in one of two ways:
+
+       - `window`: only the `window` most recently seen distinct elements
+         are remembered, so an element that has not been seen for a while
+         is yielded again.
+       - `error_rate`: a Bloom filter sized for `capacity` distinct elements
+         is used, so about `error_rate` of the distinct elements are wrongly
+         dropped as duplicates (more once `capacity` is exceeded).  Every
+         element must then have a hashable key.
+
+    Args:
+        iterable: any iterable, e.g. a list, file or generator
+        key: a function computing the value to compare elements by
+        window (int): number of distinct elements to remember
+        error_rate (float): false positive rate of the Bloom filter
+        capacity (int): expected number of distinct elements for the Bloom filter
+
+    Returns:
+        an iterator over the first occurrences
+
+    Raises:
+        ValueError: if both `window` and `error_rate` are given, or either is out of range
+
+    Examples:
+    >>> list(iter_unique(iter("abracadabra")))
+    ['a', 'b', 'r', 'c', 'd']
+    >>> list(iter_unique(["a", "B", "b", "A"], key=str.lower))
+    ['a', 'B']
+    >>> list(iter_unique([1, 2, 1, 3, 4, 1], window=2))
+    [1, 2, 3, 4, 1]
+    """
+    if window is not None and error_rate is not None:
+        raise ValueError("only one of window and error_rate may be given")
+    if error_rate is not None:
+        return _iter_unique_bloom(iterable, key, _BloomFilter(capacity, error_rate))
+    if window is not None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        return _iter_unique_window(iterable, key, window)
+    return _iter_unique(iterable, key)
+
+
 def unique(lst: list) -> list:
     """Return a list containing only the first occurrence of each distinct
        element in list.  That is, all duplicates are omitted.
 
+       Elements are looked up in three tiers: hashable elements in a set,
+       nested lists, tuples, dicts, sets and bytearrays by a hashable
+       canonical key in the same set, and anything else by a linear scan
+       of the result.  Only elements of the last tier cost O(n) each, so
+       the usual cases run in linear time.  See `iter_unique` for a lazy
+       version.
+
     Args:
         lst (list): a list of elements (not modified)
 
@@ -16,6 +257,8 @@ def unique(lst: list) -> list:
     [5]
     >>> unique(["b","a","a","b","b","b","a","a"])
     ['b', 'a']
+    >>> unique([[1, 2], {'a': [3]}, [1, 2], {'a': [3]}])
+    [[1, 2], {'a': [3]}]
     >>> unique([])
     []
     >>> unique(5)
@@ -23,13 +266,118 @@ def unique(lst: list) -> list:
       ...
     TypeError: 'int' is not a list
     """
+    _check_list(lst)
+    return list(_iter_unique(lst, None))
+
+
+def _check_list(lst):
     if not isinstance(lst, list):
         raise TypeError(f"{str(lst.__class__)[7:-1]} is not a list")
-    out = []
-    for elem in lst:
-        if elem not in out:
-            out.append(elem)
-    return out
+
+
+def _positions(lst: list, key: Optional[Callable]) -> List[List[int]]:
+    """Return the positions in `lst` of each distinct ``key(elem)``, in order
+       of first occurrence, found in one pass with the index of `unique`.
+    """
+    groups = []
+    for i, (_, group) in enumerate(_Index().scan(lst, key, every=True)):
+        if group == len(groups):
+            groups.append([i])
+        else:
+            groups[group].append(i)
+    return groups
+
+
+def unique_by(lst: list, key: Callable) -> list:
+    """Return a list of the first element of `lst` for each distinct ``key(elem)``.
+
+    Examples:
+    >>> unique_by(["a", "B", "b", "A", "c"], str.lower)
+    ['a', 'B', 'c']
+    """
+    _check_list(lst)
+    return list(_iter_unique(lst, key))
+
+
+def unique_counts(lst: list, key: Optional[Callable] = None) -> List[Tuple[Any, int]]:
+    """Return the first occurrence of each distinct element of `lst`, as in
+       `unique`, or of each distinct ``key(elem)``, with its number of occurrences.
+
+    Examples:
+    >>> unique_counts(["b", "a", "b", "b"])
+    [('b', 3), ('a', 1)]
+    >>> unique_counts([[1], [2], [1]])
+    [([1], 2), ([2], 1)]
+    """
+    _check_list(lst)
+    return [(lst[positions[0]], len(positions)) for positions in _positions(lst, key)]
+
+
+def duplicate_positions(lst: list, key: Optional[Callable] = None) -> List[List[int]]:
+    """Return the positions of all occurrences of each element of `lst` (or
+       ``key(elem)``) that occurs more than once, in order of first occurrence.
+
+    Examples:
+    >>> duplicate_positions(["b", "a", "b", "c", "a", "b"])
+    [[0, 2, 5], [1, 4]]
+    """
+    _check_list(lst)
+    return [positions for positions in _positions(lst, key) if len(positions) > 1]
+
+
+class Deduplicator:
+    """The first occurrences of the distinct elements added so far, kept up to date
+       as elements are added, compared as in `unique` or by ``key(elem)``.
+
+       Adding an element costs amortized O(1) for the usual elements, so
+       deduplicating a list that grows in batches costs as much as
+       deduplicating it once.  A Deduplicator can be pickled as a checkpoint
+       if its `key` can; only the first occurrences are stored, and the
+       lookup index is rebuilt on unpickling.
+
+    Examples:
+    >>> dedup = Deduplicator()
+    >>> dedup.extend(["b", "a", "b"])
+    ['b', 'a']
+    >>> dedup.add("c"), dedup.add("a")
+    (True, False)
+    >>> "a" in dedup, len(dedup), dedup.result()
+    (True, 3, ['b', 'a', 'c'])
+    """
+
+    def __init__(self, iterable: Iterable = (), key: Optional[Callable] = None):
+        self.key = key
+        self._index = _Index()
+        self._result = []
+        self.extend(iterable)
+
+    def add(self, elem) -> bool:
+        """Add `elem`, return True if it is a first occurrence."""
+        return bool(self.extend((elem,)))
+
+    def extend(self, iterable: Iterable) -> list:
+        """Add every element of `iterable`, return a list of those that are first occurrences."""
+        first = list(_iter_unique(iterable, self.key, self._index))
+        self._result.extend(first)
+        return first
+
+    def __contains__(self, elem) -> bool:
+        return (elem if self.key is None else self.key(elem)) in self._index
+
+    def __len__(self):
+        return len(self._result)
+
+    def result(self) -> list:
+        """Return a new list of the first occurrences, in the order they were added."""
+        return list(self._result)
+
+    def __getstate__(self):
+        # the canonical keys of the index use module level tags that don't
+        # survive pickling, so the index is rebuilt instead
+        return {'key': self.key, 'result': self._result}
+
+    def __setstate__(self, state):
+        self.__init__(state['result'], state['key'])
 
 
 if __name__ == "__main__":
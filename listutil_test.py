@@ -1,6 +1,17 @@
+import io
+import itertools
+import pickle
 import unittest
 
-from listutil import unique
+from listutil import Deduplicator, duplicate_positions, iter_unique, unique, unique_by, unique_counts
+
+
+class _One:
+    """An unhashable element equal to 1, for the linear scan tier."""
+    __hash__ = None
+
+    def __eq__(self, other):
+        return other == 1
 
 
 class ListUtilTest(unittest.TestCase):
@@ -70,6 +81,29 @@ class ListUtilTest(unittest.TestCase):
         # stress test
         self.assertListEqual([-10, -9, -8, -7, -6, -5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], sorted(unique([-9, 3, -5, -6, -7, -3, -1, 4, -7, -9, 7, 3, -10, -10, 9, -3, 10, 7, 3, -8, -5, -4, 9, -4, -8, -7, -3, 7, -6, -7, 5, 2, 9, 6, 6, 0, 9, 6, 1, -3, -3, 4, -3, 2, -10, -5, -3, 3, 1, -3, -3, 0, -4, -2, 0, -10, 2, -3, 7, -2, -1, 6, 1, 0, 0, 1, 3, 9, 5, 6, -6, 8, 3, -4, 3, 3, -8, -8, 10, -4, -9, 9, 10, -2, -7, 10, -7, 6, 4, 0, 7, -2, 10, 6, -7, -1, 9, -1, 2, 10, -5, -5, 5, 9, 8, 0, 2, -2, -5, 2, 4, 10, -9, -8, -6, 4, 1, -6, -2, -1, 8, 7, 10, 3, -1, -3, -10, 6, 9, -2, -8, 10, -9, -5, -9, -10, -9, 2, 7, 4, -10, -2, -9, 3, -8, 8, -7, 2, 2, 4, -10, 8, -6, 1, -4, -1, 10, -2, -8, -7, 9, 9, -9, 1, -6, 8, 10, 3, 3, 9, 0, -4, -10, 8, 0, 7, -3, 9, 3, -1, -2, 10, 2, -2, 7, 8, 5, -10, -6, 1, -7, -2, 0, -4, 8, -7, -6, -8, 0, -3, -8, -8, 1, 1, -5, -9, -3, 8, -1, -1, 5, -3, -9, -2, -10, 10, 6, -5, 8, -9, 2, 9, 2, -2, 9, 5, -6, 8, -3, -9, -9, 8, 5, -10, -1, 5, 5, 9, -6, -6, 10, 3, -4, 1, 9, 2, 9, 2, 3, 3, -10, 0, -6, 7, -9, 2, 4, 1, 9, 4, 2, 1, -5, 0, 6, 6, 6, 2, -3, 7, -2, -8, 1, -2, 5, 4, -4, 1, -6, 1, -8, 2, -2, -2, 8, -10, 6, -4, 1, 7, 0, -4, 6, -2, -7, 10, 4, -6, -10, 1, 4, 6, -3, 8, 7, -1, -3, 2, -7, -4, 6, -4, 4, -6, 3, 1, 2, -1, 4, 3, 7, -2, -7, -7, -4, 10, 5, 9, -2, -8, 5, 8, 4, 9, 2, 1, 5, 1, -1, 7, -1, -9, -3, -8, 10, 6, 0, -8, -3, -5, 3, -3, 9, 2, -4, 4, -7, 1, -8, 4, 7, 1, -4, -5, 2, -4, 0, 5, 4, 1, -10, -1, 4, 10, -1, 1, 10, 5, 0, 6, -8, -8, 0, 8, -8, 9, -6, 2, 9, -5, 2, -9, -3, -3, 9, 2, 7, 2, -1, 1, 7, -2, -8, -2, -4, -10, 9, 3, 3, 2, -4, -4, 1, 2, -8, -9, 2, -10, -5, 3, -6, 7, -2, 1, -10, 1, -5, 6, 2, 1, 1, 8, 10, -8, -7, -5, -7, -4, -9, -1, -1, -4, 1, -1, 1, 5, 0, -6, -8, 6, -1, -8, -10, 7, 1, 4, 1, -10, 9, 10, 8, -3, 6, -7, 6, 8, -4, -6, 0, 4, 8, 2, -8, -2, 7, 1, 3, 4, 5, -8, 9, 2, 1, 4, 3, -2, 6, -7, -2, -6, -3, 10, -9, -5, -8, 8, -3, 9, 10, 6, 6, 6, 6, 3, -10, -6, -8, -7, -10, -2, 10, 2, -2, 2, 10, -5, -6, -9, 9, 5, 5, -1, 3, 7, 9, 5, 2, 6, -3, 2, 8, 0, -9, -6, -10, 8, 2, -7, 4, -5, -4, -3, 0, -8, 8, 2, -2, -4, 3, -10, 1, -3, -3, -7, -6, 1, -4, 0, 0, 6, -8, 0, 5, 2, 3, 10, -2, 10, 3, -8, 7, -3, -1, -9, 1, 6, 8, -9, -7, 3, 4, 1, 2, 10, -3, -6, -5, -3, -10, 6, -3, 1, -8, 4, 3, -1, 6, -6, 9, 0, 9, 4, -10, -1, -5, 9, 8, -2, -6, -5, -3, 10, 10, 0, 0, 1, 9, -9, -10, -2, -6, 9, -7, 9, 5, -5, 6, 1, 4, -5, 8, 4, 7, -1, 3, -2, 2, 6, 5, 9, 1, 10, 1, -1, 4, 6, 5, 0, -10, -1, 0, 9, 9, 7, 3, 7, -5, -9, 8, -2, -3, -8, -1, -10, -8, -7, 2, -9, 6, -3, -3, 7, 6, 7, 4, 4, 3, 8, 3, -5, 7, 7, -10, -4, 7, 8, -6, 3, 8, 1, 8, 9, 0, -8, 8, 7, -4, -6, 6, -4, 6, -2, 3, -4, 8, 4, 6, 8, 9, 2, -5, 6, -6, 4, 9, -8, -6, -4, -4, 6, -9, -7, 8, 2, -7, -1, 7, -10, -5, 10, -9, -4, -2, 6, -7, 2, 9, -7, -7, -6, 6, 2, 0, -5, 0, -10, 10, -2, 4, 3, -5, -4, 5, 3, 4, -7, -6, -4, -3, -2, 9, 9, 6, -1, -7, 3, -3, -10, 10, 0, 5, 9, 8, -2, 0, 9, 9, -5, -10, 0, 6, -6, 8, 2, -2, 6, -7, 0, 8, -4, -3, 10, -4, 1, 4, -4, 5, -10, 1, -9, -6, -3, 2, -10, 10, 1, 7, -2, 9, 10, 4, 0, 5, -4, -5, 2, -3, 9, -8, -5, -7, 8, -10, 2, -5, -4, 1, 8, -2, -7, 1, -3, 10, 3, -4, -8, 2, 4, 9, 1, 6, 9, 5, -4, -8, -4, -3, -7, -7, 3, 8, -5, -8, 8, -4, 7, 2, 6, 4, 9, 3, 5, -2, -1, 1, -2, -2, 8, 0, 9, -1, -5, -5, -9, 9, -9, -5, 10, -9, -1, 6, -10, -7, -5, -6, -8, -5, -8, 6, -7, 2, -8, -2, 6, -4, 10, -3, 1, -6, -3, 0, 8, -5, 0, -10, 3, 4, -7, -8, -3, 5, -8, 2, -2, 1, -8, -10, -4, 10, 8, -7, -10, -6, 7, 3, -2, -3, 0, 1, 1, 2, -4, -2, 10, 10, -4, 0, -5, 4, -3, 9, 10, 6, -3, 10, 1, -8, 7, 5, 1, 0, 1, 7, -7, 3, 6, -1, 1, -10, 2, -4, -2, 6, 9, -1, -9, 1, -10, 6, 4, 6, 5, 9, -1, 8, 9, 4, -4, -2, -9, -5, 1, 7, -9, 4, 7, 6, -7, -4, 0, 7, 7, -8, 4, 5, 1, -6, 7, -10, -4, 2, -5, 8, -6, -6, -4, 9, 10, 10, 9, -6, 5, 0, 1, -1, -3, 7, 2, -6, -2, -7, 1, -9, 1, -4, -2, -7, 0, 7, 1, 10, -6, 7, 7, 10, 10, 10, -3, 5, -7, -9, 1, -7, -5, 5, 6, -9, 10, -8, 1, -3, -9, 4, -5, -5, 0, -7, 9, 1, -2, -2, 7, -2, -4, 5, 7, -3, 8, 4, 5, 8, -9, 1, 0, 4, 6, -8, -9, 5, -4, -10, 6, -3, 2, 9, -4, 6, -1, 4, -7, -1, 0, 8, -4, 7, 9, -2, 0, -2, 1, 9, 7, -1, -2, 5, -7, -4, 7, -7, 4, -2, 7, -5, -10, 3, -5, -9, 4, 4, -1, 2, 2, 2, -7, -7, 0, 7, 7, -10, 1, 7, -1, 3, -5, 0, -4, -6, -5, -4, -1, -6, 3, 0, 10, 1, -2, 2, -8, 2, -7, 4, -1, -9, -10, 7, -6, 3, -9, 1, -10, -8, -1, 6, 10, 1, -9, -4, 1, -7, -2, 3, -3, -9, -3, -6, -5, 8, 8, -8, -3, -10, 5, -3, 6, -9, -1, -2, -9, -2, 4, -10, 5, -10, 2, 0, 2, 2, -3, 1, -10, -7, 3, -7, 2, -9, -3, 3, 6, 7, 2, 7, 0, 5, -2, -5, -7, 6, -3, 9, -10, 9, 10, -4, 5, 2, 3, -10, 4, 0, 0, -9, -6, -9, 2, 4, -6, 1, -6, -8, 7, 9, 3, -3, -10, 8, -3, 10, -1, 5, -8, 6, 8, 9, 9, -6, -10, 0, -7, 7, -4, -7, 5, -1, 6, 1, 0, 2, 7, -1, -6, -4, 5, -7, 5, -4, -7, 10, -4, -9, 7, 0, -4, -6, 7, 0, -6, 7, 4, 10, -3, 5, 5, 9, 1, 3, -7, 7, 8, -9, -2, -6, -5, 10, -4, -8, 9, 7, 3, -4, 6, 8, -9, 8, 6, 0, 3, 0, -2, -9, -1, 6, -9, 7, -9, -3, -1, 9, 4, 9, 6, -4, -4, -6, -9, 9, 0, -10, 7, -6, 7, 5, 3, -10, 7, -8, 7, 1, -8, 1, 8, -8, -2, 0, -4, 6, 3, -4, -9, -7, -6, -9, -4, -10, 3, 0, 10, -8, -1, -4, 8, 1, 10, -10, 7, -8, -7, 2, 10, -10, 0, -1, -4, 2, -4, -1, 0, 9, -6, 8, 3, -8, -2, -3, 8, 10, 0, -5, -5, -5, 8, -8, 4, 3, 5, -7, -10, -7, -1, -10, 5, 3, -3, -2, 2, -5, -8, 1, -4, -1, 8, -10, 2, -7, 3, -2, -9, 8, 9, 9, -4, 7, -2, -9, 9, -4, 1, -9, -7, -6, 3, -2, 1, -4, -4, -2, -3, 7, -3, -2, -9, -5, -7, 0, 4, 2, 10, -4, 2, 7, -8, 7, -1, 7, 0, -1, -10, 8, 0, -7, -8, 9, -4, -4, 0, 7, 1, -7, 2, 2, 10, -4, 10, 0, 7, 1, -9, -4, 0, -9, -7, -6, -9, 8, -3, -5, -3, 3, 7, -10, 9, -8, -8, 7, -4, 2, -9, 4, 2, -10, 1, -6, -10, -7, 0, 0, -5, -7, 4, 7, -9, 8, -5, -7, -2, 4, 5, -7, 2, -3, -3, -10, 6, 8, 10, -6, 2, 1, -6, -3, 8, 7, -4, 0, -10, -5, 1, 5, -9, 9, 1, -10, 7, -8, -8, -4, 10, -5, 9, -9, 3, 4, -7, 5, -5, 6, 9, 7, 2, 3, -8, -3, -3, -3, -3, 4, 0, -5, -7, -4, 3, 0, -3, 1, 2, -5, -1, 1, -2, 9, 0, 4, -8, -4, 2, -7, -5, 9, 4, 2, -10, 4, -5, 5, 10, -5, 9, -3, 6, 1, 5, 8, 9, -8, -4, 6, -5, -4, 10, 2, -10, 8, 10, 8, -4, -3, -4, -6, 7, -6, -4, 1, -5, 9, 8, -3, 7, -10, -6, 0, 2, -9, -8, -6, 3, 0, 4, -2, 9, -1, -7, -5, 9, -2, 3, -8, -5, 3, 3, 4, 10, -2, 6, -10, 2, -10, -10, -4, 2, -3, 9, -3, -9, 6, 6, 1, -8, 9, -6, 3, -6, -7, 0, 3, 5, 7, 3, 1, -10, -5, -1, 9, 3, -8, 4, -5, -7, 8, 5, -2, -4, 6, -1, 7, -4, 4, -9, 0, 0, -8, 0, 7, 2, 4, 9, -3, 7, 9, 2, 3, 4, 10, 1, 3, -1, 0, -7, 2, -2, 3, 1, 5, -4, -3, 7, 3, 6, 5, -9, 7, -7, 1, 3, 9, -5, -10, -8, 9, 10, -6, 2, 3, -5, -10, -7, 2, -5, 6, -9, -2, 4, -1, 3, 10, 4, -9, -2, 1, 4, 7, -9, 10, 9, 6, 0, -8, 2, 8, -1, 3, -1, 6, 4, 6, 8, -6, -2, -5, -2, -6, -3, -4, -8, -9, -8, -3, 1, 1, 3, -5, -1, -8, 6, -7, 0, 5, -5, 10, -1, 10, -6, -1, -10, -1, -5, 4, 0, 0, 6, -6, -8, 5, -1, 4, 8, 8, 1, -10, -8, -6, 8, -3, -2, -1, -7, 1, 3, 3, 6, 0, -4, 4, -7, 1, -8, 7, -3, 9, -2, -4, 1, -4, 7, 7, 10, 3, -1, 6, 9, 8, -6, 8, -10, 2, 9, -9, 2, -3, -9, -9, -10, -5, -7, 8, -5, 6, -7, 7, -10, 7, -1, -7, 2, -2, -2, -4, -7, -6, 0, -5, -9, -4, -5, -5, -9, -3, -9, -4, 9, 6, 6, 6, 6, 9, -3, 1, -7, 10, -7, 10, -4, 8, 0, -7, 1, 2, -4, -5, -10, 4, -3, 4, -8, -7, -5, -8, 9, -7, 5, 4, 4, 0, 9, 7, 6, -7, -7, 2, 10, 1, -5, 5, 7, 10, 3, -8, 3, -5, 8, -5, -8, 9, 5, -3, -7, 5, 1, 7, -1, 8, 3, 0, -10, 8, 2, 5, -5, 2, -6, 3, 4, 9, 4, 5, -9, -6, -10, 0, 6, 6, -10, -2, 3, 2, 2, 4, 0, 5, 3, 1, -7, 8, 0, 4, -1, 2, -10, -1, 2, -7, -6, 5, -9, 5, -6, -4, 2, 9, 4, -10, -2, 1, -1, -6, 7, 9, 8, 10, -7, 10, 9, 9, 6, 6, 0, 10, 1, -9, 3, -9, 9, 8, 0, 3, -5, 3, -9, -1, 3, 6, -6, 9, 2, 3, -5, 5, -6, 3, 0, -10, 6, -1, -5, -6, -7, -2, -2, 10, 9, -7, 6, 9, 9, 1, 9, -1, 5, -1, -2, 1, -6, 7, 1, -9, 6, 8, -6, -5, 0, -4, -9, 8, -4, -10, 8, -4, 3, 5, -6, -7, 5, 6, 4, -10, 7, -3, -10, 6, 4, -7, 3, -9, 0, 0, -1, -5, -5, -9, -4, 2, 3, 6, 2, 5, -9, 1, 0, 8, 7, -6, 1, 1, -3, 8, 5, 7, -9, 5, 7, 1, 2, -8, 3, -10, -4, -5, 4, 0, 2, 3, 1, 1, -5, 2, 4, -7, -8, -5, -2, -10, 5, 3, -2, 5, -8, -10, 0, 10, 1, 1, 5, 3, 8, -10, 1, -1, -3, -9, 0, -1, 8, 3, 1, -7, 0, 1, -2, -6, -7, 9, -5, 1, 3, -6, 9, 3, 6, -2, 7, 2, -5, 6, 8, 6, -3, 9, -3, 0, 4, 4, 6, 3, -6, 10, 1, 7, -10, -2, 8, -10, 7, 9, 5, -2, -8, 7, -6, -10, 3, 1, -4, 1, 4, -3, -6, 5, -4, -3, -3, 10, 6, -9, -10, 3, -4, -7, 9, 1, 0, -5, -10, 5, -7, 5, 2, -10, 10, -3, -6, -8, -1, 5, -3, 6, -3, -7, 8, -4, 0, -7, 6, 5, -9, 0, 2, 10, -7, 10, 2, -4, 2, -1, 0, 0, -3, 5, -6, -6, 6, 0, 2, 8, 9, -3, 5, -7, -2, -7, -6, 0, 9, 5, 7, -4, -9, 8, 0, -9, 8, -1, 10, -2, 8, -7, -2, -7, 1, 3, -5, 0, -5, 2, -8, 6, 7, -6, 0, -7, -10, -10, 1, 4, 10, -1, 9, -7, 7, -10, 3, -10, -7, -5, 6, -5, 7, 7, 3, 8, 10, -1, 1, -4, -9, 2, -5, 9, -1, -2, 6, -6, -7, -10, -4, 6, -10, -2, 7, 0, -9, 4, 6, 4, 5, -8, 10, -2, -8, -3, -5, -7, -9, -3, -5, 10, -3, -6, 10, -6, 10, 10, -4, -7, 1, -8, 10, 6, 10, 8, 2, 5, 1, 10, 5, -10, 5, 7, -8, 1, 5, 2, -9, 4, 2, -1, -6, -8, 9, -4, 3, 0, 8, 8, -2, -2, 2, -1, -4, 2, -7, -2, 5, -2, -10, 8, -5, 5, 3, 6, -5, 3, -1, 0, 2, -3, 6, 10, 7, -9, -7, 2, 3, -10, -4, 10, 1, -8, 6, -2, 1, -9, -4, -4, 9, -9, -10, 0, -4, 2, -7, 7, 8, -2, -2, -8, -3, -9, 6, -1, 5, 2, 3, 2, -7, -10, 3, -4, -2, 9, -2, -8, -3, -8, -2, 1, 2, 4, 5, -6, -1, 5, -2, 3, 2, -1, 9, -1, 9, -3, -6, -9, 8, -4, 8, -5, -4, -3, 9, 4, -7, -7, -7, -9, -2, 2, 3, 4, -2, 9, 2, -10, 6, -1, 10, 7, -8, 5, -6, -7, -2, -4, 9, -1, 8, -3, -1, -4, 10, -10, 9, -7, -4, -8, -9, 4, 5, 7, -3, 2, -8, 8, 4, 4, 6, -1, 4, 9, 3, 0, 3, -6, 9, -9, -8, -8, -8, 1, 1, -6, 3, -6, 5, -1, -1, 2, 7, 1, -5, 9, 8, -6, -2, -5, 1, -3, 1, -2, -10, -7, -3, -2, -7, 5, -8, 2, 6, -8, -10, 2, -6, -10, 2, -5, -1, -3, 3, 6, 7, 5, -6, -3, -10, -10, -8, 6, 2, 0, 4, -9, 8, 8, -5, -4, -5, -1, 2, 8, -8, -8, -4, -8, 4, 8, -5, -9, -5, 1, -5, 9, -2, 6, -3, 4, 5, -3, -1, -2, -9, -6, 1, 1, -9, -4, -5, 9, -2, 5, -9, -5, 1, -5, -3, 3, 4, 7, -3, -1, -3, -7, -3, 5, -4, -10, 4, -1, -10, 6, 1, -4, -10, 0, -8, -8, 10, 10, -10, 7, -1, -4, 10, 5, 0, -3, -3, 2, -7, -1, -1, -9, 9, 4, 3, -9, -7, -10, 8, -5, 8, 5, 8, 2, -5, -6, -6, 2, 3, -2, -9, 9, -8, 2, 5, -9, 2, 7, -10, 7, 10, -1, 4, -3, -10, 10, 4, -5, 7, -2, -5, -7, -10, 3, 3, -5, -9, 8, 0, -2, 4, -7, 4, 4, 8, -6, 6, 10, 9, 5, -3, -9, 1, 4, -7, 4, -5, 0, 2, -8, -10, -10, -2, 3, -2, -7, -2, 4, -3, 4, -9, 1, -3, 5, -9, -9, -1, -8, 8, -4, 10, 4, 10, -1, 6, -5, -1, -9, -2, -10, -4, 1, -10, -9, -1, 6, 1, -4, 4, 10, 8, 6, -3, 2, -9, 0, -1, 0, -8, 0, -6, 9, 3, 8, -6, 8, -2, -7, 2, -5, 3, -3, -9, 2, -3, 4, -9, 4, -6, 6, -1, -10, 4, -9, -3, 2, 0, 6, -2, -7, 4, 3, -3, -1, 4, 4, -3, 10, 8, -2, -5, 1, 9, -6, -4, -8, -4, 3, -10, 9, 4, 1, -8, 3, 4, 1, 8, -9, -10, -4, 3, -9, -8, -1, -2, 10, 6, 7, 8, -1, -2, -7, 0, -6, -7, -8, 2, 5, -8, -6, 5, -3, 3, -3, -5, 1, -7, -4, -2, 7, -4, 7, 1, 10, 2, 0, -1, -8, 5, -7, 2, 4, 0, 6, 6, 8, 8, 9, 8, -9, 3, -6, -6, 4, -6, -3, -7, -3, 5, -1, 6, 3, 2, 5, 9, -2, -6, 10, 0, 1, 1, -6, 4, -1, -1, 8, 4, 7, -6, 9, -9, -4, 5, -4, -4, 1, 3, -1, 10, 5, 0, -4, -10, 4, 0, 5, 1, 10, 9, 9, 5, 0, -1, -6, -8, 0, 3, 7, 9, 5, 2, -6, 6, 1, 6, 5, -3, -7, -3, 6, 4, -8, -8, 5, 8, -1, 0, 3, -6, 0, -9, 3, -9, -1, -5, -8, 4, -9, -9, 5, 3, -10, 3, 1, -4, -4, -10, 6, -10, 2, -9, 9, -5, 9, -3, -4, -6, 0, -6, 0, 9, -5, 3, -10, 10, 8, 5, -3, 10, 10, -2, 7, 2, -9, 3, 1, -8, 1, -7, -5, 10, 3, 0, 1, -5, -8, 1, 1, -10, 7, 2, 2, 4, 1, -10, 8, -7, 6, -1, 9, -4, 9, 8, -6, 7, 2, 4, 7, -10, -2, -7, -6, -3, 1, -5, 7, -4, 7, 8, 2, 3, 3, -7, 0, 9, -2, 0, 10, 0, 3, 4, -8, 3, 3, 9, -10, -2, -5, 2, -7, -6, 3, -4, 10, 5, -8, 9, -5, 7, -7, 1, 2, -1, -9, 2, -6, 1, 9, -5, -10, -7, 10, 3, 2, 7, 1, 5, -5, 2, 1, -6, -4, -3, 3, 4, -6, 6, -3, -5, 10, -6, 5, 5, -6, 3, 7, 0, 0, 6, -3, 8, 5, 1, -10, -6, 4, -6, -3, -10, 10, 2, 3, 1, -6, -1, -10, 7, -9, 3, 1, -7, -3, 2, -3, -5, -10, -3, 2, -4, 0, 8, 7, -7, 9, -5, 5, -10, -1, 6, -2, -9, 8, -4, -6, 7, 3, -8, 6, -5, -3, -5, -8, 6, 10, -9, -1, 2, -5, -1, -9, 3, -10, 4, 10, -3, 2, 6, 10, -10, 1, -9, -5, -3, 7, -4, 2, -9, -7, 6, -8, -6, -4, 6, -5, -8, 6, 9, -2, 2, 9, -6, -4, 8, -6, 4, 10, -6, 2, 4, 10, 1, 7, 4, -5, 7, -8, -4, 10, 10, -1, 3, 8, 2, -10, 0, -1, -10, 1, 1, -4, 4, -7, -7, -1, -4, 6, -2, -8, -9, 6, -9, 9, 4, 0, -3, 3, -2, 1, 9, 0, -1, 6, -5, 6, 9, -3, -6, -1, 2, 10, 4, 8, 0, 3, -9, 5, 2, 5, -7, 0, 0, 5, 0, 7, 10, -3, 8, 9, 5, 5, -3, 10, -7, -4, -5, 2, 10, -3, -8, 9, 1, -3, 10, -8, -10, 6, -5, 2, -9, 5, -5, -2, 8, 9, -8, 4, 8, 3, -3, 5, 1, -7, -5, -2, 6, -3, 4, 3, 6, -6, -7, -1, -1, -9, 9, -6, 7, -1, -9, 5, -7, -5, -5, 7, -10, -7, 5, 3, -2, 10, 9, -3, -2, 4, 2, -10, -2, -3, 8, -4, -10, -8, 9, 8, 9, -5, 7, 9, -1, 9, -3, -1, -10, -6, 6, -10, 5, 3, -1, -4, -9, 5, 5, 2, 3, -5, -3, -9, -9, -7, 8, -3, 0, -2, -2, -8, 4, 2, -3, -8, 2, -4, -6, 0, -7, 4, -6, -6, -9, -3, -8, -9, -5, 9, 9, -10, -1, 4, -6, -4, -3, 2, 2, -7, -4, -7, 8, 3, -9, -8, -3, -7, 0, -4, -9, -10, 8, -5, -7, 1, 1, -1, -7, -7, 5, -2, -10, -3, -2, -10, 6, -4, 1, -2, 0, -4, 10, 8, 9, -6, -8, 2, -7, -3, 3, -5, -6, -3, 9, 7, -9, -7, -10, -8, -10, 7, 0, -6, -7, 1, 4, 9, -5, -2, -2, -4, 5, -9, -1, -10, -4, -2, 10, -8, 9, 10, -8, 9, -5, -2, -3, 1, -7, 6, 10, -3, -3, 0, -10, 10, -10, 0, -10, -5, -6, -2, -5, -8, -1, 3, 3, -1, -7, 5, -8, -2, 7, 7, -2, -2, -4, -9, 1, 7, 6, -1, 3, 4, -1, -3, 3, 9, 1, 6, -3, 10, 8, -3, -9, 6, 7, -10, 9, -5, 8, 1, -7, -10, -6, 5, 7, -7, -5, 4, 2, -8, 7, 6, 9, -1, 6, -1, -3, 2, -2, -6, 10, -1, -8, 4, -2, -5, -8, -10, -7, -9, -1, 9, 0, 10, -9, -6, 5, -7, -8, -7, -1, -6, -9, -9, 4, -3, -3, -6, 9, 9, -4, -7, 9, 3, -6, 0, 0, -3, -4, 1, 3, -9, -4, 5, 3, -3, -4, -7, -7, 10, 1, 8, -10, -8, -4, 9, -5, -1, -4, -6, -7, -2, -6, -10, -6, 2, 7, -4, -2, -4, -4, -7, -1, 6, 1, 10, -6, -1, 3, -6, 2, 4, 9, 8, 10, 1, 7, -9, 4, 6, 6, -4, -4, 7, -10, -10, -9, -3, -9, 1, 4, -2, 1, -8, 8, -6, 1, 0, -4, 6, 5, 0, -4, -2, -2, 1, 10, 1, -9, 5, 2, 8, -2, 1, 3, -7, 10, -2, 9, 9, -9, 8, 3, -1, -6, 10, 3, -2, -9, -2, 9, 6, -10, -10, -1, -1, -1, -8, -5, 7, 2, -6, 4, 6, -1, 4, 1, 3, -9, -7, 0, 10, 6, -6, -7, -5, -10, 0, -6, 1, -7, -4, -7, 6, 1, -3, -6, -1, 9, -5, -3, 6, -8, -8, 1, -2, -8, -5, -2, 2, -8, 4, -7, -4, -1, -4, -8, -9, 5, 1, -2, -1, 9, -2, -3, -4, -8, -10, -8, 9, 1, -6, -2, -8, 6, 7, 4, 4, -8, -8, -6, 5, -3, -2, 3, -6, 2, -5, 2, 8, 4, -3, -1, -2, -7, 4, 6, -9, 5, -8, -4, 2, -5, 0, -8, -1, -7, -4, -2, 5, 4, 2, -10, -7, -6, 4, -2, -1, -5, -6, -5, 3, -3, 0, 7, -4, 3, -6, -5, -8, -6, -5, -5, -2, -9, -5, -6, -10, -8, 2, 10, 6, 9, -5, -9, -10, 5, -1, -1, -5, -5, 0, -3, 1, -4, -4, 0, -7, 0, 1, -10, -5, -1, -6, 10, -4, 9, -10, -3, -2, -4, 10, 3, 7, 2, -5, -4, 8, -4, -9, -8, 7, -1, 2, -8, 1, 2, -9, -9, 3, -9, 0, -2, -1, 1, 10, 2, 8, 9, 7, 10, 0, 5, -4, -6, 3, 7, -7, -4, -6, 9, -2, -8, -9, 1, 8, 5, 10, -1, 4, -7, -3, -5, 8, -6, -5, 4, -7, 1, 9, 9, 0, -4, 4, -6, 5, -9, 1, -2, -10, -4, 0, 8, -7, 0, 4, 8, 2, 4, -6, 2, 3, -3, 3, 9, -8, -2, -2, 10, -5, 10, 2, -4, -9, 10, 4, -4, -7, 6, 1, -5, 0, 4, 3, -7, 2, 10, -9, -8, 5, -10, -6, 7, 6, -8, 3, 0, -7, -8, 0, -6, 3, 9, -6, -7, 8, 9, 3, -4, -3, -7, -5, 3, 6, -5, -2, 2, 10, 10, -5, 0, -3, -5, -1, 5, -7, 3, 5, -8, 8, -7, -10, 8, 9, 5, -10, -4, 7, -5, 4, 6, 0, -2, 8, -3, 3, -6, 0, -4, -7, -8, 1, -10, -10, 5, 3, -9, 1, 3, -7, 4, 5, -10, 5, 1, 10, 3, -9, -2, -5, -2, -6, 2, 3, 10, -4, -9, 4, -5, -3, -1, 4, -5, -9, -6, -10, -8, 2, -7, 7, -7, -9, 2, -9, 8, 0, 10, 9, -6, -7, 7, -2, -7, -8, -9, 1, 1, -6, -2, -1, 8, -10, -1, 6, 2, 9, 5, -6, -5, -9, -9, -6, 7, 10, -5, 2, -1, 9, 4, -4, 10, -3, 7, -6, 10, -7, -3, 8, 9, -1, 10, 0, 7, -5, 2, 7, -6, 7, -8, 3, -5, 0, 5, 3, -10, 10, -10, -8, 5, 10, -7, 8, -3, -8, -5, -5, 0, -3, 4, 2, -2, 6, 3, -8, 7, 8, -5, 9, -6, 6, 8, 0, -3, 6, -9, -8, -9, -9, 10, 2, 10, 3, 4, -5, -9, 4, -7, 9, -6, -7, 3, 5, 9, 9, 6, -7, -6, 8, 10, 3, -9, 5, 8, -5, 8, 4, -4, 6, 3, -3, -10, -1, -3, 0, -6, -3, 2, 10, -5, -2, 2, -4, 1, 10, 5, 10, 9, 5, 7, 2, 7, -3, 8, -2, 8, -6, -4, 2, 4, -9, 9, 9, 6, -4, 9, 8, -5, 10, 0, -8, 6, -2, 1, 10, -2, -10, 6, -5, -6, -3, -2, 6, 0, 7, -7, 9, 1, -2, 8, 3, 10, 3, -4, 0, -6, 4, 7, -5, 5, -2, -1, -7, -3, -7, -1, -6, -8, 6, -9, 10, -1, -5, -2, -10, -3, 9, -6, 10, -6, 1, -6, -3, -2, -10, 6, 7, 8, 9, 2, -9, -8, -2, -10, -8, 9, -8, 8, 5, -9, 1, -7, -7, 5, 3, 5, -6, 8, 8, 7, 3, 7, -3, -8, 2, -8, -1, 8, -10, 7, 6, -10, 7, -1, -3, 0, -1, 3, 0, 9, 8, 0, 8, 0, -2, -5, -4, -2, -3, -6, 6, 7, 8, 1, 1, -5, -6, 8, 5, 7, -10, -2, 9, -7, 6, -9, 3, 0, -4, -6, 3, -5, 10, -3, -2, 8, -1, -2, -7, 0, -8, -1, -2, 3, 2, 1, 2, -10, 1, 8, 10, -3, 2, 9, 5, -8, 2, -2, 0, 10, 5, -6, -9, 3, -7, -3, -10, 5, 0, -6, 10, 7, -8, 2, -8, -2, 10, -3, 7, -4, -9, 2, 6, 8, -2, -1, -5, -4, 4, -8, 4, 3, -1, 1, -6, -8, -6, -5, 1, -9, 4, 9, 4, 3, -4, 6, 5, 2, 10, 10, -5, -2, 1, -2, -9, 8, 7, 10, 8, -1, -8, 5, 6, 1, -1, 1, 3, 5, 7, 10, 1, 9, -8, 9, -8, -9, 10, 1, 9, 3, -6, 8, 6, 0, -4, 10, 1, -8, 4, 4, 7, 3, -6, -5, -10, 10, -7, 9, -6, -3, 8, -3, 8, -9, -4, -6, 4, 3, -7, -2, -10, 8, 1, -8, 7, -1, 2, -9, 8, -1, 6, 10, -2, -9, -5, 2, 1, -8, 1, -9, -3, -8, 7, -10, 5, -9, 7, 2, 4, -9, -6, 5, 6, 6, -3, 5, -7, -2, -5, -6, 10, -5, 8, 2, -10, 10, 4, 10, 8, -7, 5, -8, 5, 0, 1, 10, -8, 10, 3, -7, -9, 9, -10, 0, 2, -9, 8, -10, 2, -10, 3, 2, -6, -7, 0, 6, 0, 4, -8, 0, 3, 10, -2, -8, 7, -6, -9, 7, -5, 10, 3, 6, 9, -1, -10, -2, 1, 3, 4, -7, -7, -8, -5, -4, -8, -4, 7, 10, 4, -7, -9, 3, 9, 8, 8, -8, -5, 10, -6, 5, 1, 2, -7, 6, -2, 8, -3, -5, -3, -7, 8, 9, 4, -6, -8, 2, 8, -3, 6, -7, -4, 0, -5, -2, -3, -5, 7, 7, 4, -9, -9, 10, -4, -8, 7, 0, 10, -9, -9, 0, 1, 0, 1, -2, 7, -10, 8, 10, -5, 9, 2, 2, 4, 1, 0, -5, 6, -9, 4, -6, 10, -8, -3, 10, 4, -9, -5, -4, 1, -8, 3, 1, 0, -3, 5, -5, 10, -10, -10, 2, 3, -10, 0, 8, -10, 1, 5, 10, 0, -4, 5, -10, -5, -2, -4, -2, -1, 5, 6, -9, -6, 1, -6, 4, 0, 6, -7, -1, 0, -6, -6, 9, -6, 7, -4, 1, 9, 9, -4, -7, 7, 9, 0, -3, 5, 1, -5, 6, 10, 0, -2, -2, 9, 10, -6, 8, -4, -1, -8, -3, -5, -3, -10, 5, -4, -6, -7, 8, -3, 4, 6, -9, -10, -5, -5, 9, -7, 8, -6, -4, 1, -3, -10, 9, 4, -9, -10, -7, -10, 3, 4, 2, -4, -10, 4, -3, -2, 1, -2, 4, -8, 10, 8, 2, 1, -9, 6, 0, 4, 5, 0, 8, 7, 4, 1, -7, 10, -7, -1, -6, -2, 0, 5, 10, -6, 6, 5, -2, 3, 1, 0, -2, -10, -8, 8, -8, 9, -7, -3, -9, -7, 0, 6, 6, -3, 4, 10, -3, 4, 3, -4, -4, -5, 6, 7, -2, 5, 1, -4, 10, 4, 2, -2, -7, -4, 2, -6, -2, 9, 9, 4, 9, -2, -2, -8, -5, -10, 4, 4, -3, -2, -2, 7, 0, 8, 4, 2, 5, 7, -8, 6, 7, -10, 7, -6, -1, 10, 6, -3, -2, 2, 5, 6, -7, 10, 8, -7, -3, 10, 9, 6, 10, -6, -10, 5, 4, 8, 6, 10, 9, -6, -7, 9, -3, -1, -1, -9, -7, -10, -10, -6, 8, 1, -10, -4, 0, 5, 4, 2, -10, -9, 10, 9, 7, 0, -1, -10, -3, 10, -10, -3, -2, 5, 0, -9, 8, 3, -10, -9, 6, -7, -10, -3, 0, -3, 7, 10, 0, 8, 2, -10, 7, 4, -3, -7, 4, -3, 4, 9, -6, -10, 5, 4, 4, 0, 6, 6, -4, -7, -4, 9, -7, -10, 9, -10, -6, 2, 4, 0, 3, 0, -2, 6, -5, 3, 3, 2, 0, -6, -5, 8, 7, -6, 5, 5, 2, -8, 6, -8, 2, -4, -3, 1, 8, -4, -2, -6, -7, 0, 6, 8, -6, 3, -7, 1, 2, 2, 9, -1, 7, 0, 10, 10, 3, 0, 9, -6, 7, -10, 9, 5, -2, -9, -2, -2, 9, -5, -1, -9, 5, -8, 0, -5, -4, -8, -3, 5, 7, -9, -1, 6, 3, -6, 5, -2, 4, -5, 6, -4, 7, -10, -1, 4, 7, 0, -10, -2, 9, 2, -2, -1, -9, -2, 1, 4, 0, 0, -3, 8, 10, 0, 1, -8, 6, 2, -4, -4, -8, 5, 6, 3, -5, 6, -7, -6, 9, -10, -6, -9, -7, -6, -5, 10, 0, 1, 7, -5, -10, 3, -1, -5, -10, -7, 9, -10, 9, -6, 4, 0, 0, -5, 3, 10, 9, -8, -10, 10, 1, -9, 6, 2, -4, -6, -4, 4, 9, -7, -7, -5, -10, 1, -5, 9, -1, -10, 2, -6, 2, 4, 0, -8, -10, 4, -6, 10, 4, 6, -3, -4, -2, 8, -10, -4, 3, 6, 10, -2, 4, 5, -3, -9, 5, 4, -9, 2, -8, 10, 2, -4, 7, -4, 8, -8, -8, -5, 7, -3, 5, -10, 5, -7, -4, 4, 4, 0, 1, -5, 7, -3, -9, -9, 0, -7, -5, 9, 0, 0, 3, 3, -6, -7, 0, 4, 4, 3, -6, 3, 5, 2, -3, -7, 9, 5, -4, -7, 4, -1, -4, -3, 9, 3, -3, -10, -2, -6, 3, -1, 5, -9, 1, -7, 7, 1, 5, -1, 7, 10, -10, -3, 6, 5, -4, 7, -10, -10, -9, -8, 10, 0, -9, -7, -9, 1, 7, 2, 1, 6, 9, -4, -1, -2, 6, -3, -7, -3, -9, -6, -9, 5, -4, -8, 5, 10, -7, 10, 7, -3, -2, 0, -7, -8, 5, -7, -7, 6, 9, -2, -2, 3, -4, -6, 10, 9, -8, 1, 4, -10, -4, 4, -3, 5, -5, 9, -2, -10, -10, -6, 5, -3, -8, 10, 6, -8, -9, 9, -4, 6, -2, -8, 10, 2, -3, -6, 9, -2, 5, 6, 10, -2, 6, 4, -4, 4, -6, 10, 8, -3, -5, -7, -3, 1, -4, 8, 2, -1, -8, -8, -7, 6, 4, -3, -2, 8, 9, -3, 5, -3, 9, -1, -3, -9, 3, 9, -7, 7, -4, -10, 8, -2, 3, -2, 0, 8, -2, -3, 0, 1, -4, -6, -5, -3, -6, 5, -5, 7, 6, 5, -4, -3, -6, 8, -9, 3, -7, 1, 9, -1, -1, -9, 8, -3, 9, 0, -10, 7, -1, -6, 2, 7, 10, -10, 9, 7, -3, 4, -10, -2, -6, 6, -9, -9, -10, -4, -1, -9, -6, -5, 0, 10, 0, 2, 8, 2, 8, 2, -7, 9, -7, 0, -1, -3, -6, -6, -6, -1, 10, 6, 9, -5, 7, 7, 4, 10, 2, 10, -6, -6, -3, -10, -5, 1, 6, -5, -2, 8, 6, 0, -9, 6, -4, -5, -8, 0, 2, -2, 10, 6, -4, 2, 0, -4, -9, -7, 5, -3, 4, 3, -4, 8, 6, 1, -8, -1, 7, 4, -1, 7, 6, 7, 3, 0, -9, 2, 0, -8, -4, 4, 9, -7, 4, 0, 6, -1, 4, -7, -9, -3, -10, -7, 10, -6, 4, 3, 6, -1, 2, -4, 9, -1, -1, -10, 5, 4, -3, -3, 9, 1, 3, -10, -3, 1, -6, 1, 6, -5, 10, 6, 1, -5, 6, -9, 5, -8, 0, 9, 3, 8, 3, 8, 6, -2, -5, -3, -2, -8, 5, 0, 10, 5, -3, 7, -6, -1, 0, -7, -9, -9, -2, 2, 3, -6, -10, 6, -6, 1, 10, -5, -8, 7, -9, 7, -5, -2, 0, -2, 8, -3, -2, 2, -5, 7, 3, -10, 8, -4, 3, -8, -2, 1, -9, 10, 9, 5, -6, -7, 1, -6, 9, -6, 1, -6, -1, 1, 9, 6, -5, -4, 2, -7, 9, 0, -8, -8, -4, 9, -2, 5, 8, 8, -5, 10, 0, 6, -3, 1, 2, 9, -10, 9, -8, 0, 4, 7, -6, -5, -1, 3, 6, -2, -1, -4, 8, -2, 3, 2, 9, -4, 9, 9, -4, -8, 9, -4, 5, 4, -1, -1, 1, 4, 4, -10, 0, 10, -3, -5, -3, 6, 7, -3, 0, -8, -4, -10, 2, 9, -3, 6, -7, 6, 9, -5, 5, 10, 6, -6, 2, 6, -4, 0, 1, 0, 2, -5, 6, 8, 2, 10, 7, 5, 3, -5, 8, 8, -7, 3, -9, 0, -1, 9, 9, -1, -1, 5, -8, 8, -1, 8, 2, 5, -6, -10, -6, -4, 6, -6, -4, 6, -9, 3, 10, -3, -3, 7, 7, -10, -1, -1, 0, -6, 10, 10, 2, 6, 1, 10, -1, 10, -4, 3, 8, -5, 10, -5, 9, -3, -10, 3, -10, -7, -10, -5, 2, 3, -4, 10, 5, -3, -4, 8, 8, -10, -10, -7, -8, 5, -2, -9, -3, -8, 2, 9, -4, -3, -2, -10, -7, 10, -2, 3, 0, -10, 0, 5, 1, -3, -7, 4, -3, -5, 3, 2, 8, 4, -7, 9, -10, -6, -10, -10, -4, -6, 5, -1, 5, 3, -9, -10, 10, -1, -7, 2, -3, 10, -3, 7, 6, 6, 5, 7, -9, -2, 1, -10, -1, 10, 2, -8, 4, 5, 4, -8, -7, 4, 5, -1, -7, 4, -5, -4, 6, 8, 3, 5, 4, 3, -3, 8, 10, -1, 3, 7, -5, 6, 0, 5, 6, 8, 0, 5, -10, -6, 4, 9, 8, -9, 7, 8, -7, 3, 5, -5, -8, -8, -2, 0, 10, 2, -6, 10, 2, -6, 0, -10, 4, -2, 10, -8, -2, -3, 7, -9, -1, 2, 0, 5, -2, 1, -1, -2, 9, 9, 2, -4, -10, 10, -4, -3, 10, -8, 8, -7, -10, -1, -4, -6, -8, 2, 2, -10, -7, 2, 4, 2, 9, 8, 7, 5, -3, -7, -3, 2, -10, 8, -9, -8, 0, 3, 6, -8, -5, -2, -2, -8, -5, 1, 5, 2, -8, -6, -6, 10, -3, -7, -2, 3, -5, 5, -2, 0, -8, 1, 2, -4, 8, -4, 9, -8, -9, -5, 10, -1, 0, 4, -2, 4, 0, -1, -6, 9, 8, -1, -10, -6, -2, -9, 1, -9, -3, 9, 3, -10, -3, 4, -1, 5, -8, 0, -4, 2, -2, 8, -5, -10, 2, 0, 4, -10, 10, 10, 9, -3, -8, 2, -3, -5, -8, 4, -9, 4, -8, 8, -6, 3, 2, 9, -7, -6, 5, 6, -1, -2, 2, 9, 3, -8, -5, -5, -7, 2, -9, -6, -10, 5, -6, -5, 0, 10, -6, -2, -10, -7, -9, -10, -8, -5, 8, -1, -2, -5, -9, 10, -8, -5, 5, 9, 0, 5, -8, -5, -4, -9, -6, -8, -5, 8, -6, -10, 0, 10, 10, -1, -3, 10, -4, 9, 8, -3, -9, 10, -7, 5, -6, -1, 7, -2, 8, 6, -9, -7, 0, 6, -6, -4, 10, -6, -8, -2, -1, 2, -4, 8, -4, 10, 7, 7, 7, -9, -2, -10, 2, -7, 5, -10, -3, -7, 2, 8, 7, 3, -8, 8, 4, 4, -7, -3, -9, -1, -5, 2, 0, 6, 8, 1, -2, 9, 4, 7, -3, 7, 9, -4, 6, -8, -7, 5, 6, 6, 0, 2, -8, 3, -1, -7, 0, 9, 2, 2, -1, 8, 0, 7, 3, 8, -10, 8, 1, 1, 3, 7, 1, -5, 5, 2, -10, -5, 6, -5, 8, 3, -6, -3, -3, -5, -7, -5, 7, -3, 8, -8, 7, -7, -2, 6, 5, 3, -1, -9, 7, 9, -1, 10, 10, 0, 1, 3, 9, -2, 9, 0, 0, 9, -2, 10, 1, 4, 6, 10, 7, -7, -2, -10, 6, -2, -8, -1, 5, 7, 2, 2, -7, -4, 6, -9, 2, 8, 4, -6, 0, 9, 1, -6, -2, -5, -7, 8, -10, -7, 7, 10, 8, -6, 0, -2, 7, 7, 0, 6, 9, 2, -10, 8, -10, -1, 1, 4, -4, 4, -6, 1, -10, -1, 4, -8, -3, 1, 9, 4, -7, 0, 1, 3, 2, -1, 3, 0, -4, -7, -2, 4, 0, 10, -9, 6, -8, -7, 9, 7, 2, 0, -2, 8, -8, 1, -10, -2, 3, -3, 7, 5, -8, 1, 10, -5, 0, 9, -7, -6, -4, -1, -1, 7, 4, 6, 2, -5, -4, 4, -7, -5, 5, 8, -10, -1, -7, -7, 3, 8, -4, 9, 3, -10, -10, 1, -10, -9, -8, -1, -1, 6, 8, -1, 2, 2, 2, 7, 7, -7, 3, 4, -5, 9, -9, -1, 7, 8, 4, -5, 0, -10, -10, -6, -10, 6, -3, -7, 0, -3, 7, -6, -8, 1, -7, 7, 3, -10, 9, 6, 9, 9, -6, -2, 3, -9, 1, 10, 4, -9, 6, 10, 1, 3, -2, -7, -10, 5, -1, 10, 0, 3, 4, 0, 7, 6, -5, -6, 1, 4, -6, -1, 10, -1, 10, -8, -5, -3, -1, -2, 3, -7, 9, -9, -3, 3, 2, 3, -10, 7, 5, 8, -3, -7, -7, 10, 8, 0, 5, -9, -1, 3, 7, -1, -5, 2, 5, 0, -8, 10, -1, 0, -4, 2, 9, -4, -1, 7, -3, -6, 3, 0, 2, 1, -10, -8, -6, -1, -10, 7, -1, -10, 1, -8, 5, -7, 8, 1, 5, 2, 8, 1, -8, -1, 6, 0, -7, 6, 10, -1, -1, 8, 7, -9, 1, 8, 1, 3, 8, 6, -2, 2, 8, 10, -8, -2, -8, 10, -1, -9, -8, 2, 5, 6, 6, 6, 6, 10, 10, -3, -7, 10, -3, -9, 0, -6, 10, 3, 2, -5, 8, -1, 8, -9, 4, -3, 1, 4, -2, 10, -7, 8, 4, 2, -8, 4, -1, -4, -6, 0, 2, 2, -6, -6, -5, -9, 5, -4, -3, 2, -4, 10, -2, 5, 4, 3, 4, 10, -6, 0, -1, -10, -1, -7, -9, 3, -4, 8, -9, -7, -7, -6, -10, -8, -4, 10, -4, 9, -3, -3, 10, 6, -6, -4, -5, -5, 7, -1, -2, 0, -8, -4, -9, 10, -6, -3, 2, -8, -3, -6, -9, -4, 8, 2, -10, -5, 1, 5, -2, 0, -10, 8, 8, 1, 6, 5, 4, 3, 3, 10, -1, -9, -3, -8, -6, 8, -9, 9, 4, 7, -10, 3, -5, -3, -7, 7, 0, 8, 10, 5, -3, -6, 8, 9, -10, 6, 6, -8, -1, 0, -10, -4, 3, -5, -5, -8, -3, -4, 6, -6, 0, -6, -8, 6, -3, 8, -10, -7, 4, 8, -9, 7, 7, -2, -4, -10, 5, 0, 7, 0, -5, -3, 3, 5, 10, 5, 6, -9, 4, 2, -10, 3, -2, 3, -2, 4, 2, -4, -9, -1, -3, -1, 7, -4, 1, 7, 0, -2, 6, -2, 7, -4, -9, 0, 0, 8, -6, 5, -7, 4, -8, 9, 6, 9, 4, -4, 0, -10, -5, 1, -4, -1, 2, -8, 1, 8, -4, -10, -3, -6, -8, 7, -5, 10, 5, -9, 1, 7, -3, 3, 3, -2, 2, -3, -4, -6, 3, 7, -6, 6, 6, 10, -2, 4, -2, 10, 8, -6, -4, -3, 10, 1, 7, -5, 2, -3, 9, 5, -7, 3, 6, -7, -3, 6, 8, 8, 8, -1, -1, 1, 0, -1, -3, 4, -4, 1, -7, 10, 8, 6, 3, 3, -5, 10, 0, -4, -7, 7, -5, 10, 3, 0, -8, 4, -2, 1, 1, 3, -2, 5, -9, 3, -4, -3, -7, 9, -3, 4, -4, 0, 10, 1, 6, 4, 4, 9, -8, -4, -6, 0, 8, 5, 2, -9, -2, -4, -10, -2, 8, -3, 3, -8, 8, 8, 10, -3, 5, 2, 2, 6, 1, 1, 1, 2, -6, 1, -8, 6, -7, -7, -10, -3, -3, 0, 6, 10, -2, 7, 1, -6, 8, -5, -4, -1, 7, 9, -8, -6, 10, 8, -2, -3, 10, 10, -8, -10, 7, -1, 5, -10, -6, 5, -5, -2, -3, 9, -6, -10, -7, -5, 6, -8, 7, 2, -9, -9, 6, -6, 5, 1, 4, 4, -7, -1, 0, 1, -5, -2, 6, 7, -10, -7, -10, -6, -6, 8, 0, -3, -3, 10, -6, -2, -10, 10, 6, -2, 6, 10, 1, -5, -8, 0, 9, 10, -8, -8, 10, -5, -5, 1, -4, -3, -9, 1, 4, -3, 0, 10, -1, 7, 1, 3, -5, 0, 0, 0, -4, 5, 7, -3, -10, -4, 8, 4, 2, -2, 4, -7, -1, -10, 3, 0, 2, -1, -8, 1, -6, -7, 0, 4, 7, -2, 1, -5, -3, 8, -4, 8, 0, -7, 8, -9, -2, 6, 9, -8, 3, 5, 9, 1, -7, 10, 9, -6, 9, -1, 6, -5, -7, -1, 9, -7, 6, -8, 6, -1, -2, -9, -3, -5, 8, -6, 6, -5, 7, -10, 3, 8, -5, 10, -7, 5, -7, -4, 7, 8, 1, 4, 10, -10, 7, 5, -3, -9, -8, 2, -1, 9, -4, -3, 0, -2, -5, -10, 8, -7, -6, 0, 8, 9, 0, -8, -4, 8, -5, 4, 8, -8, -4, 4, 9, 1, -4, -1, -2, -9, -5, 7, 5, 6, 2, 2, 4, -4, 5, 9, 8, 10, 8, 5, 8, -10, 1, -9, -9, -10, 10, -2, -7, -5, -8, -5, -2, 5, -5, -7, -6, 7, 9, 1, 7, -6, 1, 0, -10, 0, 8, -8, 10, -5, 5, -1, -1, -6, 6, -7, 9, 1, -3, 1, -10, 1, -7, 4, 10, -2, 4, -5, 0, -4, 0, -7, -4, -3, 5, 8, 2, -7, -4, -4, 6, 1, -9, -8, -4, -10, 3, 4, 7, 9, 0, 9, -7, -1, 0, 7, 4, -5, 1, 2, 0, -10, -3, 3, 6, 0, 1, -3, 8, -10, -9, 9, -9, 5, -8, -1, -7, 5, -2, 6, -8, -4, -2, 10, 0, 5, -5, 6, 3, -7, -2, -7, 9, 2, 10, -3, 10, -1, 6, 2, -5, 7, 3, 9, -2, 0, -7, 0, -7, -3, 9, 2, 3, 6, -3, 2, -10, -9, 1, -4, 4, 6, -10, 10, 7, -3, 7, -10, 10, 0, 1, -3, 10, -4, -4, 4, 6, -4, -4, -7, -5, 4, -7, 4, 2, 6, -7, -7, 3, -7, 10, -6, -9, 1, 9, 4, -9, 7, -8, 2, 2, 9, 1, -10, 7, 5, -10, 4, 10, -4, 7, -4, 10, 6, -1, 8, 6, -7, 1, -4, -2, -2, 2, -2, 9, 1, -6, -5, 0, 4, -2, 8, 4, 7, -10, 2, 4, 7, -6, -4, -7, -2, 4, 5, -5, -1, 4, -8, -5, 0, 6, 3, -9, 7, -10, -7, 4, -10, -1, 6, 8, 7, 2, -5, 7, -8, 4, 4, 1, 10, 0, -7, 8, 6, 6, 6, -8, 7, 0, 2, 3, 8, 8, -3, -3, 8, 7, 3, 2, -3, 0, 10, 6, 6, -8, -3, 10, 7, -6, 8, 2, 0, 3, -3, 5, 4, -1, -4, -2, 5, -8, -6, 9, 6, -5, -6, 0, 2, -6, -3, 5, 5, 10, 9, 6, 1, -2, -5, -1, -5, 5, 4, 4, 4, 1, 10, 0, -10, -8, 1, 10, 5, 10, 9, 1, 0, -5, -9, -2, 7, 1, -9, -2, 9, -3, -10, 6, 8, 2, -7, -5, -1, -10, -6, 1, -4, 6, 6, 7, 0, -6, 2, -5, 9, -4, 4, 0, -4, 4, 1, -7, 0, 0, 4, -8, 5, -10, 7, -3, 2, 4, -2, -2, -2, -2, 10, 9, -4, -4, 0, 4, 5, -3, -5, 10, 1, 0, -1, 9, -8, -4, 1, 10, 7, 7, 0, 0, -6, 5, -6, 5, 8, 8, 10, -2, -5, 1, 10, -8, 3, -10, 0, 3, 4, 4, 1, 1, -4, 3, 8, 3, 0, -1, -8, 2, 2, 8, 10, 10, 5, 1, -3, -3, 3, -5, 7, 2, 4, 10, 2, -6, 10, 9, 7, 7, 6, 1, 6, -10, 5, 4, -4, -4, 2, -7, -7, 2, -7, -6, 9, 0, -9, -3, -6, 0, -7, 10, -3, 5, 1, 1, -8, 7, 3, 0, -3, -3, 8, 10, -9, 2, -2, 5, -9, 4, 0, -7, -5, -3, 6, 4, 4, -2, -7, 3, 9, -5, 4, 2, 7, -5, 4, 2, -9, -7, 7, 0, -7, -8, 2, -2, 4, 1, 2, -4, -7, -1, 3, 9, 0, -4, -4, -9, 4, 8, -1, 9, 10, -1, -7, -5, 9, 9, 10, 4, 7, -1, -1, 0, 6, -4, -6, -2, -2, -2, -3, 9, -6, -5, -7, 5, 9, -7, -4, 9, 5, -6, -2, 7, 4, -2, -8, -9, -10, 5, -6, -8, -8, 0, -10, 2, -6, -3, -4, -9, -4, -3, 3, 10, -4, -8, 9, -6, 3, 10, 9, -8, -3, 9, -4, -5, -9, 5, 4, 0, 6, 6, 9, 4, -7, -8, -10, -5, -5, 7, 4, 3, 4, 3, 10, 9, -1, 0, -6, -8, 2, -3, -9, -2, 3, 1, 5, 8, -5, -5, 4, -10, 1, 5, 1, 10, 5, -9, -7, -4, 10, 6, 0, 0, -1, -9, -2, -2, -7, 4, 2, 2, 10, -3, -2, 3, -4, -10, -5, -10, -4, -3, 8, -4, -2, -7, -6, 5, -10, 9, 1, 0, 0, -2, -8, 4, 5, -2, -4, 0, -9, -9, 10, -6, -5, 5, -7, 9, -2, 10, 5, -1, -4, -10, -9, -8, 10, 4, -3, 10, 2, 8, -1, 3, 10, 0, -3, 3, 5, -2, 10, -10, 0, 6, -2, 10, -2, 2, 2, 7, 7, -9, 5, 9, 2, 1, 1, -5, -3, -10, -6, -4, -7, 6, -7, -7, 4, -7, 8, 9, -10, -7, -2, 1, -8, -6, 4, 10, -8, -1, -1, 8, -3, -5, -5, -9, 6, -9, -10, 6, 10, -2, -6, -10, -4, 10, -10, 3, -3, 3, 6, 10, -9, 2, -9, -5, -7, 1, -1, -1, 3, -8, -1, 1, -3, 10, -2, 2, -1, -10, -7, 8, 7, -3, 3, -2, 9, 6, -6, 1, -7, 2, -10, 3, -3, -9, -4, 9, 1, 10, -9, -1, -1, 4, -9, -8, -8, 1, -1, 4, -4, 1, -2, -2, -10, -4, 10, 6, 5, -2, -7, -10, 7, -10, -6, -1, 0, 5, 2, -2, 4, -2, 0, -3, 2, -3, 8, -2, -6, -4, 9, -7, -2, -1, 0, -5, 8, -6, -3, -8, 9, 4, -2, 10, -1, -2, 9, -4, -1, -4, -3, -1, -8, -2, -9, 8, -8, 3, -10, 5, -1, -7, 3, 1, -10, 0, 9, 6, -10, 10, -2, -10, 1, -2, -7, -7, -9, 5, 4, 10, -10, 3, 6, 0, 7, 4, 2, 7, -9, 8, 4, 8, 4, 3, -10, -3, 7, 1, 3, 0, 3, -7, -2, 10, 0, -1, 8, 3, -1, 3, -7, -10, 2, 8, -8, -5, -2, 1, 2, -4, 2, 2, 9, 4, 10, -8, -9, 8, 10, -2, -2, -10, 6, 5, -3, 9, 0, 8, 10, 2, -4, 8, -9, -5, 1, -9, 10, -7, 3, -8, -10, 2, -10, 4, 10, 0, 6, -5, -9, 8, 0, 2, 9, 1, 3, 3, 3, 7, 4, -2, -7, 3, 10, -9, 5, -8, 0, -7, 2, 3, 9, -1, 0, -4, 6, -3, 0, -7, -4, -10, 10, 2, 0, -5, 3, -7, 4, 2, 0, 8, -1, -2, -4, -2, -2, 8, -1, 3, 5, 8, 9, 7, -7, -8, 4, 2, -7, -10, -4, -2, 7, 6, -9, 3, -5, 5, -7, 7, 10, -8, -6, 7, 2, 2, -4, 1, -10, 0, 2, 2, -10, 1, -7, -5, -1, 5, 8, -10, -6, -10, -8, 6, 2, 10, -4, -4, -1, -3, -2, 1, -4, -8, 10, 6, 8, 6, 10, -3, -8, -7, 0, -2, -7, -9, 2, 9, -6, -3, 4, 2, 4, -5, 4, 7, -6, -2, -5, 7, 0, -10, 8, -10, -10, 10, 1, -9, -9, 9, 9, -2, 0, 4, -4, -2, -5, 4, 7, 5, 9, -8, -7, 0, -1, -9, 0, -2, -3, -1, -5, 9, 3, -3, 3, 8, -8, -8, 1, 3, 5, 1, 4, 8, 0, 8, -10, -3, 6, 2, 8, -9, -5, -10, 8, -7, 1, -6, -2, -7, 2, -1, 6, 6, -9, -8, 9, -3, 9, 6, -2, 4, 1, -1, 10, -10, 3, 9, 1, 3, -3, -2, 2, -4, -8, -3, 4, -1, -4, -2, 7, -10, 4, 0, -9, -1, 3, -10, 0, -9, 4, 0, -1, -5, -8, -4, 2, 6, -10, -4, -8, 6, 5, 10, -8, 2, -1, 6, 0, 9, 9, 10, -5, 2, -7, 7, 7, 7, -2, -9, -7, -7, 4, 7, -6, 10, 9, -7, 6, -3, -5, -2, 3, 2, -6, -8, 5, -5, 0, 7, 5, 5, 6, -4, 3, -4, 3, -1, -4, 5, 8, 7, -5, 3, -9, 0, 2, 4, 3, -6, -7, -9, 0, 6, 10, -9, 9, -6, 9, 9, 10, -8, 3, 8, -10, 4, -1, 6, 0, 1, 10, 6, 1, 9, -8, 1, -2, 4, -6, -10, -10, 7, 0, -4, -5, 6, -10, 7, -5, 0, 1, 10, 4, 0, -2, -1, 9, 8, 2, 2, 1, -2, -7, 10, -7, 10, 4, -4, 10, 7, 9, 0, 3, -2, 3, -6, -5, 3, -1, -5, 0, -4, 3, 1, 7, 9, 3, -5, 8, 9, -7, -1, 5, -3, 6, 2, -9, 8, -9, -6, -5, 0, -2, 1, -5, -2, -8, -6, -7, -1, -8, 9, 3, -2, -4, -4, 0, 2, 2, 1, -10, 2, -5, -6, 3, 10, 3, 0, -5, 5, -6, 6, 2, 3, -8, 10, 0, 8, -2, 3, -4, 6, -2, -8, -9, -5, 4, -10, 9, 2, 5, 0, -9, 7, 0, -7, 10, -3, -3, -3, 10, 0, 7, -9, -5, 10, 5, 2, -9, 10, 2, -7, 5, -5, -8, 3, 9, 9, 9, 2, 2, -2, 4, 0, 8, 4, -9, 10, 0, -5, -8, -9, -3, -10, -5, 3, 2, -4, 5, 3, -1, 8, -10, 8, 3, 9, 8, -5, 1, 8, 5, 1, 10, 1, 9, 2, 8, -8, 7, 7, 10, -9, 6, -7, 0, 2, -9, -6, 1, -8, -10, -5, 3, 10, 3, -2, 3, 10, -7, 10, -2, -2, 1, 4, -2, -8, 3, 0, 5, 3, 0, 8, -5, 2, 4, 4, 1, 0, -10, -6, -2, -4, -5, 8, -5, -4, 5, -2, 3, 0, 10, 2, -9, -6, 8, 1, -4, 6, -9, -9, -4, 1, -1, 4, -9, -2, -7, 5, 8, -1, 0, -1, 3, -6, -2, 9, -7, -4, -3, -9, 6, -2, -5, -7, -1, 1, -7, -4, 2, 4, 4, 10, 8, 6, -8, 9, 1, -6, -5, -8, 7, 9, -8, -7, -7, 0, -1, -1, -4, -8, -2, 9, -10, -2, 1, -4, 8, 6, 5, -4, 5, 6, -10, -6, -6, 10, 10, -6, -6, 0, -10, 1, -4, -9, -10, -1, -9, -10, -2, 5, -4, -1, -10, 9, -9, 7, 5, 4, -9, -6, -7, 5, 5, -4, 0, 4, -2, -6, 2, 6, -3, -4, 3, 10, -3, 9, 9, 7, -4, -3, -8, -9, -10, -1, 2, -2, 6, 8, 2, 2, 0, 3, 8, 6, -7, 5, 6, 4, 9, 4, 2, 3, 4, -2, -2, 2, -7, -9, -7, 1, 10, -2, -2, 3, -9, 1, -4, 0, -1, -7, -10, 5, 9, 7, -4, -9, 2, 1, 6, -5, -2, -7, 6, 0, 8, -1, -10, 10, -7, -7, 1, -4, 4, 10, 5, 7, -2, 5, 6, 7, -1, -6, -9, -5, 3, 3, -10, -5, -10, 9, 8, -7, -10, -9, -10, 8, 9, 2, 6, 9, -8, 7, -10, -4, -9, -1, 3, -2, -6, -5, -10, 7, -2, -6, 7, -10, -9, 10, -3, -1, -10, -6, 6, 0, 0, 6, 10, -2, 1, -1, -4, -4, -8, -3, -10, -6, 5, -10, 6, 6, -6, 4, -7, 4, -9, 8, -3, 9, -6, -9, -4, -7, 0, 5, 9, -5, 7, -8, 7, -9, 9, 8, -1, -2, -5, -5, 4, -3, 2, -5, -6, 1, 3, 9, 6, -1, 0, 3, -4, -1, 2, 5, -5, -5, 9, 8, 8, 4, 2, -6, 2, 9, -7, 0, 9, -1, 0, 8, 2, 7, -3, 1, 4, 0, 10, 3, 5, -3, -1, 0, 9, -3, -8, 8, 8, 0, -3, -4, -9, 7, -7, 5, 0, -4, -9, -10, 10, 7, -1, 3, 9, -5, -9, 6, -2, -10, 1, -2, -8, -3, 0, -10, -6, 10, 0, -1, -2, -6, -8, 9, -5, -8, 4, 10, -10, -2, -6, 1, 6, -3, -3, 2, -8, -4, 0, -4, -3, -9, -3, -6, -2, -5, 5, 3, -7, -7, 9, -9, 1, -5, 2, 8, -9, 5, 6, 1, -10, 2, -6, 2, -5, 9, -8, -2, 9, -10, 9, -8, -2, 2, 7, 6, 10, 1, 0, 10, -8, 1, -9, 2, -8, -7, -3, -3, -6, 4, -2, 1, 3, -6, -6, -2, -4, 0, 2, -10, -7, 7, -5, 5, 8, 9, -2, 0, 4, 8, 2, -2, 2, 7, -10, -4, -8, -10, -8, 5, -1, 3, 1, -2, 4, 1, 10, -5, -1, 2, 1, 8, -6, -3, 6, -6, 8, 10, 10, -6, 0, -5, 3, -3, 8, 3, 5, -2, 10, 9, 0, -10, 5, 6, -9, 9, 4, 7, -3, -10, 7, -6, -10, 2, 5, 6, -3, -8, -6, 9, 2, 2, 10, 0, -7, 6, 9, 0, -5, 7, -5, 10, -6, 6, -2, 8, -1, -5, 2, -3, 4, 4, -6, -6, -8, -8, 2, -3, 5, 0, 9, -8, 8, -9, -4, 1, 6, 2, 9, 0, 1, 3, -2, -6, 6, -1, -3, 2, 1, 6, -6, 5, -3, -3, 6, 9, -6, -5, 9, 2, 2, -10, 7, -4, -6, -5, -9, 0, 6, -6, 10, -4, 6, 7, -7, -5, -9, -2, 10, 2, 4, 7, 5, 10, -2, 0, 9, -7, -2, 9, 0, 10, 6, 5, -8, 4, -8, 7, -1, 0, 7, -5, 1, 2, -7, 10, -3, 4, 3, 0, 5, -2, 1, -8, -3, -9, -10, 5, -8, -9, -3, 10, 8, 5, 1, -1, -1, 3, 10, -7, 0, 9, -2, -4, -7, -6, -2, 1, 5, 8, 4, 10, 10, 2, 1, -4, -4, 6, 9, 3, 5, 8, -6, -4, -6, -1, -7, -5, 2, -6, 4, -8, 3, -6, -1, -10, 1, -5, 3, 10, 4, 1, 2, -7, -7, -2, 7, 1, 9, 7, -7, 8, 5, 2, 9, -4, 4, -3, -7, -1, 5, -3, -7, 10, -4, 4, 5, -5, -8, -1, -8, -2, 9, 5, 7, -2, 10, -7, -8, 5, -3, 10, 6, 4, 3, -8, -6, -3, 1, -2, 7, 10, 2, -7, -4, 7, -4, -7, -7, 8, -8, 8, -6, 5, 5, 7, 6, -5, 10, 2, 8, 8, 8, 5, 4, -8, 6, -6, 3, 1, -7, 8, 0, 9, 2, -7, 0, -1, -5, -8, -10, 6, -8, -1, 10, -7, -6, -10, -7, -6, 10, 9, -9, -10, 9, -2, 4, -3, -5, -5, -6, -5, -9, 0, 4, -3, 3, 6, 3, -2, 8, -1, -7, 5, 10, 1, -2, 10, -2, -2, 2, -3, -8, -10, 7, -2, 3, 9, -4, 5, -4, -7, -2, -8, 2, 1, 10, -10, 8, -5, 7, 3, 4, 3, -1, 2, -9, 0, -6, 3, -3, -10, 4, 9, 3, -6, 8, 4, -2, -3, -4, 10, -4, -7, 2, -9, 0, 9, 8, 8, -4, -5, 1, -10, 8, 10, 3, -5, 10, -5, 1, -9, 0, -9, 6, 6, 2, 2, -1, 2, -3, -7, -7, 3, 8, -6, -2, 4, -6, -7, 5, -3, 2, 9, -8, -7, 0, 7, -9, -4, 2, -3, -6, 0, -4, 9, -8, -2, 6, -10, -9, -5, -6, -8, 0, 3, -10, -6, 6, -10, -2, 3, -7, 10, 2, -1, 6, 3, 6, 9, -10, 8, 3, 10, 9, 2, -8, -4, 10, 2, 0, 5, 6, -3, 8, -3, 4, 4, -3, -3, -2, -2, -5, 10, -7, 0, -2, 0, -2, -9, -6, 10, -9, -6, -1, -4, 9, -3, -9, -9, -8, 7, -5, 3, -7, 1, 6, 3, -9, -7, 4, 10, -5, -9, 0, 10, -2, 0, 1, 7, 0, -5, -8, 10, 4, 7, 9, 10, -10, 1, 2, 1, 1, 6, 3, 5, -1, 10, 2, -3, 2, -2, 4, -9, -2, 7, -1, 9, -6, 0, 5, -3, -9, 4, 9, 7, -4, 1, 3, 4, 8, 0, -7, -8, 0, 6, -7, 10, 2, 10, 5, 5, 3, 5, -9, 3, 1, 5, -7, -10, -3, 4, 7, 1, 0, -3, -1, 10, 0, -9, 10, 0, 9, 0, 6, -2, -10, -3, 8, 1, 4, 0, 5, 8, -10, 6, 8, -9, -6, 6, -8, -2, 9, 1, -8, 4, 2, -1, -7, -9, -9, 9, 10, -6, 10, 8, 9, -9, 9, 6, 8, 5, 6, -6, -2, -2, 6, -9, -10, -4, 1, -10, -2, -10, 4, -9, 5, 5, 8, -9, -1, -5, 5, 1, -8, 6, -10, 0, 0, 9, -8, -3, 7, 2, 8, -7, 0, 6, -1, -10, 0, 4, -3, -6, -1, -3, -2, 4, -7, -10, -9, -6, 4, -6, 10, 9, 4, 3, -1, 0, -8, -10, 8, -9, -7, -5, -3, 10, -9, -10, 9, -3, 2, -4, 9, -2, 7, 10, -7, -9, 2, -4, 6, -6, 2, 4, 9, 4, 3, -8, 10, -8, 10, 1])))
 
+    def test_nested_unhashable_many_times(self):
+        self.assertListEqual([{'a': [1]}, {'a': [2]}], unique([{'a': [1]}, {'a': [2]}, {'a': [1]}]))
+        self.assertListEqual([{1, 2}, [1, [2]]], unique([{1, 2}, [1, [2]], {2, 1}, [1, [2]]]))
+        self.assertListEqual([(1, [2]), [1, [2]]], unique([(1, [2]), [1, [2]], (1, [2])]))
+
+    def test_equal_across_types(self):
+        # same equality as ``==``: 1 == 1.0 and {1} == frozenset({1})
+        self.assertListEqual([1, 'a'], unique([1, 1.0, 'a', True]))
+        self.assertListEqual([{1}], unique([{1}, frozenset({1})]))
+        self.assertListEqual([bytearray(b'x')], unique([bytearray(b'x'), b'x']))
+        self.assertListEqual([[1], (1,)], unique([[1], (1,), [1.0]]))
+
+    def test_unhashable_with_custom_eq(self):
+        one = _One()
+        self.assertListEqual([one, 2], unique([one, 1, 2, 1.0]))
+        self.assertListEqual([1, 2], unique([1, 2, one]))
+
+    def test_huge_list_is_linear(self):
+        lst = [[i % 1000, str(i % 1000)] for i in range(200000)]
+        expected = [[i, str(i)] for i in range(1000)]
+        self.assertListEqual(expected, unique(lst))
+        self.assertListEqual(list(range(100000)), unique(list(range(100000)) * 2))
+
     @unittest.skip("Shouldn't use these kinds of lists anyway")
     def test_self_reference(self):
         """Test if self reference doesn't break the function"""
@@ -80,3 +114,137 @@ class ListUtilTest(unittest.TestCase):
     @unittest.skip("Shouldn't be used anyway")
     def test_self_reference_many_times(self):
         pass
+
+
+class IterUniqueTest(unittest.TestCase):
+    """Tests of the iter_unique generator"""
+
+    def test_same_as_unique(self):
+        lst = [3, [1], 'a', 3.0, {'b': 2}, [1], 'a', {'b': 2}, None, None]
+        self.assertListEqual(unique(lst), list(iter_unique(lst)))
+        self.assertListEqual(unique(lst), list(iter_unique(iter(lst))))
+
+    def test_file(self):
+        f = io.StringIO("b\na\nb\nc\na\n")
+        self.assertListEqual(["b\n", "a\n", "c\n"], list(iter_unique(f)))
+
+    def test_is_lazy(self):
+        numbers = iter_unique(i // 3 for i in itertools.count())
+        self.assertListEqual([0, 1, 2, 3], list(itertools.islice(numbers, 4)))
+
+    def test_key(self):
+        self.assertListEqual(['a', 'B'], list(iter_unique(['a', 'B', 'A', 'b'], key=str.lower)))
+        records = [{'id': 1, 'v': 'x'}, {'id': 2, 'v': 'y'}, {'id': 1, 'v': 'z'}]
+        self.assertListEqual(records[:2], list(iter_unique(records, key=lambda r: r['id'])))
+
+    def test_window(self):
+        self.assertListEqual([1, 2, 1, 3, 1], list(iter_unique([1, 2, 1, 3, 1], window=1)))
+        self.assertListEqual([1, 2, 3], list(iter_unique([1, 2, 1, 3, 1], window=2)))
+        self.assertListEqual([[1], [2], [1]], list(iter_unique([[1], [2], [2], [1]], window=1)))
+        with self.assertRaises(ValueError):
+            iter_unique([], window=0)
+
+    def test_bloom_filter(self):
+        lst = list(range(10000)) * 2
+        out = list(iter_unique(lst, error_rate=0.001, capacity=10000))
+        # duplicates are never let through, few distinct items are dropped
+        self.assertListEqual(sorted(set(out)), out)
+        self.assertGreater(len(out), 9900)
+        self.assertListEqual([[1], [2]], list(iter_unique([[1], [2], [1]], error_rate=0.01)))
+        with self.assertRaises(ValueError):
+            iter_unique([], error_rate=1.5)
+        with self.assertRaises(ValueError):
+            iter_unique([], window=10, error_rate=0.01)
+
+
+class IndexTest(unittest.TestCase):
+    """Tests of unique_by, unique_counts and duplicate_positions"""
+
+    def test_unique_by(self):
+        self.assertListEqual(['a', 'B', 'c'], unique_by(['a', 'B', 'b', 'A', 'c'], str.lower))
+        records = [{'id': [1], 'v': 'x'}, {'id': [2], 'v': 'y'}, {'id': [1], 'v': 'z'}]
+        self.assertListEqual(records[:2], unique_by(records, lambda r: r['id']))
+        self.assertListEqual([], unique_by([], str))
+        with self.assertRaises(TypeError):
+            unique_by('abc', str)
+
+    def test_unique_counts(self):
+        self.assertListEqual([('b', 3), ('a', 1)], unique_counts(['b', 'a', 'b', 'b']))
+        self.assertListEqual([(1, 3), ([1], 2), ({'a': 1}, 1)], unique_counts([1, [1], 1.0, True, [1], {'a': 1}]))
+        self.assertListEqual([('a', 2), ('B', 1)], unique_counts(['a', 'B', 'A'], key=str.lower))
+        self.assertListEqual([], unique_counts([]))
+        lst = [i % 1000 for i in range(100000)]
+        self.assertListEqual([(i, 100) for i in range(1000)], unique_counts(lst))
+        with self.assertRaises(TypeError):
+            unique_counts(None)
+
+    def test_duplicate_positions(self):
+        self.assertListEqual([[0, 2, 5], [1, 4]], duplicate_positions(['b', 'a', 'b', 'c', 'a', 'b']))
+        self.assertListEqual([[0, 2]], duplicate_positions([{1}, [1], frozenset({1})]))
+        self.assertListEqual([], duplicate_positions([1, 2, 3]))
+        self.assertListEqual([[0, 1]], duplicate_positions(['x', 'X'], key=str.lower))
+
+    def test_unhashable_with_custom_eq(self):
+        one, other_one = _One(), _One()
+        self.assertListEqual([(one, 3), (2, 1)], unique_counts([one, 1, 2, 1.0]))
+        self.assertListEqual([(1, 3), (2, 1)], unique_counts([1, 2, one, other_one]))
+        self.assertListEqual([[0, 1, 3]], duplicate_positions([one, 1, 2, 1.0]))
+        self.assertEqual(unique([one, 1, 2, 1.0]), [elem for elem, _ in unique_counts([one, 1, 2, 1.0])])
+        # the same index for all three, on every tier
+        mixed = [[1], 2, one, (1,), {'a': [1]}, 1, [1.0], 2.0, {'a': [True]}, other_one, bytearray(b'x'), b'x']
+        self.assertEqual(unique(mixed), [elem for elem, _ in unique_counts(mixed)])
+        self.assertEqual([[0, 6], [1, 7], [2, 5, 9], [4, 8], [10, 11]], duplicate_positions(mixed))
+
+
+class DeduplicatorTest(unittest.TestCase):
+    """Tests of the incremental Deduplicator"""
+
+    def test_batches_same_as_unique(self):
+        batches = [[3, [1], 'a'], [], [3.0, {'b': 2}, [1]], ['a', {'b': 2}, None, None, {1}, frozenset({1})]]
+        dedup = Deduplicator()
+        for batch in batches:
+            dedup.extend(iter(batch))
+        self.assertListEqual(unique(list(itertools.chain(*batches))), dedup.result())
+        self.assertEqual(6, len(dedup))
+
+    def test_add_and_contains(self):
+        dedup = Deduplicator([1, 2])
+        self.assertTrue(dedup.add([3]))
+        self.assertFalse(dedup.add(2.0))
+        self.assertIn([3], dedup)
+        self.assertIn(True, dedup)
+        self.assertNotIn([2], dedup)
+        self.assertNotIn('1', dedup)
+        self.assertListEqual([1, 2, [3]], dedup.result())
+        # result is a copy
+        dedup.result().append(4)
+        self.assertNotIn(4, dedup)
+
+    def test_key(self):
+        dedup = Deduplicator(key=str.lower)
+        self.assertListEqual(['a', 'B'], dedup.extend(['a', 'B', 'A']))
+        self.assertIn('b', dedup)
+        self.assertFalse(dedup.add('b'))
+
+    def test_unhashable_with_custom_eq(self):
+        dedup = Deduplicator([2])
+        self.assertNotIn(_One(), dedup)
+        self.assertTrue(dedup.add(_One()))
+        self.assertIn(1, dedup)
+        self.assertFalse(dedup.add(1.0))
+
+    def test_pickle(self):
+        dedup = Deduplicator([1, [2], {'a': {3}}, 'x'], key=None)
+        restored = pickle.loads(pickle.dumps(dedup))
+        self.assertListEqual(dedup.result(), restored.result())
+        self.assertIn([2], restored)
+        self.assertListEqual(['y'], restored.extend(['x', [2], {'a': {3}}, 'y']))
+        restored = pickle.loads(pickle.dumps(Deduplicator(['a', 'B'], key=str.lower)))
+        self.assertFalse(restored.add('b'))
+
+    def test_many_batches_is_linear(self):
+        dedup = Deduplicator()
+        for batch in range(2000):
+            dedup.extend([[i % 5000] for i in range(batch * 100, batch * 100 + 100)])
+            self.assertIn([batch % 5000], dedup)
+        self.assertListEqual([[i] for i in range(5000)], dedup.result())
@@ -0,0 +1,176 @@
+"""Exact linear algebra on matrices of Fractions.
+
+A matrix is a sequence of rows, each a sequence of Fractions, ints or
+floats (a `FractionArray` row works too).  Every row is first scaled to
+integers by the least common multiple of its denominators, then reduced
+by fraction-free (Bareiss) elimination: each step divides exactly by the
+previous pivot, so the integers stay as small as the minors of the
+matrix and no gcd is needed until the results are turned back into
+Fractions at the end.
+
+Examples:
+    >>> det([[Fraction(1, 2), 1], [3, 4]])
+    -1
+    >>> solve([[2, 1], [1, 3]], [3, Fraction(7, 2)])
+    [11/10, 4/5]
+    >>> inverse([[2, 0], [0, Fraction(1, 3)]])
+    [[1/2, 0], [0, 3]]
+    >>> rank([[1, 2, 3], [2, 4, 6], [1, 0, 1]])
+    2
+"""
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple, Union
+import math
+
+import fraction
+from fraction import Fraction, _product, to_proper
+
+try:
+    from fractionarray import FractionArray
+except ImportError:
+    FractionArray = None
+
+Matrix = Sequence[Sequence[Union[int, float, Fraction]]]
+
+
+def _integer_rows(matrix: Matrix) -> Tuple[List[List[int]], List[int]]:
+    """Return the rows of `matrix` as lists of ints, each multiplied by the
+       least common multiple of its denominators, and those multipliers.
+
+    Raises:
+        TypeError: if an entry is not an int, float or Fraction
+        ValueError: if an entry is inf or nan, or the rows have different lengths
+    """
+    rows, scales = [], []
+    for row in matrix:
+        terms = []
+        for value in row:
+            if isinstance(value, Fraction):
+                numerator, denominator = value.numerator, value.denominator
+            elif isinstance(value, int):
+                numerator, denominator = value, 1
+            elif isinstance(value, float):
+                numerator, denominator = fraction._float_ratio(value)
+            else:
+                raise TypeError(f"matrix entries must be 'int', 'float' or 'Fraction', "
+                                f"not '{type(value).__name__}'")
+            if denominator == 0:
+                raise ValueError("matrix entries must be finite")
+            terms.append((numerator, denominator))
+        scale = 1
+        for _, denominator in terms:
+            scale = scale // math.gcd(scale, denominator) * denominator
+        rows.append([numerator * (scale // denominator) for numerator, denominator in terms])
+        scales.append(scale)
+        if len(rows[-1]) != len(rows[0]):
+            raise ValueError("all rows must have the same length")
+    return rows, scales
+
+
+def _eliminate(rows: List[List[int]], columns: int) -> Tuple[int, int]:
+    """Reduce the int matrix `rows` in place to echelon form by fraction-free
+       elimination on its first `columns` columns.  The last pivot of a
+       square matrix of full rank is then its determinant, up to the sign.
+
+    Returns:
+        tuple: the rank of those columns, and the sign of the row permutation
+    """
+    previous, sign, rank = 1, 1, 0
+    for column in range(columns):
+        pivot_index = next((i for i in range(rank, len(rows)) if rows[i][column]), None)
+        if pivot_index is None:
+            continue
+        if pivot_index != rank:
+            rows[rank], rows[pivot_index] = rows[pivot_index], rows[rank]
+            sign = -sign
+        pivot_row = rows[rank]
+        pivot, rest = pivot_row[column], pivot_row[column + 1:]
+        for i in range(rank + 1, len(rows)):
+            row = rows[i]
+            factor = row[column]
+            # exact division, by Sylvester's identity; the columns up to
+            # this one are all zero below the pivot
+            row[column + 1:] = [(pivot * x - factor * y) // previous for x, y in zip(row[column + 1:], rest)]
+            row[column] = 0
+        previous = pivot
+        rank += 1
+    return rank, sign
+
+
+def _square(matrix: Matrix) -> Tuple[List[List[int]], List[int]]:
+    rows, scales = _integer_rows(matrix)
+    if any(len(row) != len(rows) for row in rows):
+        raise ValueError("matrix must be square")
+    return rows, scales
+
+
+def det(matrix: Matrix) -> Fraction:
+    """Return the determinant of the square `matrix`."""
+    rows, scales = _square(matrix)
+    if not rows:
+        return Fraction(1)
+    rank, sign = _eliminate(rows, len(rows))
+    if rank < len(rows):
+        return Fraction(0)
+    return Fraction._from_proper(*to_proper(sign * rows[-1][-1], _product(scales)))
+
+
+def rank(matrix: Matrix) -> int:
+    """Return the rank of `matrix`, which need not be square."""
+    rows, _ = _integer_rows(matrix)
+    return _eliminate(rows, len(rows[0]))[0] if rows else 0
+
+
+def _solve_augmented(matrix: Matrix, right: List[List[Union[int, float, Fraction]]]) -> List[List[Fraction]]:
+    """Return X with ``matrix @ X == right``, `right` given by rows."""
+    if len(right) != len(matrix):
+        raise ValueError("the right-hand side must have one row per matrix row")
+    n = len(matrix)
+    if n == 0:
+        return []
+    rows, _ = _integer_rows([list(row) + list(extra) for row, extra in zip(matrix, right)])
+    if any(len(row) - len(right[0]) != n for row in rows):
+        raise ValueError("matrix must be square")
+    if _eliminate(rows, n)[0] < n:
+        raise ValueError("matrix is singular")
+    # back substitution of y = d*x, which are ints for the determinant d
+    # of the echelon form, by Cramer's rule
+    d = rows[-1][n - 1]
+    solution = []
+    for k in range(n, len(rows[0])):
+        y = [0] * n
+        for i in range(n - 1, -1, -1):
+            row = rows[i]
+            y[i] = (d * row[k] - sum(row[j] * y[j] for j in range(i + 1, n))) // row[i]
+        solution.append([Fraction._from_proper(*to_proper(yi, d)) for yi in y])
+    return [list(row) for row in zip(*solution)]
+
+
+def solve(matrix: Matrix, b: Sequence[Union[int, float, Fraction]]) -> Union[List[Fraction], FractionArray]:
+    """Return the solution x of ``matrix @ x == b`` for a square, non-singular `matrix`.
+       If `b` is a `FractionArray`, so is the solution.
+
+    Raises:
+        ValueError: if `matrix` is singular or not square, or `b` has the wrong length
+    """
+    solution = [row[0] for row in _solve_augmented(matrix, [[value] for value in b])]
+    if FractionArray is not None and isinstance(b, FractionArray):
+        return FractionArray.from_terms([x.numerator for x in solution], [x.denominator for x in solution])
+    return solution
+
+
+def inverse(matrix: Matrix) -> List[List[Fraction]]:
+    """Return the inverse of the square, non-singular `matrix`.
+
+    Raises:
+        ValueError: if `matrix` is singular or not square
+    """
+    n = len(matrix)
+    return _solve_augmented(matrix, [[int(i == j) for j in range(n)] for i in range(n)])
+
+
+if __name__ == '__main__':
+    """Run the doctests in all methods."""
+    import doctest
+    doctest.testmod(verbose=True)
@@ -0,0 +1,105 @@
+import math
+import random
+import unittest
+
+from fraction import Fraction, fdot
+from fraction_test import FractionAssertions
+from matrix import det, inverse, rank, solve
+
+try:
+    import numpy
+    from fractionarray import FractionArray
+except ImportError:
+    numpy = None
+
+
+def naive_det(matrix):
+    """Determinant by Gaussian elimination on Fractions, normalizing every step."""
+    rows = [[Fraction(0) + x for x in row] for row in matrix]
+    result = Fraction(1)
+    for k in range(len(rows)):
+        pivot = next((i for i in range(k, len(rows)) if rows[i][k] != 0), None)
+        if pivot is None:
+            return Fraction(0)
+        if pivot != k:
+            rows[k], rows[pivot] = rows[pivot], rows[k]
+            result = -result
+        result = result * rows[k][k]
+        for i in range(k + 1, len(rows)):
+            factor = rows[i][k] / rows[k][k]
+            rows[i] = [x - factor * y for x, y in zip(rows[i], rows[k])]
+    return result
+
+
+class MatrixTest(FractionAssertions, unittest.TestCase):
+    """Test the fraction-free elimination against plain Fraction arithmetic."""
+
+    def random_matrix(self, n, m=None, seed=0):
+        rng = random.Random(seed)
+        return [[Fraction(rng.randint(-20, 20), rng.randint(1, 12)) for _ in range(m or n)] for _ in range(n)]
+
+    def test_det(self):
+        for n in range(1, 9):
+            matrix = self.random_matrix(n, seed=n)
+            self.assertSameFractions([naive_det(matrix)], [det(matrix)])
+        self.assertEqual(Fraction(-2), det([[1, 2], [3, 4]]))
+        self.assertEqual(Fraction(1, 8), det([[0.5, 0], [0, 0.25]]))
+        self.assertEqual(Fraction(0), det([[1, 2], [2, 4]]))
+        self.assertEqual(Fraction(-1), det([[0, 1], [1, 0]]))
+        self.assertEqual(Fraction(1), det([]))
+
+    def test_solve(self):
+        for n in (1, 2, 5, 12):
+            matrix = self.random_matrix(n, seed=n)
+            expected = self.random_matrix(1, n, seed=-n)[0]
+            b = [fdot(row, expected) for row in matrix]
+            self.assertSameFractions(expected, solve(matrix, b))
+        self.assertSameFractions([Fraction(1), Fraction(2)], solve([[0, 1], [1, 0]], [2, 1]))
+
+    def test_inverse(self):
+        for n in (1, 3, 7):
+            matrix = self.random_matrix(n, seed=n)
+            inv = inverse(matrix)
+            for i in range(n):
+                self.assertSameFractions([Fraction(int(i == j)) for j in range(n)],
+                                         [fdot(matrix[i], [row[j] for row in inv]) for j in range(n)])
+        self.assertEqual([], inverse([]))
+
+    def test_rank(self):
+        self.assertEqual(0, rank([[0, 0], [0, 0]]))
+        self.assertEqual(0, rank([]))
+        self.assertEqual(1, rank([[1, 2, 3]]))
+        self.assertEqual(2, rank([[1, 2, 3], [2, 4, 6], [1, 0, 1]]))
+        self.assertEqual(2, rank([[0, 1, 2], [0, 2, 4], [0, 0, 1], [0, 1, 3]]))
+        # product of 6x3 and 3x5 matrices has rank 3
+        a, b = self.random_matrix(6, 3, seed=1), self.random_matrix(3, 5, seed=2)
+        product = [[fdot(row, [r[j] for r in b]) for j in range(5)] for row in a]
+        self.assertEqual(3, rank(product))
+        self.assertEqual(5, rank(self.random_matrix(5, 8, seed=3)))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            solve([[1, 2], [2, 4]], [1, 2])
+        with self.assertRaises(ValueError):
+            inverse([[1, 2], [2, 4]])
+        with self.assertRaises(ValueError):
+            det([[1, 2, 3], [4, 5, 6]])
+        with self.assertRaises(ValueError):
+            solve([[1, 2], [3, 4]], [1])
+        with self.assertRaises(ValueError):
+            det([[1, math.inf], [0, 1]])
+        with self.assertRaises(ValueError):
+            rank([[1, 2], [3]])
+        with self.assertRaises(TypeError):
+            det([['1']])
+
+    @unittest.skipIf(numpy is None, "FractionArray needs numpy")
+    def test_fraction_array(self):
+        matrix = [FractionArray([2, 1]), FractionArray([1, 3])]
+        solution = solve(matrix, FractionArray([3, Fraction(7, 2)]))
+        self.assertIsInstance(solution, FractionArray)
+        self.assertSameFractions([Fraction(11, 10), Fraction(4, 5)], solution)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
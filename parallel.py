@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+import multiprocessing
+import os
+
+from fraction import Fraction, _sum_terms, _terms, _terms_of_sum
+from listutil import _check_list, _key_of, unique
+
+# inputs smaller than this many chunks are reduced in this process
+MIN_CHUNKS = 2
+# lists shorter than this are deduplicated in this process by parallel_unique
+MIN_UNIQUE_SIZE = 200000
+
+# the list deduplicated by parallel_unique, inherited by its forked workers
+_shared_list: Optional[list] = None
+
+
+def _chunks(values: Iterable, chunksize: int) -> Iterator[list]:
+    """Yield consecutive lists of `chunksize` values."""
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _split_terms(chunk: list) -> Tuple[List[int], List[int]]:
+    """Return the numerators and denominators of `chunk`, which pickle
+       more compactly than the Fractions themselves.
+    """
+    numerators, denominators = [], []
+    for value in chunk:
+        numerator, denominator = _terms(value, '+')
+        numerators.append(numerator)
+        denominators.append(denominator)
+    return numerators, denominators
+
+
+def _map_chunk(func: Callable, chunk: list) -> list:
+    """Return `func` applied to every value of one chunk, run in a worker."""
+    return [func(value) for value in chunk]
+
+
+def parallel_sum(values: Iterable[Union[int, float, Fraction]], processes: Optional[int] = None,
+                 chunksize: int = 10000) -> Fraction:
+    """Return the exact sum of `values`, reduced in chunks by a pool of `processes` workers.
+
+    Each chunk is summed exactly in a worker and the partial sums are added
+    in chunk order, so the result is identical to `fraction.fsum`.  Inputs
+    of fewer than two chunks are summed in this process.  Chunks are read
+    from `values` as they are sent to the workers, so summing starts before
+    the whole input is read.
+
+    Args:
+        values: Fractions, ints and floats
+        processes (int): number of worker processes, default the number of CPUs
+        chunksize (int): number of values sent to a worker at a time
+
+    Examples:
+        >>> parallel_sum([Fraction(1, 3)] * 30000, chunksize=7000)
+        10000
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive")
+    chunks = map(_split_terms, _chunks(values, chunksize))
+    # only the first chunks are needed to decide whether to use workers
+    first = list(islice(chunks, MIN_CHUNKS))
+    if len(first) < MIN_CHUNKS or processes == 1:
+        return _sum_terms(pair for terms in chain(first, chunks) for pair in zip(*terms))
+    with ProcessPoolExecutor(processes) as pool:
+        partial_sums = list(pool.map(_terms_of_sum, chain(first, chunks)))
+    return _sum_terms(partial_sums)
+
+
+def parallel_map(func: Callable, values: Iterable, processes: Optional[int] = None,
+                 chunksize: int = 10000) -> list:
+    """Return ``[func(value) for value in values]``, computed in chunks by a pool of
+       `processes` workers.  `func` must be picklable, e.g. a module-level function.
+
+    Examples:
+        >>> parallel_map(float, [Fraction(-1, 2), 3], processes=1)
+        [-0.5, 3.0]
+    """
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive")
+    chunks = list(_chunks(values, chunksize))
+    if len(chunks) < MIN_CHUNKS or processes == 1:
+        return [func(value) for chunk in chunks for value in chunk]
+    with ProcessPoolExecutor(processes) as pool:
+        return [result for results in pool.map(_map_chunk, [func] * len(chunks), chunks) for result in results]
+
+
+def _shard_positions(start: int, stop: int, shards: int) -> Optional[List[List[int]]]:
+    """Return the positions of the first occurrences in one slice of the shared
+       list, split into `shards` lists by the hash of their keys, run in a
+       worker.  Return None if an element has no hashable key.
+    """
+    lst = _shared_list
+    seen = set()
+    positions = [[] for _ in range(shards)]
+    for i in range(start, stop):
+        try:
+            k = _key_of(lst[i])
+        except TypeError:
+            return None
+        if k not in seen:
+            seen.add(k)
+            positions[hash(k) % shards].append(i)
+    return positions
+
+
+def _unique_positions(positions: List[int]) -> List[int]:
+    """Return the positions of the first occurrences among `positions`
+       (increasing) of the shared list, run in a worker.
+    """
+    lst = _shared_list
+    seen = set()
+    first = []
+    for i in positions:
+        k = _key_of(lst[i])
+        if k not in seen:
+            seen.add(k)
+            first.append(i)
+    return first
+
+
+def parallel_unique(lst: list, processes: Optional[int] = None, chunksize: int = 100000) -> list:
+    """Return the same list as `listutil.unique`, computed by a pool of `processes` workers.
+
+    Each worker first finds the first occurrences in one slice of `lst`
+    and splits them into shards by hash.  Then each shard is deduplicated
+    in a worker, and the first occurrences of all shards are put back in
+    their order in `lst`.  Only positions are sent between processes: the
+    workers are forked and read `lst` directly.
+
+    `lst` is deduplicated in this process instead if it is shorter than
+    `MIN_UNIQUE_SIZE`, if `processes` is 1, if the platform can't fork,
+    or if some element has no hashable key, like an object with a custom
+    __eq__ and no hash.
+
+    Args:
+        lst (list): a list of elements (not modified)
+        processes (int): number of worker processes, default the number of CPUs
+        chunksize (int): number of elements in each slice
+
+    Examples:
+        >>> parallel_unique([3, 1, 3, 2, 1], processes=1)
+        [3, 1, 2]
+    """
+    global _shared_list
+    _check_list(lst)
+    if chunksize <= 0:
+        raise ValueError("chunksize must be positive")
+    if len(lst) < MIN_UNIQUE_SIZE or processes == 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        return unique(lst)
+    shards = processes or os.cpu_count() or 1
+    starts = range(0, len(lst), chunksize)
+    # the hashes of str and bytes keys are only the same in every worker if
+    # they are forked from this process
+    _shared_list = lst
+    try:
+        with ProcessPoolExecutor(shards, mp_context=multiprocessing.get_context('fork')) as pool:
+            chunks = list(pool.map(_shard_positions, starts, [min(start + chunksize, len(lst)) for start in starts],
+                                   [shards] * len(starts)))
+            if None in chunks:
+                return unique(lst)
+            # positions stay increasing, since the chunks are in order
+            first = pool.map(_unique_positions, [list(chain.from_iterable(chunk[shard] for chunk in chunks))
+                                                 for shard in range(shards)])
+            return [lst[i] for i in sorted(chain.from_iterable(first))]
+    finally:
+        _shared_list = None
+
+
+if __name__ == '__main__':
+    """Run the doctests in all methods."""
+    import doctest
+    doctest.testmod(verbose=True)
@@ -0,0 +1,77 @@
+import math
+import random
+import unittest
+
+import parallel
+from fraction import Fraction, fsum
+from fraction_test import FractionAssertions
+from listutil import unique
+from listutil_test import _One
+from parallel import parallel_map, parallel_sum, parallel_unique
+
+
+class ParallelTest(FractionAssertions, unittest.TestCase):
+    """Test that the process pool reductions match the serial ones."""
+
+    def setUp(self):
+        rng = random.Random(9)
+        self.values = [Fraction(rng.randint(-10**12, 10**12), rng.randint(1, 10**6)) for _ in range(3000)]
+
+    def test_parallel_sum(self):
+        self.assertSameFraction(fsum(self.values), parallel_sum(self.values, processes=2, chunksize=500))
+        self.assertSameFraction(fsum(self.values), parallel_sum(iter(self.values), processes=1, chunksize=500))
+        self.assertSameFraction(fsum(self.values), parallel_sum(self.values))
+        # chunks of a generator are read as they are sent to the workers
+        self.assertSameFraction(fsum(self.values), parallel_sum((v for v in self.values), processes=2, chunksize=700))
+        self.assertSameFraction(fsum(self.values), parallel_sum(iter(self.values), processes=2, chunksize=3000))
+
+    def test_parallel_sum_special(self):
+        values = self.values + [3, 0.25, math.inf]
+        self.assertSameFraction(Fraction(1, 0), parallel_sum(values, processes=2, chunksize=1000))
+        values = [Fraction(-1, 0)] + values
+        self.assertTrue(parallel_sum(values, processes=2, chunksize=1000).isnan())
+        self.assertSameFraction(Fraction(0), parallel_sum([]))
+        with self.assertRaises(ValueError):
+            parallel_sum(self.values, chunksize=0)
+        with self.assertRaises(TypeError):
+            parallel_sum(['a'])
+
+    def test_parallel_map(self):
+        self.assertListEqual([float(x) for x in self.values],
+                             parallel_map(float, self.values, processes=2, chunksize=700))
+        self.assertListEqual([], parallel_map(float, []))
+
+
+class ParallelUniqueTest(unittest.TestCase):
+    """Test that parallel_unique gives the same list as unique."""
+
+    def setUp(self):
+        # small lists are deduplicated in the workers too
+        self.min_size, parallel.MIN_UNIQUE_SIZE = parallel.MIN_UNIQUE_SIZE, 0
+
+    def tearDown(self):
+        parallel.MIN_UNIQUE_SIZE = self.min_size
+
+    def test_same_as_unique(self):
+        rng = random.Random(19)
+        lst = [rng.randrange(500) for _ in range(5000)]
+        lst += [str(i % 300) for i in range(3000)] + [[i % 50, 'x'] for i in range(1000)]
+        lst += [1.0, True, {1}, frozenset({1}), {'a': [1]}, {'a': [1]}, None]
+        rng.shuffle(lst)
+        self.assertListEqual(unique(lst), parallel_unique(lst, processes=3, chunksize=777))
+        self.assertListEqual(unique(lst), parallel_unique(lst, processes=1))
+        self.assertListEqual([], parallel_unique([], processes=2))
+
+    def test_unhashable_with_custom_eq(self):
+        lst = [2, 1, _One(), 3] * 100
+        self.assertListEqual(unique(lst), parallel_unique(lst, processes=2, chunksize=50))
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            parallel_unique('abc')
+        with self.assertRaises(ValueError):
+            parallel_unique([1], chunksize=0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)